@@ -0,0 +1,77 @@
+"""Compare per-request and batched pyfunc predictions of a statsforecast model.
+
+A ``StatsForecast`` model with a simple exponential smoothing ``AutoETS`` (whose
+model is fixed to keep the fit fast) and ``Naive`` is fitted on ``--n-series``
+synthetic daily series and loaded as a pyfunc model. ``--n-requests`` configuration
+rows with random horizons and levels are then predicted one row per call, as
+concurrent API requests would be without batching, and as a single multi-row
+configuration, which runs one ``StatsForecast.predict`` at the maximum horizon.
+
+Usage::
+
+    python benchmarks/batched_predict.py [--n-series 1000] [--n-requests 32]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+LEVELS = [[80], [90], [95], [80, 95], None]
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-series", type=int, default=1000)
+    parser.add_argument("--n-requests", type=int, default=32)
+    parser.add_argument("--max-h", type=int, default=28)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from statsforecast import StatsForecast
+    from statsforecast.models import AutoETS, Naive
+    from statsforecast.utils import generate_series
+
+    import mlflavors.statsforecast
+
+    df = generate_series(n_series=args.n_series, freq="D", min_length=60, seed=0)
+    print(f"Fitting AutoETS and Naive on {args.n_series:,} series")
+    model = StatsForecast(df=df, models=[AutoETS(model="ANN"), Naive()], freq="D").fit()
+
+    rng = np.random.default_rng(0)
+    rows = [
+        {
+            "h": int(rng.integers(1, args.max_h + 1)),
+            "level": LEVELS[rng.integers(len(LEVELS))],
+        }
+        for _ in range(args.n_requests)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "model")
+        mlflavors.statsforecast.save_model(
+            model, path, pip_requirements=["statsforecast"]
+        )
+        loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(path)
+
+        sequential, batched = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for row in rows:
+                loaded_pyfunc.predict(pd.DataFrame([row]))
+            sequential.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            loaded_pyfunc.predict(pd.DataFrame(rows))
+            batched.append(time.perf_counter() - start)
+
+    print(f"{'mode':<12}{'total (s)':>10}{'requests/s':>12}")
+    for mode, times in [("per-request", sequential), ("batched", batched)]:
+        elapsed = min(times)
+        print(f"{mode:<12}{elapsed:>10.3f}{args.n_requests / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
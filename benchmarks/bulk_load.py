@@ -0,0 +1,64 @@
+"""Compare sequential and parallel loading of many small sktime models.
+
+``--n-models`` ``NaiveForecaster`` models are logged to runs of a file tracking
+store in a temporary directory, so that loading a ``runs:/`` URI downloads the
+model directory like loading from a remote store does. The models are then loaded
+sequentially with ``mlflavors.sktime.load_model`` and with ``mlflavors.load_models``
+using the thread and the process executor. The file store adds no network latency,
+so the speedup of the parallel downloads over a remote store is underestimated,
+and the process executor includes the start of its worker processes.
+
+Usage::
+
+    python benchmarks/bulk_load.py [--n-models 100] [--max-workers 16]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-models", type=int, default=100)
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+
+    import mlflow
+    from sktime.datasets import load_airline
+    from sktime.forecasting.naive import NaiveForecaster
+
+    import mlflavors
+    import mlflavors.sktime
+
+    y = load_airline()
+    with tempfile.TemporaryDirectory() as tmp:
+        mlflow.set_tracking_uri(Path(tmp, "mlruns").as_uri())
+        model_uris = []
+        for i in range(args.n_models):
+            model = NaiveForecaster(strategy="drift", window_length=12 + i % 24)
+            with mlflow.start_run():
+                model_info = mlflavors.sktime.log_model(
+                    model.fit(y), "model", pip_requirements=["sktime"]
+                )
+            model_uris.append(model_info.model_uri)
+
+        print(f"{'method':<12}{'load (s)':>10}{'errors':>8}")
+        start = time.perf_counter()
+        for model_uri in model_uris:
+            mlflavors.sktime.load_model(model_uri)
+        print(f"{'sequential':<12}{time.perf_counter() - start:>10.3f}{0:>8}")
+
+        for executor in ["thread", "process"]:
+            start = time.perf_counter()
+            results = mlflavors.load_models(
+                model_uris, max_workers=args.max_workers, executor=executor
+            )
+            elapsed = time.perf_counter() - start
+            errors = sum(result.error is not None for result in results)
+            print(f"{executor:<12}{elapsed:>10.3f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
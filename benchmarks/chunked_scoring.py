@@ -0,0 +1,86 @@
+"""Measure throughput and peak memory of chunked pyod pyfunc scoring.
+
+A PyOD ``KNN`` detector is fitted on ``--n-train`` rows and saved once. Every
+configuration then runs in a fresh interpreter, which loads the pyfunc model, scores
+``--n-rows`` rows passed as a list (as in a REST request) with the given
+``chunk_size`` and ``n_jobs``, and reports rows per second and the peak resident
+set size of the process.
+
+Usage::
+
+    python benchmarks/chunked_scoring.py [--n-rows 500000] [--n-jobs 1 4]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SNIPPET = """
+import json, resource, time
+import numpy as np
+import pandas as pd
+import mlflavors.pyod
+model = mlflavors.pyod.pyfunc.load_model({path!r})
+X = np.random.default_rng(0).standard_normal(({n_rows}, {n_features})).tolist()
+conf = {{"predict_method": "decision_function", "X": X}}
+if {chunk_size} is not None:
+    conf.update(chunk_size={chunk_size}, n_jobs={n_jobs})
+start = time.perf_counter()
+model.predict(pd.DataFrame([conf]))
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(json.dumps({{"elapsed": elapsed, "rss": rss}}))
+"""
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-rows", type=int, default=500_000)
+    parser.add_argument("--n-train", type=int, default=20_000)
+    parser.add_argument("--n-features", type=int, default=8)
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000]
+    )
+    parser.add_argument("--n-jobs", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    import numpy as np
+    from pyod.models.knn import KNN
+
+    import mlflavors.pyod
+
+    X_train = np.random.default_rng(42).standard_normal((args.n_train, args.n_features))
+    configs = [(None, 1)] + [
+        (chunk_size, n_jobs)
+        for chunk_size in args.chunk_sizes
+        for n_jobs in args.n_jobs
+    ]
+
+    print(f"{'chunk_size':>12}{'n_jobs':>8}{'rows/s':>12}{'peak RSS (MB)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp, "model"))
+        mlflavors.pyod.save_model(KNN().fit(X_train), path, pip_requirements=["pyod"])
+        for chunk_size, n_jobs in configs:
+            code = SNIPPET.format(
+                path=path,
+                n_rows=args.n_rows,
+                n_features=args.n_features,
+                chunk_size=chunk_size,
+                n_jobs=n_jobs,
+            )
+            out = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{chunk_size or 'none':>12}{n_jobs:>8}"
+                f"{args.n_rows / result['elapsed']:>12,.0f}"
+                f"{result['rss'] / 1024**2:>15.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark the cold start time of ``_load_pyfunc`` for each flavor.
+
+A small model is saved once per flavor, then every measurement runs in a fresh
+interpreter and times ``import mlflavors.<flavor>`` followed by the first call of
+``mlflavors.<flavor>._load_pyfunc``. Passing ``--eager`` imports the underlying
+framework before the flavor module, which reproduces the behavior of flavor
+modules that import their framework at module import time.
+
+Usage::
+
+    python benchmarks/cold_start.py [--repeat 5] [--eager]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+FRAMEWORKS = {
+    "orbit": "orbit",
+    "pyod": "pyod",
+    "sdv": "sdv",
+    "sktime": "sktime",
+    "statsforecast": "statsforecast",
+}
+
+SNIPPET = """
+import json, time
+start = time.perf_counter()
+{eager}import mlflavors.{flavor} as flavor
+imported = time.perf_counter()
+flavor._load_pyfunc({path!r})
+loaded = time.perf_counter()
+print(json.dumps({{"import": imported - start, "load": loaded - imported}}))
+"""
+
+
+def _save_pyod(path):
+    from pyod.models.knn import KNN
+    from pyod.utils.data import generate_data
+
+    import mlflavors.pyod
+
+    X_train, _, _, _ = generate_data(n_train=200, n_test=10, random_state=42)
+    mlflavors.pyod.save_model(KNN().fit(X_train), path)
+
+
+def _save_sktime(path):
+    from sktime.datasets import load_airline
+    from sktime.forecasting.naive import NaiveForecaster
+
+    import mlflavors.sktime
+
+    mlflavors.sktime.save_model(NaiveForecaster().fit(load_airline()), path)
+
+
+def _save_statsforecast(path):
+    from statsforecast import StatsForecast
+    from statsforecast.models import Naive
+    from statsforecast.utils import AirPassengersDF
+
+    import mlflavors.statsforecast
+
+    sf = StatsForecast(df=AirPassengersDF, models=[Naive()], freq="M")
+    mlflavors.statsforecast.save_model(sf.fit(), path)
+
+
+def _save_sdv(path):
+    import pandas as pd
+    from sdv.metadata import SingleTableMetadata
+    from sdv.single_table import GaussianCopulaSynthesizer
+
+    import mlflavors.sdv
+
+    data = pd.DataFrame({"a": range(100), "b": [i % 7 for i in range(100)]})
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    mlflavors.sdv.save_model(synthesizer, path)
+
+
+def _save_orbit(path):
+    from orbit.models import DLT
+    from orbit.utils.dataset import load_iclaims
+
+    import mlflavors.orbit
+
+    dlt = DLT(response_col="claims", date_col="week", estimator="stan-map")
+    mlflavors.orbit.save_model(dlt.fit(df=load_iclaims()), path)
+
+
+SAVERS = {
+    "orbit": _save_orbit,
+    "pyod": _save_pyod,
+    "sdv": _save_sdv,
+    "sktime": _save_sktime,
+    "statsforecast": _save_statsforecast,
+}
+
+
+def measure(flavor, path, repeat, eager):
+    """Return the median import and load time of ``flavor`` in seconds."""
+    runs = []
+    for _ in range(repeat):
+        code = SNIPPET.format(
+            flavor=flavor,
+            path=str(path),
+            eager=f"import {FRAMEWORKS[flavor]}\n" if eager else "",
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        key: statistics.median(run[key] for run in runs) for key in ["import", "load"]
+    }
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--eager", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'flavor':<15}{'import (s)':>12}{'load (s)':>12}{'total (s)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for flavor, saver in SAVERS.items():
+            path = Path(tmp, flavor)
+            try:
+                saver(path)
+            except ImportError as e:
+                print(f"{flavor:<15}skipped ({e})")
+                continue
+            result = measure(flavor, path, args.repeat, args.eager)
+            total = result["import"] + result["load"]
+            print(
+                f"{flavor:<15}{result['import']:>12.3f}{result['load']:>12.3f}"
+                f"{total:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
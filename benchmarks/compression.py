@@ -0,0 +1,97 @@
+"""Compare artifact size, save time and load time per compression codec and level.
+
+A PyOD ``KNN`` detector is fitted on random data sized so that the uncompressed
+model is roughly ``--size-mb`` megabytes. The training data is rounded to a few
+decimals so that the artifact compresses the way real feature matrices do. The
+model is saved once per codec and level with ``mlflavors.pyod.save_model`` and
+loaded back with ``mlflavors.pyod.load_model``.
+
+Usage::
+
+    python benchmarks/compression.py [--size-mb 200] [--repeat 3]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+MATRIX = [
+    (None, None),
+    ("lz4", 0),
+    ("lz4", 9),
+    ("lz4", 16),
+    ("zstd", 1),
+    ("zstd", 3),
+    ("zstd", 9),
+    ("zstd", 19),
+    ("gzip", 1),
+    ("gzip", 6),
+    ("gzip", 9),
+]
+
+
+def _dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=200.0)
+    parser.add_argument("--n-features", type=int, default=4)
+    parser.add_argument("--decimals", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from pyod.models.knn import KNN
+
+    import mlflavors.pyod
+
+    n_rows = int(args.size_mb * 1024**2 / (8 * (args.n_features + 3)))
+    rng = np.random.default_rng(42)
+    X = rng.standard_normal((n_rows, args.n_features)).round(args.decimals)
+    print(f"Fitting KNN on {n_rows:,} rows x {args.n_features} features")
+    model = KNN().fit(X)
+    del X
+
+    print(
+        f"{'codec':<8}{'level':>6}{'size (MB)':>12}{'ratio':>8}"
+        f"{'save (s)':>10}{'load (s)':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for compression, level in MATRIX:
+            save_times, load_times = [], []
+            for i in range(args.repeat):
+                path = os.path.join(tmp, f"{compression}-{level}-{i}")
+                start = time.perf_counter()
+                mlflavors.pyod.save_model(
+                    model,
+                    path,
+                    compression=compression,
+                    compression_level=level,
+                    pip_requirements=["pyod"],
+                )
+                save_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                mlflavors.pyod.load_model(path)
+                load_times.append(time.perf_counter() - start)
+            size = _dir_size(path) / 1024**2
+            baseline = baseline or size
+            print(
+                f"{compression or 'none':<8}{'' if level is None else level:>6}"
+                f"{size:>12.1f}{baseline / size:>8.2f}"
+                f"{statistics.median(save_times):>10.3f}"
+                f"{statistics.median(load_times):>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark the import time and memory footprint of ``mlflavors`` flavors.
+
+Each measurement runs in a fresh interpreter so that module caches do not leak
+between runs. For every flavor the script reports the wall time of
+``import mlflavors; mlflavors.<flavor>``, the peak RSS of the process and which of
+the other frameworks ended up in ``sys.modules``. The ``all`` row imports every
+available flavor and corresponds to the former eager behavior of
+``import mlflavors``.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+FRAMEWORKS = ["orbit", "pyod", "sdv", "sktime", "statsforecast"]
+
+SNIPPET = """
+import json, resource, sys, time
+start = time.perf_counter()
+import mlflavors
+missing = []
+for name in {flavors!r}:
+    try:
+        getattr(mlflavors, name)
+    except ImportError:
+        missing.append(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "frameworks": [name for name in {frameworks!r} if name in sys.modules],
+    "missing": missing,
+}}))
+"""
+
+
+def measure(flavors, repeat):
+    """Return median import time and peak RSS of accessing ``flavors``."""
+    runs = []
+    for _ in range(repeat):
+        code = SNIPPET.format(flavors=flavors, frameworks=FRAMEWORKS)
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        "seconds": statistics.median(run["seconds"] for run in runs),
+        "max_rss_mb": statistics.median(run["max_rss_mb"] for run in runs),
+        "frameworks": runs[-1]["frameworks"],
+        "missing": runs[-1]["missing"],
+    }
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'flavor':<15}{'seconds':>10}{'max rss (MB)':>15}  frameworks loaded")
+    rows = [("(none)", [])] + [(name, [name]) for name in FRAMEWORKS]
+    rows.append(("all", FRAMEWORKS))
+    for label, flavors in rows:
+        result = measure(flavors, args.repeat)
+        missing = result["missing"]
+        print(
+            f"{label:<15}{result['seconds']:>10.3f}{result['max_rss_mb']:>15.1f}  "
+            f"{', '.join(result['frameworks']) or '-'}"
+            + (f" (not installed: {', '.join(missing)})" if missing else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare load latency and peak RSS of PyOD models per serialization format.
+
+A PyOD ``KNN`` detector is fitted on random data sized so that the serialized model
+is roughly ``--size-gb`` gigabytes, saved once per serialization format and then
+loaded with ``mlflavors.pyod.load_model`` in a fresh interpreter with pyod already
+imported. The script reports the median load time and the peak RSS increase caused
+by loading the model (Linux only).
+
+Usage::
+
+    python benchmarks/out_of_band_load.py [--size-gb 1.0] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+FORMATS = ["pickle", "cloudpickle", "joblib", "pickle5"]
+
+SNIPPET = """
+import json, time
+import mlflavors.pyod
+import pyod.models.knn
+
+def status(key):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(key):
+                return int(line.split()[1]) / 1024
+
+# Reset the peak RSS of the process so that only the load is measured.
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")
+before = status("VmRSS")
+start = time.perf_counter()
+model = mlflavors.pyod.load_model({path!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "rss_mb": status("VmHWM") - before}}))
+"""
+
+
+def _dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-gb", type=float, default=1.0)
+    parser.add_argument("--n-features", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from pyod.models.knn import KNN
+
+    import mlflavors.pyod
+
+    # Per row the model stores the training data, the tree index, the training
+    # scores and the distances to the nearest neighbors.
+    n_rows = int(args.size_gb * 1024**3 / (8 * (args.n_features + 3)))
+    rng = np.random.default_rng(42)
+    X = rng.standard_normal((n_rows, args.n_features))
+    print(f"Fitting KNN on {n_rows:,} rows x {args.n_features} features")
+    model = KNN().fit(X)
+    del X
+
+    print(f"{'format':<15}{'size (MB)':>12}{'load (s)':>12}{'peak rss (MB)':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for serialization_format in FORMATS:
+            path = os.path.join(tmp, serialization_format)
+            mlflavors.pyod.save_model(
+                model,
+                path,
+                serialization_format=serialization_format,
+                pip_requirements=["pyod"],
+            )
+            runs = []
+            for _ in range(args.repeat):
+                out = subprocess.run(
+                    [sys.executable, "-c", SNIPPET.format(path=path)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            print(
+                f"{serialization_format:<15}{_dir_size(path) / 1024**2:>12.1f}"
+                f"{statistics.median(run['seconds'] for run in runs):>12.3f}"
+                f"{statistics.median(run['rss_mb'] for run in runs):>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure the latency and quantile error of Orbit models with subsampled posteriors.
+
+A DLT model is fitted with ``estimator="stan-mcmc"`` on the iclaims example and saved
+once with all posterior draws and once per ``--retained`` count with
+``num_posterior_samples``. For each artifact the script reports the artifact size, the
+median ``predict`` latency on the 52 week test set and the mean absolute error of the
+5th, 50th and 95th prediction percentiles relative to the model with all draws,
+scaled by the mean of the response.
+
+Usage::
+
+    python benchmarks/posterior_thinning.py [--num-sample 4000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+QUANTILE_COLUMNS = ["prediction_5", "prediction", "prediction_95"]
+
+
+def _dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-sample", type=int, default=4000)
+    parser.add_argument("--chains", type=int, default=4)
+    parser.add_argument(
+        "--retained", type=int, nargs="+", default=[2000, 1000, 500, 200, 100]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=2023)
+    args = parser.parse_args()
+
+    from orbit.models import DLT
+    from orbit.utils.dataset import load_iclaims
+
+    import mlflavors.orbit
+
+    df = load_iclaims()
+    train_df, test_df = df[:-52], df[-52:]
+    dlt = DLT(
+        response_col="claims",
+        date_col="week",
+        regressor_col=["trend.unemploy", "trend.filling", "trend.job"],
+        seasonality=52,
+        estimator="stan-mcmc",
+        num_warmup=args.num_sample,
+        num_sample=args.num_sample,
+        chains=args.chains,
+        seed=args.seed,
+    ).fit(df=train_df)
+    scale = train_df["claims"].abs().mean()
+
+    print(
+        f"{'draws':>8}{'size (MB)':>12}{'predict (s)':>14}"
+        + "".join(f"{'err ' + column:>20}" for column in QUANTILE_COLUMNS)
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = None
+        for retained in [None] + args.retained:
+            path = os.path.join(tmp, str(retained))
+            mlflavors.orbit.save_model(
+                dlt,
+                path,
+                num_posterior_samples=retained,
+                posterior_seed=args.seed,
+                pip_requirements=["orbit-ml"],
+            )
+            model = mlflavors.orbit.load_model(path)
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                predictions = model.predict(test_df, seed=args.seed)
+                timings.append(time.perf_counter() - start)
+            if reference is None:
+                reference = predictions
+            errors = [
+                np.mean(np.abs(predictions[column] - reference[column])) / scale
+                for column in QUANTILE_COLUMNS
+            ]
+            print(
+                f"{retained or args.num_sample:>8}{_dir_size(path) / 1024**2:>12.2f}"
+                f"{statistics.median(timings):>14.4f}"
+                + "".join(f"{error:>20.5f}" for error in errors)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare per-column casting and cached cast plans for exogenous regressors.
+
+The orbit and statsforecast pyfunc wrappers build the regressor ``pd.DataFrame``
+from the rows in ``X`` and the schema in ``X_cols`` and ``X_dtypes``. This compares
+inferring a ``pd.DataFrame`` and casting its columns one by one (the previous
+implementation) with :func:`mlflavors.utils.casting.build_frame` for a wide
+regressor (``--wide-cols`` float and integer columns, ``--wide-rows`` rows) and a long
+regressor (``--long-rows`` rows of a string id, a datetime and four float columns).
+
+Usage::
+
+    python benchmarks/regressor_casting.py [--wide-cols 500] [--long-rows 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def _cast_columns(X, X_cols, X_dtypes):
+    df = pd.DataFrame(data=X, columns=X_cols)
+    for col, dtype in zip(X_cols, X_dtypes):
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def _best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wide-cols", type=int, default=500)
+    parser.add_argument("--wide-rows", type=int, default=1000)
+    parser.add_argument("--long-rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from mlflavors.utils.casting import build_frame
+
+    rng = np.random.default_rng(0)
+    wide = pd.DataFrame(
+        {
+            f"x{i}": (
+                rng.standard_normal(args.wide_rows)
+                if i % 2
+                else rng.integers(0, 10, args.wide_rows).astype("int32")
+            )
+            for i in range(args.wide_cols)
+        }
+    )
+    steps = np.arange(args.long_rows)
+    long = pd.DataFrame(
+        {
+            "unique_id": np.char.add("series_", (steps // 28).astype(str)),
+            "ds": pd.date_range("2020-01-01", periods=28, freq="D")[steps % 28],
+        }
+    )
+    for i in range(4):
+        long[f"x{i}"] = rng.standard_normal(args.long_rows)
+
+    print(f"{'regressor':<12}{'per-column (s)':>16}{'cast plan (s)':>15}")
+    for name, df in [("wide", wide), ("long", long)]:
+        X_cols, X_dtypes = list(df.columns), [str(dtype) for dtype in df.dtypes]
+        # Rows as deserialized from a JSON request.
+        X = df.astype({col: str for col in df.select_dtypes("datetime")}).to_numpy()
+        X = X.tolist()
+        per_column = _best_of(lambda: _cast_columns(X, X_cols, X_dtypes), args.repeat)
+        plan = _best_of(lambda: build_frame(X, X_cols, X_dtypes), args.repeat)
+        print(f"{name:<12}{per_column:>16.3f}{plan:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
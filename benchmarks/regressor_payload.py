@@ -0,0 +1,90 @@
+"""Compare the list and binary payload paths for exogenous regressors.
+
+A regressor frame with ``--n-rows`` rows of a string ``unique_id``, a datetime
+``ds`` and ``--n-float-cols`` float columns is passed to the statsforecast pyfunc
+configuration parser as a nested list with ``X_cols`` and ``X_dtypes`` (the JSON
+request path), as a base64 encoded Arrow / NumPy payload in ``X`` and as an
+Arrow / NumPy file referenced by ``X_path``. The table shows the time to decode
+the JSON request body and build the regressor ``pd.DataFrame`` on the serving
+side, and the size of the request body; file payloads are memory mapped and send
+only their path.
+
+Usage::
+
+    python benchmarks/regressor_payload.py [--n-rows 1000000] [--n-float-cols 4]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def _best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-rows", type=int, default=1_000_000)
+    parser.add_argument("--n-float-cols", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from mlflavors.statsforecast import _parse_config
+    from mlflavors.utils.payload import encode_frame
+
+    rng = np.random.default_rng(0)
+    steps = np.arange(args.n_rows)
+    df = pd.DataFrame(
+        {
+            "unique_id": np.char.add("series_", (steps // 28).astype(str)),
+            "ds": pd.date_range("2020-01-01", periods=28, freq="D")[steps % 28],
+        }
+    )
+    for i in range(args.n_float_cols):
+        df[f"x{i}"] = rng.standard_normal(args.n_rows)
+
+    X_cols = list(df.columns)
+    X_dtypes = [str(dtype) for dtype in df.dtypes]
+    X_list = df.astype({"ds": str}).to_numpy().tolist()
+
+    cases = {"list": {"h": 28, "X": X_list, "X_cols": X_cols, "X_dtypes": X_dtypes}}
+    for payload_format in ["arrow", "npy"]:
+        X = encode_frame(df, payload_format)
+        cases[f"{payload_format} base64"] = {
+            "h": 28,
+            "X": X,
+            "X_format": payload_format,
+        }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        arrow_path = Path(tmp, "X.arrow")
+        df.to_feather(arrow_path, compression="uncompressed")
+        npy_path = Path(tmp, "X.npy")
+        np.save(
+            npy_path, df.to_records(index=False, column_dtypes={"unique_id": "U16"})
+        )
+        for payload_format, path in [("arrow", arrow_path), ("npy", npy_path)]:
+            cases[f"{payload_format} path"] = {"h": 28, "X_path": str(path)}
+
+        print(f"{'payload':<14}{'parse (s)':>10}{'request (MB)':>14}")
+        for name, attrs in cases.items():
+            body = json.dumps(attrs)
+            elapsed = _best_of(
+                lambda: _parse_config(json.loads(body), X_cols), args.repeat
+            )
+            print(f"{name:<14}{elapsed:>10.3f}{len(body) / 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
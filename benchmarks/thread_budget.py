@@ -0,0 +1,114 @@
+"""Measure the request latency of concurrent serving workers with a thread budget.
+
+A PyOD ``KNN`` detector is fitted on ``--n-train`` rows and saved once. Like the
+workers of ``mlflow models serve``, ``--workers`` processes then load the pyfunc model
+and score ``--requests`` requests of ``--batch-size`` rows each at the same time.
+The run is repeated without a thread budget, where the BLAS and OpenMP thread pools
+of every worker are sized to the whole machine, and with
+``MLFLAVORS_THREAD_BUDGET`` set to the number of CPUs divided by the number of
+workers. The table reports the latency percentiles over the requests of all
+workers.
+
+The comparison needs at least as many CPUs as workers. With fewer CPUs the workers
+alone oversubscribe the machine whatever the budget, and on a single CPU the thread
+pools have one thread in both runs.
+
+Usage::
+
+    python benchmarks/thread_budget.py [--workers 8] [--requests 200]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+SNIPPET = """
+import json, time
+import numpy as np
+import pandas as pd
+import mlflavors.pyod
+model = mlflavors.pyod.pyfunc.load_model({path!r})
+X = np.random.default_rng(0).standard_normal(({batch_size}, {n_features}))
+conf = pd.DataFrame([{{"predict_method": "decision_function", "X": X}}])
+model.predict(conf)
+time.sleep(max({start} - time.time(), 0))
+latencies = []
+for _ in range({requests}):
+    start = time.perf_counter()
+    model.predict(conf)
+    latencies.append(time.perf_counter() - start)
+print(json.dumps(latencies))
+"""
+
+
+def run_workers(args, path, thread_budget):
+    """Run the workers concurrently and return the latencies of all requests."""
+    env = dict(os.environ)
+    env.pop("MLFLAVORS_THREAD_BUDGET", None)
+    if thread_budget is not None:
+        env["MLFLAVORS_THREAD_BUDGET"] = str(thread_budget)
+    code = SNIPPET.format(
+        path=path,
+        batch_size=args.batch_size,
+        n_features=args.n_features,
+        requests=args.requests,
+        # Leave the workers time to load the model before they start together.
+        start=time.time() + args.warmup,
+    )
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(args.workers)
+    ]
+    latencies = []
+    for worker in workers:
+        stdout, _ = worker.communicate()
+        latencies += json.loads(stdout.strip().splitlines()[-1])
+    return np.array(latencies)
+
+
+def main():
+    """Print the benchmark table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--n-train", type=int, default=20_000)
+    parser.add_argument("--n-features", type=int, default=32)
+    parser.add_argument("--warmup", type=float, default=20.0)
+    args = parser.parse_args()
+
+    from pyod.models.knn import KNN
+
+    import mlflavors.pyod
+    from mlflavors.utils.cpu import available_cpus
+
+    X_train = np.random.default_rng(42).standard_normal((args.n_train, args.n_features))
+    budget = max(available_cpus() // args.workers, 1)
+
+    print(f"{args.workers} workers on {available_cpus()} CPUs")
+    if available_cpus() < args.workers:
+        print("Warning: fewer CPUs than workers, the results are not representative.")
+    print(f"{'thread budget':>14}{'p50 (ms)':>10}{'p99 (ms)':>10}{'requests/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp, "model"))
+        mlflavors.pyod.save_model(KNN().fit(X_train), path, pip_requirements=["pyod"])
+        for thread_budget in [None, budget]:
+            latencies = run_workers(args, path, thread_budget)
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            throughput = args.workers / latencies.mean()
+            print(
+                f"{thread_budget or 'none':>14}{p50:>10.1f}{p99:>10.1f}"
+                f"{throughput:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
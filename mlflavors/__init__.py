@@ -1,20 +1,30 @@
-try:
-    from mlflavors import pyod, sdv, sktime, statsforecast
+import importlib
 
-    __all__ = [
-        "pyod",
-        "sdv",
-        "sktime",
-        "statsforecast",
-    ]
-except ImportError as e:  # noqa: F841
-    pass
+__all__ = [
+    "orbit",
+    "pyod",
+    "sdv",
+    "sktime",
+    "statsforecast",
+    "load_models",
+]
 
-try:
-    from mlflavors import orbit
+# Functions exposed at the package level, mapped to the module defining them.
+_FUNCTIONS = {
+    "load_models": "mlflavors.utils.bulk_loading",
+}
 
-    __all__ = [
-        "orbit",
-    ]
-except ImportError as e:  # noqa: F841
-    pass
+
+def __getattr__(name):
+    # Flavor modules import their underlying framework, so they are only imported
+    # on first attribute access (e.g. ``mlflavors.pyod``) to keep ``import
+    # mlflavors`` cheap for processes that serve a single flavor.
+    if name in _FUNCTIONS:
+        return getattr(importlib.import_module(_FUNCTIONS[name]), name)
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -26,18 +26,32 @@ orbit (native) format
         - Type
         - Description
       * - X
-        - numpy ndarray or list (required)
+        - numpy ndarray, list or str (required)
         - | Exogenous regressor for future time period events.
           | For more information, read the underlying library explanation:
           | https://orbit-ml.readthedocs.io/en/latest/.
+          | A base64 encoded binary payload if ``X_format`` is provided, see
+          | :mod:`mlflavors.utils.payload`. Not required if ``X_path`` is provided.
+      * - X_path
+        - str (optional)
+        - | Path to a local file holding the exogenous regressor as binary payload.
+          | (Default: ``None``)
+      * - X_format
+        - str (optional)
+        - | Format of the binary payload of the exogenous regressor, ``arrow`` or
+          | ``npy``. The column names and types are taken from the payload, so
+          | ``X_cols`` and ``X_dtypes`` are not needed.
+          | (Default: ``None``, inferred from the extension of ``X_path``)
       * - X_cols
         - list (required)
         - | Column names of the exogenous regressor matrix
           | (Required to construct Pandas DataFrame inside model wrapper class).
+          | Not required for binary payloads.
       * - X_dtypes (required)
         - list (required)
         - | Data types of the exogenous regressor matrix
           | (Required to construct Pandas DataFrame inside model wrapper class).
+          | Not required for binary payloads.
       * - decompose
         - bool (optional)
         - | If True, returns each prediction component separately.
@@ -51,12 +65,14 @@ orbit (native) format
         - | Seed in prediction is set to be random by default unless provided.
           | (Default: ``None``)
 """  # noqa: E501
+import copy
 import logging
 import os
 import pickle
+from importlib import metadata
 
 import mlflow
-import orbit
+import numpy as np
 import pandas as pd
 import yaml
 from mlflow import pyfunc
@@ -66,7 +82,6 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.docstring_utils import LOG_MODEL_PARAM_DOCS, format_docstring
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
@@ -89,20 +104,38 @@ from mlflow.utils.model_utils import (
 from mlflow.utils.requirements_utils import _get_pinned_requirement
 
 import mlflavors
+from mlflavors.utils.aio import run_blocking
+from mlflavors.utils.artifact_cache import download_model_artifacts
+from mlflavors.utils.casting import build_frame
+from mlflavors.utils.model_cache import get_model_lock, get_or_load
+from mlflavors.utils.payload import decode_frame, is_payload
+from mlflavors.utils.serialization import (
+    COMPRESSION_FILE_EXTENSIONS,
+    dump_out_of_band,
+    get_compression_pip_requirements,
+    load_out_of_band,
+    open_model_file,
+    validate_compression,
+)
+from mlflavors.utils.thread_budget import limit_threads
 
 FLAVOR_NAME = "orbit"
 
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
+SERIALIZATION_FORMAT_PICKLE5 = "pickle5"
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
     SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB,
+    SERIALIZATION_FORMAT_PICKLE5,
 ]
 
 _logger = logging.getLogger(__name__)
 
 
-def get_default_pip_requirements(include_cloudpickle=False):
+def get_default_pip_requirements(include_cloudpickle=False, include_joblib=False):
     """
     :return: A list of default pip requirements for MLflow Models produced by this
              flavor. Calls to :func:`save_model()` and :func:`log_model()` produce a pip
@@ -111,17 +144,21 @@ def get_default_pip_requirements(include_cloudpickle=False):
     pip_deps = [_get_pinned_requirement("orbit")]
     if include_cloudpickle:
         pip_deps += [_get_pinned_requirement("cloudpickle")]
+    if include_joblib:
+        pip_deps += [_get_pinned_requirement("joblib")]
 
     return pip_deps
 
 
-def get_default_conda_env(include_cloudpickle=False):
+def get_default_conda_env(include_cloudpickle=False, include_joblib=False):
     """
     :return: The default Conda environment for MLflow Models produced by calls to
              :func:`save_model()` and :func:`log_model()`.
     """
     return _mlflow_conda_env(
-        additional_pip_deps=get_default_pip_requirements(include_cloudpickle)
+        additional_pip_deps=get_default_pip_requirements(
+            include_cloudpickle, include_joblib
+        )
     )
 
 
@@ -137,6 +174,10 @@ def save_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    num_posterior_samples=None,
+    posterior_seed=0,
 ):
     """
     Save an orbit model to a path on the local file system. Produces an MLflow Model
@@ -174,7 +215,32 @@ def save_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param num_posterior_samples: If specified, the posterior draws of the model are
+        subsampled without replacement to ``num_posterior_samples`` draws before
+        serialization, which reduces the artifact size and the latency of ``predict``
+        proportionally. For models fitted with ``estimator="stan-mcmc"`` the same
+        number of draws is retained from each chain, so ``num_posterior_samples``
+        must be a multiple of the number of chains. The original and retained number
+        of draws are recorded in the flavor configuration. (Default: ``None``)
+    :param posterior_seed: Seed of the random generator used to select the retained
+        posterior draws, so that saving the same model twice retains the same
+        draws. (Default: ``0``)
     """  # noqa: E501
     _validate_env_arguments(conda_env, pip_requirements, extra_pip_requirements)
 
@@ -191,6 +257,15 @@ def save_model(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
+    validate_compression(compression, serialization_format, compression_level)
+
+    original_posterior_samples = None
+    if num_posterior_samples is not None:
+        original_posterior_samples = _count_posterior_samples(orbit_model)
+        orbit_model = _subsample_posterior(
+            orbit_model, num_posterior_samples, seed=posterior_seed
+        )
+
     _validate_and_prepare_target_save_path(path)
     code_dir_subpath = _validate_and_copy_code_paths(code_paths, path)
 
@@ -202,8 +277,16 @@ def save_model(
         _save_example(mlflow_model, input_example, path)
 
     model_data_subpath = "model.pkl"
+    if compression is not None:
+        model_data_subpath += COMPRESSION_FILE_EXTENSIONS[compression]
     model_data_path = os.path.join(path, model_data_subpath)
-    _save_model(orbit_model, model_data_path, serialization_format=serialization_format)
+    _save_model(
+        orbit_model,
+        model_data_path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+    )
 
     pyfunc.add_to_model(
         mlflow_model,
@@ -217,8 +300,13 @@ def save_model(
     mlflow_model.add_flavor(
         FLAVOR_NAME,
         pickled_model=model_data_subpath,
-        orbit_version=orbit.__version__,
+        orbit_version=metadata.version("orbit-ml"),
         serialization_format=serialization_format,
+        compression=compression,
+        original_posterior_samples=original_posterior_samples,
+        retained_posterior_samples=(
+            num_posterior_samples if original_posterior_samples is not None else None
+        ),
         code=code_dir_subpath,
     )
     mlflow_model.save(os.path.join(path, MLMODEL_FILE_NAME))
@@ -228,7 +316,11 @@ def save_model(
             include_cloudpickle = (
                 serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE
             )
-            default_reqs = get_default_pip_requirements(include_cloudpickle)
+            include_joblib = serialization_format == SERIALIZATION_FORMAT_JOBLIB
+            default_reqs = get_default_pip_requirements(
+                include_cloudpickle, include_joblib
+            )
+            default_reqs += get_compression_pip_requirements(compression)
             # To ensure `_load_pyfunc` can successfully load the model during the
             # dependency inference, `mlflow_model.save` must be called beforehand
             # to save an MLmodel file.
@@ -270,6 +362,10 @@ def log_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    num_posterior_samples=None,
+    posterior_seed=0,
     **kwargs,
 ):
     """
@@ -313,7 +409,32 @@ def log_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param num_posterior_samples: If specified, the posterior draws of the model are
+        subsampled without replacement to ``num_posterior_samples`` draws before
+        serialization, which reduces the artifact size and the latency of ``predict``
+        proportionally. For models fitted with ``estimator="stan-mcmc"`` the same
+        number of draws is retained from each chain, so ``num_posterior_samples``
+        must be a multiple of the number of chains. The original and retained number
+        of draws are recorded in the flavor configuration. (Default: ``None``)
+    :param posterior_seed: Seed of the random generator used to select the retained
+        posterior draws, so that saving the same model twice retains the same
+        draws. (Default: ``0``)
 
     :return: A :py:class:`ModelInfo` instance that contains the metadata of the logged
         model.
@@ -331,6 +452,10 @@ def log_model(
         pip_requirements=pip_requirements,
         extra_pip_requirements=extra_pip_requirements,
         serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+        num_posterior_samples=num_posterior_samples,
+        posterior_seed=posterior_seed,
         **kwargs,
     )
 
@@ -338,6 +463,10 @@ def log_model(
 def load_model(model_uri, dst_path=None):
     """
     Load an orbit model from a local file or a run.
+    If the artifact cache is enabled (see :mod:`mlflavors.utils.artifact_cache`), the
+    model directory is downloaded through the cache.
+    If the model cache is enabled (see :mod:`mlflavors.utils.model_cache`), the
+    returned model is shared with other callers loading the same model file.
 
     :param model_uri: The location, in URI format, of the MLflow model, for example:
 
@@ -358,24 +487,119 @@ def load_model(model_uri, dst_path=None):
 
     :return: An orbit model.
     """
-    local_model_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path
-    )
-    flavor_conf = _get_flavor_configuration(
-        model_path=local_model_path, flavor_name=FLAVOR_NAME
-    )
-    _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
-    orbit_model_file_path = os.path.join(local_model_path, flavor_conf["pickled_model"])
-    serialization_format = flavor_conf.get(
-        "serialization_format", SERIALIZATION_FORMAT_PICKLE
-    )
-    return _load_model(
-        path=orbit_model_file_path, serialization_format=serialization_format
+    with download_model_artifacts(model_uri, output_path=dst_path) as local_model_path:
+        flavor_conf = _get_flavor_configuration(
+            model_path=local_model_path, flavor_name=FLAVOR_NAME
+        )
+        _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
+        orbit_model_file_path = os.path.join(
+            local_model_path, flavor_conf["pickled_model"]
+        )
+        serialization_format = flavor_conf.get(
+            "serialization_format", SERIALIZATION_FORMAT_PICKLE
+        )
+        return get_or_load(
+            _load_model,
+            path=orbit_model_file_path,
+            serialization_format=serialization_format,
+            compression=flavor_conf.get("compression"),
+        )
+
+
+async def load_model_async(model_uri, dst_path=None):
+    """
+    Asynchronous variant of :func:`load_model`.
+
+    The model is loaded on the executor configured with
+    :func:`mlflavors.utils.aio.configure`. The parameters are those of
+    :func:`load_model`.
+
+    :return: An orbit model.
+    """
+    return await run_blocking(load_model, model_uri, dst_path=dst_path)
+
+
+def _count_posterior_samples(orbit_model):
+    posterior_samples = getattr(orbit_model, "_posterior_samples", None)
+    if not posterior_samples:
+        raise MlflowException(
+            message=(
+                "The orbit model does not hold posterior samples. Subsampling "
+                "posterior draws requires a fitted model with posterior samples."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return len(next(iter(posterior_samples.values())))
+
+
+def _subsample_posterior(orbit_model, num_posterior_samples, seed=None):
+    """
+    Return a shallow copy of ``orbit_model`` keeping ``num_posterior_samples`` of its
+    posterior draws, selected without replacement and kept in their original order.
+    """
+    num_samples = _count_posterior_samples(orbit_model)
+    chains = getattr(orbit_model.estimator, "chains", 1)
+    if (
+        not isinstance(num_posterior_samples, int)
+        or not 0 < num_posterior_samples <= num_samples
+        or num_posterior_samples % chains
+        or num_samples % chains
+    ):
+        raise MlflowException(
+            message=(
+                f"`num_posterior_samples` must be a positive multiple of the number of "
+                f"chains ({chains}) not larger than the number of posterior samples of "
+                f"the model ({num_samples}), got {num_posterior_samples}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    # Draws are stored chain after chain, so they are selected per chain to keep the
+    # chain structure used by ``get_posterior_samples(permute=False)``.
+    rng = np.random.default_rng(seed)
+    num_samples_per_chain = num_samples // chains
+    idx = np.concatenate(
+        [
+            chain * num_samples_per_chain
+            + np.sort(
+                rng.choice(
+                    num_samples_per_chain,
+                    num_posterior_samples // chains,
+                    replace=False,
+                )
+            )
+            for chain in range(chains)
+        ]
     )
 
+    subsampled_model = copy.copy(orbit_model)
+    subsampled_model._posterior_samples = {
+        key: value[idx] for key, value in orbit_model._posterior_samples.items()
+    }
+    # ``predict`` bootstraps from ``estimator.num_sample`` draws.
+    subsampled_model.estimator = copy.copy(orbit_model.estimator)
+    subsampled_model.estimator.num_sample = num_posterior_samples
+    if hasattr(subsampled_model.estimator, "_num_sample_per_chain"):
+        subsampled_model.estimator._num_sample_per_chain = (
+            num_posterior_samples // chains
+        )
+    return subsampled_model
+
 
-def _save_model(model, path, serialization_format):
-    with open(path, "wb") as out:
+def _save_model(
+    model, path, serialization_format, compression=None, compression_level=None
+):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        joblib.dump(model, path)
+        return
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        dump_out_of_band(model, path)
+        return
+
+    with open_model_file(path, "wb", compression, compression_level) as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             pickle.dump(model, out)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -392,7 +616,7 @@ def _save_model(model, path, serialization_format):
             )
 
 
-def _load_model(path, serialization_format):
+def _load_model(path, serialization_format, compression=None):
     if serialization_format not in SUPPORTED_SERIALIZATION_FORMATS:
         raise MlflowException(
             message=(
@@ -406,7 +630,15 @@ def _load_model(path, serialization_format):
             error_code=INVALID_PARAMETER_VALUE,
         )
 
-    with open(path, "rb") as pickled_model:
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        return joblib.load(path, mmap_mode="c")
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        return load_out_of_band(path)
+
+    with open_model_file(path, "rb", compression) as pickled_model:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             return pickle.load(pickled_model)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -423,6 +655,7 @@ def _load_pyfunc(path):
     """
     if os.path.isfile(path):
         serialization_format = SERIALIZATION_FORMAT_PICKLE
+        compression = None
         _logger.warning(
             "Loading procedure in older versions of MLflow using pickle.load()"
         )
@@ -434,12 +667,14 @@ def _load_pyfunc(path):
             serialization_format = orbit_flavor_conf.get(
                 "serialization_format", SERIALIZATION_FORMAT_PICKLE
             )
+            compression = orbit_flavor_conf.get("compression")
         except MlflowException:
             _logger.warning(
                 "Could not find orbit flavor configuration during model "
                 "loading process. Assuming 'pickle' serialization format."
             )
             serialization_format = SERIALIZATION_FORMAT_PICKLE
+            compression = None
 
         pyfunc_flavor_conf = _get_flavor_configuration(
             model_path=path, flavor_name=pyfunc.FLAVOR_NAME
@@ -447,13 +682,28 @@ def _load_pyfunc(path):
         path = os.path.join(path, pyfunc_flavor_conf["model_path"])
 
     return _OrbitModelWrapper(
-        _load_model(path, serialization_format=serialization_format)
+        get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        )
     )
 
 
 class _OrbitModelWrapper:
     def __init__(self, orbit_model):
         self.orbit_model = orbit_model
+        self._lock = get_model_lock(orbit_model)
+
+    async def predict_async(self, dataframe) -> pd.DataFrame:
+        """
+        Asynchronous variant of ``predict``, run with :func:`run_blocking`.
+
+        :param dataframe: The prediction configuration ``Pandas DataFrame``.
+        :return: The predictions of ``predict``.
+        """
+        return await run_blocking(self.predict, dataframe)
 
     def predict(self, dataframe) -> pd.DataFrame:
         df_schema = dataframe.columns.values.tolist()
@@ -473,7 +723,7 @@ class _OrbitModelWrapper:
         store_prediction_array = attrs.get("store_prediction_array", False)
         seed = attrs.get("seed", None)
 
-        if isinstance(X, type(None)):
+        if isinstance(X, type(None)) and not is_payload(attrs):
             raise MlflowException(
                 f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
                 do not contain the required column `X` for specifying the regressor \
@@ -481,34 +731,40 @@ class _OrbitModelWrapper:
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        if isinstance(X_cols, type(None)):
-            raise MlflowException(
-                f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
-                do not contain the required column `X_cols` for specifying the \
-                regressor columns.",
-                error_code=INVALID_PARAMETER_VALUE,
+        if is_payload(attrs):
+            # Column names and types are taken from the binary payload.
+            df = decode_frame(attrs)
+        else:
+            df = _build_frame(X, X_cols, X_dtypes, df_schema)
+
+        # Orbit stores the prediction metadata in the model, so calls are serialized.
+        with self._lock, limit_threads():
+            predictions = self.orbit_model.predict(
+                df,
+                decompose=decompose,
+                store_prediction_array=store_prediction_array,
+                seed=seed,
             )
 
-        if isinstance(X_dtypes, type(None)):
-            raise MlflowException(
-                f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
-                do not contain the required column `X_dtypes` for specifying the \
-                regressor column types.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
+        return predictions
 
-        # Create Pandas DataFrame as required by Orbit predict method
-        df = pd.DataFrame(data=X, columns=X_cols)
 
-        # Cast columns to correct type
-        for col, dtype in zip(X_cols, X_dtypes):
-            df[col] = df[col].astype(dtype)
+def _build_frame(X, X_cols, X_dtypes, df_schema):
+    if isinstance(X_cols, type(None)):
+        raise MlflowException(
+            f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
+            do not contain the required column `X_cols` for specifying the \
+            regressor columns.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
 
-        predictions = self.orbit_model.predict(
-            df,
-            decompose=decompose,
-            store_prediction_array=store_prediction_array,
-            seed=seed,
+    if isinstance(X_dtypes, type(None)):
+        raise MlflowException(
+            f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
+            do not contain the required column `X_dtypes` for specifying the \
+            regressor column types.",
+            error_code=INVALID_PARAMETER_VALUE,
         )
 
-        return predictions
+    # Create typed Pandas DataFrame as required by Orbit predict method
+    return build_frame(X, X_cols, X_dtypes)
@@ -27,10 +27,13 @@ pyod (native) format
         - Type
         - Description
       * - predict_method
-        - str (required)
+        - str or list (required)
         - | Specifies the pyod predict method. The supported predict methods are
           | ``predict``, ``predict_proba``, ``predict_confidence``, and
-          | ``decision_function``.
+          | ``decision_function``. If a list of predict methods is provided, the
+          | outlier scores are computed once, the other outputs are derived from
+          | them and a dictionary mapping each predict method to its output is
+          | returned.
       * - X
         - numpy ndarray or list (required)
         - | The input samples.
@@ -47,15 +50,46 @@ pyod (native) format
         - | The probability conversion method.
           | Can only be provided in combination with predict method ``predict_proba``.
           | (Default: ``linear``)
+      * - chunk_size
+        - int (optional)
+        - | If provided, ``X`` is scored in chunks of ``chunk_size`` rows, which bounds
+          | the memory of detectors whose intermediate results grow with the batch
+          | (e.g. neighbor distances). The chunk outputs are written into arrays
+          | holding all rows. Outputs of detectors thresholding the scores of the
+          | batch (e.g. a ``PyThresh`` contamination) depend on the chunk size.
+          | (Default: ``None``)
+      * - n_jobs
+        - int (optional)
+        - | The number of threads scoring chunks in parallel, ``-1`` meaning the
+          | number of CPUs available to the process. Can only be provided in
+          | combination with ``chunk_size``.
+          | (Default: ``1``)
+
+    Alternatively, the input ``Pandas DataFrame`` can be the feature matrix itself,
+    with one row per sample and without column ``X``. The other columns of the table
+    above are then passed as ``params`` of the pyfunc ``predict`` (which requires a
+    model signature with a params schema), or as reserved columns whose first value
+    is used. This avoids encoding the feature matrix as nested lists and, if the
+    features share one numeric dtype and no reserved columns are present, converts
+    the ``Pandas DataFrame`` to an array without copying it:
+
+    .. code-block:: python
+
+        signature = infer_signature(X, params={"predict_method": "predict"})
+        mlflavors.pyod.save_model(model, path, signature=signature)
+        loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(path)
+        loaded_pyfunc.predict(
+            pd.DataFrame(X), params={"predict_method": "decision_function"}
+        )
 """  # noqa: E501
 import logging
 import os
 import pickle
+from importlib import metadata
 
 import mlflow
 import numpy as np
 import pandas as pd
-import pyod
 import yaml
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
@@ -64,7 +98,6 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.docstring_utils import LOG_MODEL_PARAM_DOCS, format_docstring
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
@@ -85,9 +118,21 @@ from mlflow.utils.model_utils import (
     _validate_and_prepare_target_save_path,
 )
 from mlflow.utils.requirements_utils import _get_pinned_requirement
-from pyod import version  # noqa: F401
 
 import mlflavors
+from mlflavors.utils.aio import run_blocking
+from mlflavors.utils.artifact_cache import download_model_artifacts
+from mlflavors.utils.cpu import resolve_n_jobs
+from mlflavors.utils.model_cache import get_or_load
+from mlflavors.utils.serialization import (
+    COMPRESSION_FILE_EXTENSIONS,
+    dump_out_of_band,
+    get_compression_pip_requirements,
+    load_out_of_band,
+    open_model_file,
+    validate_compression,
+)
+from mlflavors.utils.thread_budget import limit_threads
 
 FLAVOR_NAME = "pyod"
 
@@ -102,17 +147,31 @@ SUPPORTED_PYOD_PREDICT_METHODS = [
     PYOD_DECISION_FUNCTION,
 ]
 
+# Options of the pyfunc predict that are not features when the input pd.DataFrame is
+# the feature matrix.
+PYOD_OPTIONS = [
+    "predict_method",
+    "return_confidence",
+    "method",
+    "chunk_size",
+    "n_jobs",
+]
+
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
+SERIALIZATION_FORMAT_PICKLE5 = "pickle5"
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
     SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB,
+    SERIALIZATION_FORMAT_PICKLE5,
 ]
 
 _logger = logging.getLogger(__name__)
 
 
-def get_default_pip_requirements(include_cloudpickle=False):
+def get_default_pip_requirements(include_cloudpickle=False, include_joblib=False):
     """
     :return: A list of default pip requirements for MLflow Models produced by this
              flavor. Calls to :func:`save_model()` and :func:`log_model()` produce a pip
@@ -121,17 +180,21 @@ def get_default_pip_requirements(include_cloudpickle=False):
     pip_deps = [_get_pinned_requirement("pyod")]
     if include_cloudpickle:
         pip_deps += [_get_pinned_requirement("cloudpickle")]
+    if include_joblib:
+        pip_deps += [_get_pinned_requirement("joblib")]
 
     return pip_deps
 
 
-def get_default_conda_env(include_cloudpickle=False):
+def get_default_conda_env(include_cloudpickle=False, include_joblib=False):
     """
     :return: The default Conda environment for MLflow Models produced by calls to
              :func:`save_model()` and :func:`log_model()`.
     """
     return _mlflow_conda_env(
-        additional_pip_deps=get_default_pip_requirements(include_cloudpickle)
+        additional_pip_deps=get_default_pip_requirements(
+            include_cloudpickle, include_joblib
+        )
     )
 
 
@@ -147,6 +210,8 @@ def save_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
 ):
     """
     Save an pyod model to a path on the local file system. Produces an MLflow Model
@@ -184,7 +249,22 @@ def save_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
     """  # noqa: E501
     _validate_env_arguments(conda_env, pip_requirements, extra_pip_requirements)
 
@@ -201,6 +281,8 @@ def save_model(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
+    validate_compression(compression, serialization_format, compression_level)
+
     _validate_and_prepare_target_save_path(path)
     code_dir_subpath = _validate_and_copy_code_paths(code_paths, path)
 
@@ -212,8 +294,16 @@ def save_model(
         _save_example(mlflow_model, input_example, path)
 
     model_data_subpath = "model.pkl"
+    if compression is not None:
+        model_data_subpath += COMPRESSION_FILE_EXTENSIONS[compression]
     model_data_path = os.path.join(path, model_data_subpath)
-    _save_model(pyod_model, model_data_path, serialization_format=serialization_format)
+    _save_model(
+        pyod_model,
+        model_data_path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+    )
 
     pyfunc.add_to_model(
         mlflow_model,
@@ -227,8 +317,9 @@ def save_model(
     mlflow_model.add_flavor(
         FLAVOR_NAME,
         pickled_model=model_data_subpath,
-        pyod_version=pyod.version.__version__,
+        pyod_version=metadata.version("pyod"),
         serialization_format=serialization_format,
+        compression=compression,
         code=code_dir_subpath,
     )
     mlflow_model.save(os.path.join(path, MLMODEL_FILE_NAME))
@@ -238,7 +329,11 @@ def save_model(
             include_cloudpickle = (
                 serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE
             )
-            default_reqs = get_default_pip_requirements(include_cloudpickle)
+            include_joblib = serialization_format == SERIALIZATION_FORMAT_JOBLIB
+            default_reqs = get_default_pip_requirements(
+                include_cloudpickle, include_joblib
+            )
+            default_reqs += get_compression_pip_requirements(compression)
             # To ensure `_load_pyfunc` can successfully load the model during the
             # dependency inference, `mlflow_model.save` must be called beforehand
             # to save an MLmodel file.
@@ -280,6 +375,8 @@ def log_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
     **kwargs,
 ):
     """
@@ -323,7 +420,22 @@ def log_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
 
     :return: A :py:class:`ModelInfo` instance that contains the metadata of the logged
         model.
@@ -341,6 +453,8 @@ def log_model(
         pip_requirements=pip_requirements,
         extra_pip_requirements=extra_pip_requirements,
         serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
         **kwargs,
     )
 
@@ -348,6 +462,10 @@ def log_model(
 def load_model(model_uri, dst_path=None):
     """
     Load an pyod model from a local file or a run.
+    If the artifact cache is enabled (see :mod:`mlflavors.utils.artifact_cache`), the
+    model directory is downloaded through the cache.
+    If the model cache is enabled (see :mod:`mlflavors.utils.model_cache`), the
+    returned model is shared with other callers loading the same model file.
 
     :param model_uri: The location, in URI format, of the MLflow model, for example:
 
@@ -368,24 +486,52 @@ def load_model(model_uri, dst_path=None):
 
     :return: An pyod model.
     """
-    local_model_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path
-    )
-    flavor_conf = _get_flavor_configuration(
-        model_path=local_model_path, flavor_name=FLAVOR_NAME
-    )
-    _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
-    pyod_model_file_path = os.path.join(local_model_path, flavor_conf["pickled_model"])
-    serialization_format = flavor_conf.get(
-        "serialization_format", SERIALIZATION_FORMAT_PICKLE
-    )
-    return _load_model(
-        path=pyod_model_file_path, serialization_format=serialization_format
-    )
+    with download_model_artifacts(model_uri, output_path=dst_path) as local_model_path:
+        flavor_conf = _get_flavor_configuration(
+            model_path=local_model_path, flavor_name=FLAVOR_NAME
+        )
+        _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
+        pyod_model_file_path = os.path.join(
+            local_model_path, flavor_conf["pickled_model"]
+        )
+        serialization_format = flavor_conf.get(
+            "serialization_format", SERIALIZATION_FORMAT_PICKLE
+        )
+        return get_or_load(
+            _load_model,
+            path=pyod_model_file_path,
+            serialization_format=serialization_format,
+            compression=flavor_conf.get("compression"),
+        )
+
+
+async def load_model_async(model_uri, dst_path=None):
+    """
+    Asynchronous variant of :func:`load_model`.
+
+    The model is loaded on the executor configured with
+    :func:`mlflavors.utils.aio.configure`. The parameters are those of
+    :func:`load_model`.
+
+    :return: An pyod model.
+    """
+    return await run_blocking(load_model, model_uri, dst_path=dst_path)
+
+
+def _save_model(
+    model, path, serialization_format, compression=None, compression_level=None
+):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        joblib.dump(model, path)
+        return
 
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        dump_out_of_band(model, path)
+        return
 
-def _save_model(model, path, serialization_format):
-    with open(path, "wb") as out:
+    with open_model_file(path, "wb", compression, compression_level) as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             pickle.dump(model, out)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -402,7 +548,7 @@ def _save_model(model, path, serialization_format):
             )
 
 
-def _load_model(path, serialization_format):
+def _load_model(path, serialization_format, compression=None):
     if serialization_format not in SUPPORTED_SERIALIZATION_FORMATS:
         raise MlflowException(
             message=(
@@ -416,7 +562,15 @@ def _load_model(path, serialization_format):
             error_code=INVALID_PARAMETER_VALUE,
         )
 
-    with open(path, "rb") as pickled_model:
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        return joblib.load(path, mmap_mode="c")
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        return load_out_of_band(path)
+
+    with open_model_file(path, "rb", compression) as pickled_model:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             return pickle.load(pickled_model)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -434,6 +588,7 @@ def _load_pyfunc(path):
     """
     if os.path.isfile(path):
         serialization_format = SERIALIZATION_FORMAT_PICKLE
+        compression = None
         _logger.warning(
             "Loading procedure in older versions of MLflow using pickle.load()"
         )
@@ -445,12 +600,14 @@ def _load_pyfunc(path):
             serialization_format = pyod_flavor_conf.get(
                 "serialization_format", SERIALIZATION_FORMAT_PICKLE
             )
+            compression = pyod_flavor_conf.get("compression")
         except MlflowException:
             _logger.warning(
                 "Could not find pyod flavor configuration during model "
                 "loading process. Assuming 'pickle' serialization format."
             )
             serialization_format = SERIALIZATION_FORMAT_PICKLE
+            compression = None
 
         pyfunc_flavor_conf = _get_flavor_configuration(
             model_path=path, flavor_name=pyfunc.FLAVOR_NAME
@@ -458,7 +615,12 @@ def _load_pyfunc(path):
         path = os.path.join(path, pyfunc_flavor_conf["model_path"])
 
     return _PyODModelWrapper(
-        _load_model(path, serialization_format=serialization_format)
+        get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        )
     )
 
 
@@ -466,39 +628,77 @@ class _PyODModelWrapper:
     def __init__(self, pyod_model):
         self.pyod_model = pyod_model
 
-    def predict(self, dataframe) -> pd.DataFrame:
+    async def predict_async(self, dataframe, params=None) -> pd.DataFrame:
+        """
+        Asynchronous variant of ``predict``, run with :func:`run_blocking`.
+
+        :param dataframe: The prediction configuration ``Pandas DataFrame`` or the
+            features to score.
+        :param params: The inference parameters of ``predict``.
+        :return: The predictions of ``predict``.
+        """
+        return await run_blocking(self.predict, dataframe, params=params)
+
+    def predict(self, dataframe, params=None) -> pd.DataFrame:
         df_schema = dataframe.columns.values.tolist()
 
-        if len(dataframe) > 1:
-            raise MlflowException(
-                f"The provided prediction pd.DataFrame contains {len(dataframe)} rows. "
-                "Only 1 row should be supplied.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
+        if "X" in dataframe.columns:
+            if len(dataframe) > 1:
+                raise MlflowException(
+                    f"The provided prediction pd.DataFrame contains {len(dataframe)} "
+                    "rows. Only 1 row should be supplied.",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            attrs = {**(params or {}), **dataframe.to_dict(orient="index").get(0)}
+            X = attrs.get("X")
+        else:
+            attrs, X = _parse_feature_frame(dataframe, params)
 
-        attrs = dataframe.to_dict(orient="index").get(0)
-        X = attrs.get("X")
         predict_method = attrs.get("predict_method")
 
-        if isinstance(X, type(None)):
+        if isinstance(X, type(None)) or predict_method is None:
             raise MlflowException(
                 f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
                 do not contain the required column `X` for specifying the regressor \
-                values.",
+                values, nor is a `predict_method` provided for scoring the \
+                pd.DataFrame as feature matrix.",
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        if predict_method not in SUPPORTED_PYOD_PREDICT_METHODS:
-            raise MlflowException(
-                "Invalid `predict_method` value."
-                f"The supported prediction methods are \
-                {SUPPORTED_PYOD_PREDICT_METHODS}",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
+        # A list of predict methods returns the outputs of all of them, computing
+        # the outlier scores of `X` only once.
+        is_list = isinstance(predict_method, (list, tuple, np.ndarray))
+        predict_methods = list(predict_method) if is_list else [predict_method]
+        for method in predict_methods:
+            if method not in SUPPORTED_PYOD_PREDICT_METHODS:
+                raise MlflowException(
+                    "Invalid `predict_method` value."
+                    f"The supported prediction methods are \
+                    {SUPPORTED_PYOD_PREDICT_METHODS}",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+
+        chunk_size = attrs.get("chunk_size")
+        n_jobs = _validate_chunking(chunk_size, attrs.get("n_jobs", 1))
 
-        if isinstance(X, list):
-            X = np.array(X)
+        def predict(X):
+            if is_list:
+                return self._predict_methods(X, predict_methods, attrs)
+            return self._predict_method(X, predict_method, attrs)
 
+        # Scoring only reads the fitted detector, so concurrent predictions are not
+        # serialized.
+        with limit_threads():
+            if chunk_size is None:
+                if isinstance(X, list):
+                    X = np.array(X)
+                predictions = predict(X)
+            else:
+                predictions = _predict_in_chunks(predict, X, chunk_size, n_jobs)
+
+        return [predictions]
+
+    def _predict_method(self, X, predict_method, attrs):
         if predict_method == PYOD_DECISION_FUNCTION:
             predictions = self.pyod_model.decision_function(X)
 
@@ -518,4 +718,203 @@ class _PyODModelWrapper:
         if predict_method == PYOD_PREDICT_CONFIDENCE:
             predictions = self.pyod_model.predict_confidence(X)
 
-        return [predictions]
+        return predictions
+
+    def _predict_methods(self, X, predict_methods, attrs):
+        """
+        Return the outputs of several predict methods, keyed by method.
+
+        The outlier scores of ``X`` are computed once and the other outputs are
+        derived from them, unless the detector overrides the corresponding method.
+        """
+        model = self.pyod_model
+        return_confidence = attrs.get("return_confidence", False)
+        scores = model.decision_function(X)
+
+        outputs = {}
+        confidence = None
+        for predict_method in predict_methods:
+            if predict_method == PYOD_DECISION_FUNCTION:
+                outputs[predict_method] = scores
+                continue
+            if not _derives_from_scores(model, predict_method):
+                outputs[predict_method] = self._predict_method(X, predict_method, attrs)
+                continue
+
+            if confidence is None and (
+                return_confidence or predict_method == PYOD_PREDICT_CONFIDENCE
+            ):
+                confidence = _confidence_from_scores(model, scores)
+
+            if predict_method == PYOD_PREDICT_CONFIDENCE:
+                outputs[predict_method] = confidence
+                continue
+            if predict_method == PYOD_PREDICT:
+                output = _labels_from_scores(model, scores)
+            if predict_method == PYOD_PREDICT_PROBA:
+                output = _proba_from_scores(
+                    model, scores, attrs.get("method", "linear")
+                )
+            outputs[predict_method] = (
+                (output, confidence) if return_confidence else output
+            )
+
+        return outputs
+
+
+def _parse_feature_frame(dataframe, params):
+    """
+    Split a pd.DataFrame holding the feature matrix into options and features.
+
+    Options are taken from ``params`` or, if not provided there, from the first row
+    of the reserved option columns, which are excluded from the features.
+    """
+    attrs = dict(params or {})
+    reserved = [column for column in dataframe.columns if column in PYOD_OPTIONS]
+    if reserved:
+        for column in reserved:
+            attrs.setdefault(column, dataframe[column].iloc[0])
+        dataframe = dataframe.drop(columns=reserved)
+    if attrs.get("predict_method") is None or dataframe.shape[1] == 0:
+        return attrs, None
+    # A pd.DataFrame whose columns share one numeric dtype is converted without copy.
+    return attrs, dataframe.to_numpy()
+
+
+def _validate_chunking(chunk_size, n_jobs):
+    """Validate the chunking options and return the resolved number of threads."""
+    if chunk_size is not None and (
+        not isinstance(chunk_size, (int, np.integer)) or chunk_size <= 0
+    ):
+        raise MlflowException(
+            f"Invalid `chunk_size` value {chunk_size}. It must be a positive integer.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    resolved_n_jobs = resolve_n_jobs(n_jobs)
+    # Without chunks there is a single batch to score, so ``n_jobs`` would be ignored.
+    if n_jobs != 1 and chunk_size is None:
+        raise MlflowException(
+            "`n_jobs` can only be provided in combination with `chunk_size`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return resolved_n_jobs
+
+
+def _predict_in_chunks(predict, X, chunk_size, n_jobs):
+    """
+    Apply ``predict`` to consecutive chunks of ``X`` rows on ``n_jobs`` threads, a
+    number resolved by :func:`resolve_n_jobs`.
+
+    Only the chunks being scored are converted to arrays, and their outputs are
+    written into arrays allocated once for all rows.
+    """
+    n_rows = len(X)
+    bounds = [
+        (start, min(start + chunk_size, n_rows))
+        for start in range(0, n_rows, chunk_size)
+    ]
+
+    def predict_chunk(bound):
+        start, stop = bound
+        return predict(np.asarray(X[start:stop]))
+
+    if n_jobs == 1 or len(bounds) <= 1:
+        chunk_outputs = map(predict_chunk, bounds)
+        return _collect_chunks(bounds, chunk_outputs, n_rows)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        chunk_outputs = executor.map(predict_chunk, bounds)
+        return _collect_chunks(bounds, chunk_outputs, n_rows)
+
+
+def _collect_chunks(bounds, chunk_outputs, n_rows):
+    predictions = None
+    for (start, stop), output in zip(bounds, chunk_outputs):
+        if predictions is None:
+            predictions = _allocate_like(output, n_rows)
+        _write_chunk(predictions, output, start, stop)
+    return predictions
+
+
+def _allocate_like(output, n_rows):
+    # Outputs are arrays, tuples of arrays (``return_confidence``) or dictionaries
+    # of those (multiple predict methods).
+    if isinstance(output, dict):
+        return {key: _allocate_like(value, n_rows) for key, value in output.items()}
+    if isinstance(output, tuple):
+        return tuple(_allocate_like(value, n_rows) for value in output)
+    output = np.asarray(output)
+    return np.empty((n_rows,) + output.shape[1:], dtype=output.dtype)
+
+
+def _write_chunk(predictions, output, start, stop):
+    if isinstance(predictions, dict):
+        for key, value in predictions.items():
+            _write_chunk(value, output[key], start, stop)
+    elif isinstance(predictions, tuple):
+        for value, chunk in zip(predictions, output):
+            _write_chunk(value, chunk, start, stop)
+    else:
+        predictions[start:stop] = output
+
+
+def _derives_from_scores(model, predict_method):
+    """Return whether ``predict_method`` of ``model`` is the one of BaseDetector."""
+    from pyod.models.base import BaseDetector
+
+    return getattr(type(model), predict_method, None) is getattr(
+        BaseDetector, predict_method
+    )
+
+
+# The functions below reproduce ``BaseDetector.predict``, ``predict_proba`` and
+# ``predict_confidence`` for precomputed outlier scores.
+def _labels_from_scores(model, scores):
+    if isinstance(model.contamination, (float, int)):
+        return (scores > model.threshold_).astype("int").ravel()
+    # if this is a PyThresh object
+    return model.contamination.predict(scores)
+
+
+def _proba_from_scores(model, scores, method):
+    probs = np.zeros([scores.shape[0], int(model._classes)])
+    if method == "linear":
+        from sklearn.preprocessing import MinMaxScaler
+
+        scaler = MinMaxScaler().fit(model.decision_scores_.reshape(-1, 1))
+        probs[:, 1] = scaler.transform(scores.reshape(-1, 1)).ravel().clip(0, 1)
+    elif method == "unify":
+        from scipy.special import erf
+
+        pre_erf_score = (scores - model._mu) / (model._sigma * np.sqrt(2))
+        probs[:, 1] = erf(pre_erf_score).clip(0, 1).ravel()
+    else:
+        raise MlflowException(
+            f"Invalid `method` value {method}. The supported probability conversion "
+            "methods are ['linear', 'unify']",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    probs[:, 0] = 1 - probs[:, 1]
+    return probs
+
+
+def _confidence_from_scores(model, scores):
+    from scipy.stats import binom
+
+    n = len(model.decision_scores_)
+    # Number of training scores lower than or equal to each score.
+    n_instances = np.searchsorted(np.sort(model.decision_scores_), scores, "right")
+    posterior_prob = (1 + n_instances) / (2 + n)
+
+    # if this is a PyThresh object
+    if not isinstance(model.contamination, (float, int)):
+        contam = np.sum(model.labels_) / n
+    else:
+        contam = model.contamination
+
+    confidence = 1 - binom.cdf(n - int(n * contam), n, posterior_prob)
+    prediction = _labels_from_scores(model, scores)
+    np.place(confidence, prediction == 0, 1 - confidence[prediction == 0])
+    return confidence
@@ -73,10 +73,10 @@ sdv (native) format
 import logging
 import os
 import pickle
+from importlib import metadata
 
 import mlflow
 import pandas as pd
-import sdv
 import yaml
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
@@ -85,7 +85,6 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.docstring_utils import LOG_MODEL_PARAM_DOCS, format_docstring
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
@@ -108,6 +107,18 @@ from mlflow.utils.model_utils import (
 from mlflow.utils.requirements_utils import _get_pinned_requirement
 
 import mlflavors
+from mlflavors.utils.aio import run_blocking
+from mlflavors.utils.artifact_cache import download_model_artifacts
+from mlflavors.utils.model_cache import get_model_lock, get_or_load
+from mlflavors.utils.serialization import (
+    COMPRESSION_FILE_EXTENSIONS,
+    dump_out_of_band,
+    get_compression_pip_requirements,
+    load_out_of_band,
+    open_model_file,
+    validate_compression,
+)
+from mlflavors.utils.thread_budget import limit_threads
 
 FLAVOR_NAME = "sdv"
 
@@ -118,15 +129,19 @@ SUPPORTED_SDV_MODALITIES = [SDV_SINGLE_TABLE, SDV_MULTI_TABLE, SDV_SEQUENTIAL]
 
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
+SERIALIZATION_FORMAT_PICKLE5 = "pickle5"
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
     SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB,
+    SERIALIZATION_FORMAT_PICKLE5,
 ]
 
 _logger = logging.getLogger(__name__)
 
 
-def get_default_pip_requirements(include_cloudpickle=False):
+def get_default_pip_requirements(include_cloudpickle=False, include_joblib=False):
     """
     :return: A list of default pip requirements for MLflow Models produced by this
              flavor. Calls to :func:`save_model()` and :func:`log_model()` produce a pip
@@ -135,17 +150,21 @@ def get_default_pip_requirements(include_cloudpickle=False):
     pip_deps = [_get_pinned_requirement("sdv")]
     if include_cloudpickle:
         pip_deps += [_get_pinned_requirement("cloudpickle")]
+    if include_joblib:
+        pip_deps += [_get_pinned_requirement("joblib")]
 
     return pip_deps
 
 
-def get_default_conda_env(include_cloudpickle=False):
+def get_default_conda_env(include_cloudpickle=False, include_joblib=False):
     """
     :return: The default Conda environment for MLflow Models produced by calls to
              :func:`save_model()` and :func:`log_model()`.
     """
     return _mlflow_conda_env(
-        additional_pip_deps=get_default_pip_requirements(include_cloudpickle)
+        additional_pip_deps=get_default_pip_requirements(
+            include_cloudpickle, include_joblib
+        )
     )
 
 
@@ -161,6 +180,8 @@ def save_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
 ):
     """
     Save an sdv model to a path on the local file system. Produces an MLflow Model
@@ -198,7 +219,22 @@ def save_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
     """  # noqa: E501
     _validate_env_arguments(conda_env, pip_requirements, extra_pip_requirements)
 
@@ -215,6 +251,8 @@ def save_model(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
+    validate_compression(compression, serialization_format, compression_level)
+
     _validate_and_prepare_target_save_path(path)
     code_dir_subpath = _validate_and_copy_code_paths(code_paths, path)
 
@@ -226,8 +264,16 @@ def save_model(
         _save_example(mlflow_model, input_example, path)
 
     model_data_subpath = "model.pkl"
+    if compression is not None:
+        model_data_subpath += COMPRESSION_FILE_EXTENSIONS[compression]
     model_data_path = os.path.join(path, model_data_subpath)
-    _save_model(sdv_model, model_data_path, serialization_format=serialization_format)
+    _save_model(
+        sdv_model,
+        model_data_path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+    )
 
     pyfunc.add_to_model(
         mlflow_model,
@@ -241,8 +287,9 @@ def save_model(
     mlflow_model.add_flavor(
         FLAVOR_NAME,
         pickled_model=model_data_subpath,
-        sdv_version=sdv.__version__,
+        sdv_version=metadata.version("sdv"),
         serialization_format=serialization_format,
+        compression=compression,
         code=code_dir_subpath,
     )
     mlflow_model.save(os.path.join(path, MLMODEL_FILE_NAME))
@@ -252,7 +299,11 @@ def save_model(
             include_cloudpickle = (
                 serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE
             )
-            default_reqs = get_default_pip_requirements(include_cloudpickle)
+            include_joblib = serialization_format == SERIALIZATION_FORMAT_JOBLIB
+            default_reqs = get_default_pip_requirements(
+                include_cloudpickle, include_joblib
+            )
+            default_reqs += get_compression_pip_requirements(compression)
             # To ensure `_load_pyfunc` can successfully load the model during the
             # dependency inference, `mlflow_model.save` must be called beforehand
             # to save an MLmodel file.
@@ -294,6 +345,8 @@ def log_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
     **kwargs,
 ):
     """
@@ -337,7 +390,22 @@ def log_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
 
     :return: A :py:class:`ModelInfo` instance that contains the metadata of the logged
         model.
@@ -355,6 +423,8 @@ def log_model(
         pip_requirements=pip_requirements,
         extra_pip_requirements=extra_pip_requirements,
         serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
         **kwargs,
     )
 
@@ -362,6 +432,10 @@ def log_model(
 def load_model(model_uri, dst_path=None):
     """
     Load an sdv model from a local file or a run.
+    If the artifact cache is enabled (see :mod:`mlflavors.utils.artifact_cache`), the
+    model directory is downloaded through the cache.
+    If the model cache is enabled (see :mod:`mlflavors.utils.model_cache`), the
+    returned model is shared with other callers loading the same model file.
 
     :param model_uri: The location, in URI format, of the MLflow model, for example:
 
@@ -382,24 +456,52 @@ def load_model(model_uri, dst_path=None):
 
     :return: An sdv model.
     """
-    local_model_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path
-    )
-    flavor_conf = _get_flavor_configuration(
-        model_path=local_model_path, flavor_name=FLAVOR_NAME
-    )
-    _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
-    sdv_model_file_path = os.path.join(local_model_path, flavor_conf["pickled_model"])
-    serialization_format = flavor_conf.get(
-        "serialization_format", SERIALIZATION_FORMAT_PICKLE
-    )
-    return _load_model(
-        path=sdv_model_file_path, serialization_format=serialization_format
-    )
+    with download_model_artifacts(model_uri, output_path=dst_path) as local_model_path:
+        flavor_conf = _get_flavor_configuration(
+            model_path=local_model_path, flavor_name=FLAVOR_NAME
+        )
+        _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
+        sdv_model_file_path = os.path.join(
+            local_model_path, flavor_conf["pickled_model"]
+        )
+        serialization_format = flavor_conf.get(
+            "serialization_format", SERIALIZATION_FORMAT_PICKLE
+        )
+        return get_or_load(
+            _load_model,
+            path=sdv_model_file_path,
+            serialization_format=serialization_format,
+            compression=flavor_conf.get("compression"),
+        )
 
 
-def _save_model(model, path, serialization_format):
-    with open(path, "wb") as out:
+async def load_model_async(model_uri, dst_path=None):
+    """
+    Asynchronous variant of :func:`load_model`.
+
+    The model is loaded on the executor configured with
+    :func:`mlflavors.utils.aio.configure`. The parameters are those of
+    :func:`load_model`.
+
+    :return: An sdv model.
+    """
+    return await run_blocking(load_model, model_uri, dst_path=dst_path)
+
+
+def _save_model(
+    model, path, serialization_format, compression=None, compression_level=None
+):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        joblib.dump(model, path)
+        return
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        dump_out_of_band(model, path)
+        return
+
+    with open_model_file(path, "wb", compression, compression_level) as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             pickle.dump(model, out)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -416,7 +518,7 @@ def _save_model(model, path, serialization_format):
             )
 
 
-def _load_model(path, serialization_format):
+def _load_model(path, serialization_format, compression=None):
     if serialization_format not in SUPPORTED_SERIALIZATION_FORMATS:
         raise MlflowException(
             message=(
@@ -430,7 +532,15 @@ def _load_model(path, serialization_format):
             error_code=INVALID_PARAMETER_VALUE,
         )
 
-    with open(path, "rb") as pickled_model:
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        return joblib.load(path, mmap_mode="c")
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        return load_out_of_band(path)
+
+    with open_model_file(path, "rb", compression) as pickled_model:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             return pickle.load(pickled_model)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -448,6 +558,7 @@ def _load_pyfunc(path):
     """
     if os.path.isfile(path):
         serialization_format = SERIALIZATION_FORMAT_PICKLE
+        compression = None
         _logger.warning(
             "Loading procedure in older versions of MLflow using pickle.load()"
         )
@@ -459,12 +570,14 @@ def _load_pyfunc(path):
             serialization_format = sdv_flavor_conf.get(
                 "serialization_format", SERIALIZATION_FORMAT_PICKLE
             )
+            compression = sdv_flavor_conf.get("compression")
         except MlflowException:
             _logger.warning(
                 "Could not find sdv flavor configuration during model "
                 "loading process. Assuming 'pickle' serialization format."
             )
             serialization_format = SERIALIZATION_FORMAT_PICKLE
+            compression = None
 
         pyfunc_flavor_conf = _get_flavor_configuration(
             model_path=path, flavor_name=pyfunc.FLAVOR_NAME
@@ -472,13 +585,28 @@ def _load_pyfunc(path):
         path = os.path.join(path, pyfunc_flavor_conf["model_path"])
 
     return _SDVModelWrapper(
-        _load_model(path, serialization_format=serialization_format)
+        get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        )
     )
 
 
 class _SDVModelWrapper:
     def __init__(self, sdv_model):
         self.sdv_model = sdv_model
+        self._lock = get_model_lock(sdv_model)
+
+    async def predict_async(self, dataframe) -> pd.DataFrame:
+        """
+        Asynchronous variant of ``predict``, run with :func:`run_blocking`.
+
+        :param dataframe: The prediction configuration ``Pandas DataFrame``.
+        :return: The predictions of ``predict``.
+        """
+        return await run_blocking(self.predict, dataframe)
 
     def predict(self, dataframe) -> pd.DataFrame:
         if len(dataframe) > 1:
@@ -499,29 +627,32 @@ class _SDVModelWrapper:
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        if modality == SDV_SINGLE_TABLE:
-            num_rows = attrs.get("num_rows")
-            batch_size = attrs.get("batch_size", num_rows)
-            max_tries_per_batch = attrs.get("max_tries_per_batch", 100)
-            output_file_path = attrs.get("output_file_path", None)
-
-            predictions = self.sdv_model.sample(
-                num_rows=num_rows,
-                batch_size=batch_size,
-                max_tries_per_batch=max_tries_per_batch,
-                output_file_path=output_file_path,
-            )
+        # Sampling advances the random state of the synthesizer, so calls are
+        # serialized.
+        with self._lock, limit_threads():
+            if modality == SDV_SINGLE_TABLE:
+                num_rows = attrs.get("num_rows")
+                batch_size = attrs.get("batch_size", num_rows)
+                max_tries_per_batch = attrs.get("max_tries_per_batch", 100)
+                output_file_path = attrs.get("output_file_path", None)
+
+                predictions = self.sdv_model.sample(
+                    num_rows=num_rows,
+                    batch_size=batch_size,
+                    max_tries_per_batch=max_tries_per_batch,
+                    output_file_path=output_file_path,
+                )
 
-        if modality == SDV_MULTI_TABLE:
-            scale = attrs.get("scale", 1.0)
-            predictions = [self.sdv_model.sample(scale=scale)]
+            if modality == SDV_MULTI_TABLE:
+                scale = attrs.get("scale", 1.0)
+                predictions = [self.sdv_model.sample(scale=scale)]
 
-        if modality == SDV_SEQUENTIAL:
-            num_sequences = attrs.get("num_sequences")
-            sequence_length = attrs.get("sequence_length", None)
-            predictions = self.sdv_model.sample(
-                num_sequences=num_sequences,
-                sequence_length=sequence_length,
-            )
+            if modality == SDV_SEQUENTIAL:
+                num_sequences = attrs.get("num_sequences")
+                sequence_length = attrs.get("sequence_length", None)
+                predictions = self.sdv_model.sample(
+                    num_sequences=num_sequences,
+                    sequence_length=sequence_length,
+                )
 
         return predictions
@@ -14,9 +14,9 @@ sktime (native) format
     Produced for use by generic pyfunc-based deployment tools and batch inference.
 
     The interface for utilizing a sktime model loaded as a ``pyfunc`` type for
-    generating forecast predictions uses a *single-row* ``Pandas DataFrame``
-    configuration argument. The following columns in this configuration
-    ``Pandas DataFrame`` are supported:
+    generating forecast predictions uses a ``Pandas DataFrame`` configuration
+    argument, where each row configures one prediction. The following columns in this
+    configuration ``Pandas DataFrame`` are supported:
 
     .. list-table::
       :widths: 15 10 15
@@ -61,6 +61,40 @@ sktime (native) format
         - | If True, computes covariance matrix forecast.
           | Can only be provided in combination with predict method ``predict_var``.
           | (Default: ``False``)
+      * - update_y
+        - list (optional)
+        - | New observations of the target series. If provided, the in-memory model
+          | is updated with sktime's ``update`` method before predicting, which
+          | moves the cutoff of the model to the last new observation.
+          | (Default: ``None``)
+      * - update_index
+        - list (optional)
+        - | Time index of the new observations ``update_y``.
+          | (Default: ``None``, the periods following the cutoff of the model)
+      * - update_X
+        - numpy ndarray or list (optional)
+        - | Exogenous regressor of the new observations ``update_y``.
+          | (Default: ``None``)
+      * - update_params
+        - bool (optional)
+        - | Whether to update the model parameters as well, passed to ``update``.
+          | (Default: ``False``)
+      * - update_in_place
+        - bool (optional)
+        - | Whether to update the loaded model in place, which other pyfunc models
+          | sharing it through :mod:`mlflavors.utils.model_cache` then also see.
+          | Otherwise the first update of a pyfunc model applies to a copy of the
+          | loaded model, which is kept and updated by its later updates, including
+          | those with ``update_in_place``.
+          | (Default: ``False``)
+      * - persist_label
+        - str (optional)
+        - | Relative directory under the ``persist_root`` of the pyfunc model to save
+          | each updated model to as new version, an MLflow Model in the next
+          | numbered subdirectory (``1``, ``2``, ...), with the serialization
+          | settings and requirements of the loaded model. Requires a
+          | ``persist_root``, see below.
+          | (Default: ``None``)
 
 An example configuration for the ``pyfunc`` predict of a sktime model is shown below,
 using an interval forecast with nominal coverage value ``[0.9,0.95]``, a future forecast
@@ -71,15 +105,52 @@ Index  predict_method    coverage     fh
 ====== ================= ============ ========
 0      predict_interval  [0.9,0.95]   [1,2,3]
 ====== ================= ============ ========
+
+A configuration with multiple rows returns the predictions of all rows, concatenated
+with the index of the configuration row as the outer index level. Rows using the same
+predict method and exogenous regressor are evaluated with a single call of the predict
+method over the union of their ``fh``, ``coverage`` and ``alpha`` values:
+
+====== ================= ============ ========
+Index  predict_method    coverage     fh
+====== ================= ============ ========
+0      predict
+1      predict_interval  0.8          [1,2]
+2      predict_interval  [0.9,0.95]   [1,2,3]
+====== ================= ============ ========
+
+Rows with ``update_y`` update the in-memory model in the order of the rows, before the
+predictions of all rows of the configuration are computed with the updated model. The
+updates apply to a copy of the loaded model owned by the pyfunc model, unless
+``update_in_place`` is set, in which case they apply to every user of the loaded
+model, including other pyfunc models sharing it through
+:mod:`mlflavors.utils.model_cache`.
+
+Persisting updated models is disabled unless a root directory is set, either with
+``persist_root`` of :func:`save_model` or when loading the pyfunc model::
+
+    mlflow.pyfunc.load_model(model_uri, model_config={"persist_root": "/srv/updates"})
+
+A ``persist_label`` is resolved under that root, and labels that are absolute or
+resolve outside of it are rejected. The updated model is copied when the row is
+applied and saved after the predictions, without blocking other predictions of the
+model.
+
+If the model was saved with ``forecast_table_horizon``, rows of the methods
+``predict``, ``predict_interval`` and ``predict_quantiles`` without exogenous regressor,
+whose relative ``fh`` lies within that horizon and whose ``coverage`` or ``alpha``
+values are stored in the forecast table, are answered by slicing the precomputed
+table instead of calling the model, as long as the model was not updated.
 """  # noqa: E501
+import copy
 import logging
 import os
 import pickle
+from importlib import metadata
 
 import mlflow
 import numpy as np
 import pandas as pd
-import sktime
 import yaml
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
@@ -88,7 +159,6 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.docstring_utils import LOG_MODEL_PARAM_DOCS, format_docstring
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
@@ -109,9 +179,26 @@ from mlflow.utils.model_utils import (
     _validate_and_prepare_target_save_path,
 )
 from mlflow.utils.requirements_utils import _get_pinned_requirement
-from sktime.utils.multiindex import flatten_multiindex
 
 import mlflavors
+from mlflavors.utils.aio import run_blocking
+from mlflavors.utils.artifact_cache import download_model_artifacts
+from mlflavors.utils.forecast_table import (
+    FORECAST_TABLE_DIR,
+    load_forecast_tables,
+    save_forecast_tables,
+)
+from mlflavors.utils.model_cache import get_model_lock, get_or_load
+from mlflavors.utils.result_cache import config_key, create_result_cache
+from mlflavors.utils.serialization import (
+    COMPRESSION_FILE_EXTENSIONS,
+    dump_out_of_band,
+    get_compression_pip_requirements,
+    load_out_of_band,
+    open_model_file,
+    validate_compression,
+)
+from mlflavors.utils.thread_budget import limit_threads
 
 FLAVOR_NAME = "sktime"
 
@@ -128,15 +215,19 @@ SUPPORTED_SKTIME_PREDICT_METHODS = [
 
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
+SERIALIZATION_FORMAT_PICKLE5 = "pickle5"
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
     SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB,
+    SERIALIZATION_FORMAT_PICKLE5,
 ]
 
 _logger = logging.getLogger(__name__)
 
 
-def get_default_pip_requirements(include_cloudpickle=False):
+def get_default_pip_requirements(include_cloudpickle=False, include_joblib=False):
     """
     :return: A list of default pip requirements for MLflow Models produced by this
              flavor. Calls to :func:`save_model()` and :func:`log_model()` produce a pip
@@ -145,17 +236,21 @@ def get_default_pip_requirements(include_cloudpickle=False):
     pip_deps = [_get_pinned_requirement("sktime")]
     if include_cloudpickle:
         pip_deps += [_get_pinned_requirement("cloudpickle")]
+    if include_joblib:
+        pip_deps += [_get_pinned_requirement("joblib")]
 
     return pip_deps
 
 
-def get_default_conda_env(include_cloudpickle=False):
+def get_default_conda_env(include_cloudpickle=False, include_joblib=False):
     """
     :return: The default Conda environment for MLflow Models produced by calls to
              :func:`save_model()` and :func:`log_model()`.
     """
     return _mlflow_conda_env(
-        additional_pip_deps=get_default_pip_requirements(include_cloudpickle)
+        additional_pip_deps=get_default_pip_requirements(
+            include_cloudpickle, include_joblib
+        )
     )
 
 
@@ -171,6 +266,12 @@ def save_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    forecast_table_horizon=None,
+    forecast_table_coverage=None,
+    forecast_table_alpha=None,
+    persist_root=None,
 ):
     """
     Save a sktime model to a path on the local file system. Produces an MLflow Model
@@ -215,7 +316,41 @@ def save_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param forecast_table_horizon: If specified, the point forecasts of the relative
+        horizon ``[1, ..., forecast_table_horizon]`` are precomputed and stored as
+        Arrow table with the model (see :mod:`mlflavors.utils.forecast_table`). The
+        ``pyfunc`` model answers requests without exogenous regressor whose ``fh``
+        lies within this horizon by slicing the table instead of calling the model.
+        Requires a model fitted without exogenous regressor. (Default: ``None``)
+    :param forecast_table_coverage: A list of nominal coverage values for which the
+        ``predict_interval`` forecasts are precomputed. Requests with a subset of
+        these values are answered from the table. Requires
+        ``forecast_table_horizon``. (Default: ``None``)
+    :param forecast_table_alpha: A list of probabilities for which the
+        ``predict_quantiles`` forecasts are precomputed. Requests with a subset of
+        these values are answered from the table. Requires
+        ``forecast_table_horizon``. (Default: ``None``)
+    :param persist_root: Directory under which the pyfunc model saves updated models
+        requested with ``persist_label``. It is recorded as the ``persist_root``
+        entry of the pyfunc model configuration, which the ``model_config`` argument
+        of ``mlflow.pyfunc.load_model`` overrides. If ``None``, persisting updated
+        models is disabled unless the root is set at load time. (Default: ``None``)
     """
     _validate_env_arguments(conda_env, pip_requirements, extra_pip_requirements)
 
@@ -229,6 +364,14 @@ def save_model(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
+    validate_compression(compression, serialization_format, compression_level)
+    _validate_forecast_table(
+        sktime_model,
+        forecast_table_horizon,
+        forecast_table_coverage,
+        forecast_table_alpha,
+    )
+
     _validate_and_prepare_target_save_path(path)
     code_dir_subpath = _validate_and_copy_code_paths(code_paths, path)
 
@@ -240,11 +383,31 @@ def save_model(
         _save_example(mlflow_model, input_example, path)
 
     model_data_subpath = "model.pkl"
+    if compression is not None:
+        model_data_subpath += COMPRESSION_FILE_EXTENSIONS[compression]
     model_data_path = os.path.join(path, model_data_subpath)
     _save_model(
-        sktime_model, model_data_path, serialization_format=serialization_format
+        sktime_model,
+        model_data_path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
     )
 
+    forecast_table = None
+    if forecast_table_horizon is not None:
+        forecast_table = {
+            "path": FORECAST_TABLE_DIR,
+            "horizon": forecast_table_horizon,
+            "coverage": _as_list(forecast_table_coverage),
+            "alpha": _as_list(forecast_table_alpha),
+            "cutoff": _cutoff(sktime_model),
+        }
+        save_forecast_tables(
+            _compute_forecast_tables(sktime_model, forecast_table),
+            os.path.join(path, FORECAST_TABLE_DIR),
+        )
+
     pyfunc.add_to_model(
         mlflow_model,
         loader_module="mlflavors.sktime",
@@ -252,13 +415,17 @@ def save_model(
         conda_env=_CONDA_ENV_FILE_NAME,
         python_env=_PYTHON_ENV_FILE_NAME,
         code=code_dir_subpath,
+        # The entry is always recorded, so that it can be set at load time.
+        model_config={"persist_root": persist_root},
     )
 
     mlflow_model.add_flavor(
         FLAVOR_NAME,
         pickled_model=model_data_subpath,
-        sktime_version=sktime.__version__,
+        sktime_version=metadata.version("sktime"),
         serialization_format=serialization_format,
+        compression=compression,
+        forecast_table=forecast_table,
         code=code_dir_subpath,
     )
     mlflow_model.save(os.path.join(path, MLMODEL_FILE_NAME))
@@ -268,7 +435,11 @@ def save_model(
             include_cloudpickle = (
                 serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE
             )
-            default_reqs = get_default_pip_requirements(include_cloudpickle)
+            include_joblib = serialization_format == SERIALIZATION_FORMAT_JOBLIB
+            default_reqs = get_default_pip_requirements(
+                include_cloudpickle, include_joblib
+            )
+            default_reqs += get_compression_pip_requirements(compression)
             inferred_reqs = mlflow.models.infer_pip_requirements(
                 path, FLAVOR_NAME, fallback=default_reqs
             )
@@ -305,6 +476,12 @@ def log_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    forecast_table_horizon=None,
+    forecast_table_coverage=None,
+    forecast_table_alpha=None,
+    persist_root=None,
     **kwargs,
 ):
     """
@@ -355,7 +532,41 @@ def log_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param forecast_table_horizon: If specified, the point forecasts of the relative
+        horizon ``[1, ..., forecast_table_horizon]`` are precomputed and stored as
+        Arrow table with the model (see :mod:`mlflavors.utils.forecast_table`). The
+        ``pyfunc`` model answers requests without exogenous regressor whose ``fh``
+        lies within this horizon by slicing the table instead of calling the model.
+        Requires a model fitted without exogenous regressor. (Default: ``None``)
+    :param forecast_table_coverage: A list of nominal coverage values for which the
+        ``predict_interval`` forecasts are precomputed. Requests with a subset of
+        these values are answered from the table. Requires
+        ``forecast_table_horizon``. (Default: ``None``)
+    :param forecast_table_alpha: A list of probabilities for which the
+        ``predict_quantiles`` forecasts are precomputed. Requests with a subset of
+        these values are answered from the table. Requires
+        ``forecast_table_horizon``. (Default: ``None``)
+    :param persist_root: Directory under which the pyfunc model saves updated models
+        requested with ``persist_label``. It is recorded as the ``persist_root``
+        entry of the pyfunc model configuration, which the ``model_config`` argument
+        of ``mlflow.pyfunc.load_model`` overrides. If ``None``, persisting updated
+        models is disabled unless the root is set at load time. (Default: ``None``)
 
     :return: A :py:class:`ModelInfo` instance that contains the metadata of the logged
         model.
@@ -373,6 +584,12 @@ def log_model(
         pip_requirements=pip_requirements,
         extra_pip_requirements=extra_pip_requirements,
         serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+        forecast_table_horizon=forecast_table_horizon,
+        forecast_table_coverage=forecast_table_coverage,
+        forecast_table_alpha=forecast_table_alpha,
+        persist_root=persist_root,
         **kwargs,
     )
 
@@ -380,6 +597,10 @@ def log_model(
 def load_model(model_uri, dst_path=None):
     """
     Load a sktime model from a local file or a run.
+    If the artifact cache is enabled (see :mod:`mlflavors.utils.artifact_cache`), the
+    model directory is downloaded through the cache.
+    If the model cache is enabled (see :mod:`mlflavors.utils.model_cache`), the
+    returned model is shared with other callers loading the same model file.
 
     :param model_uri: The location, in URI format, of the MLflow model, for example:
 
@@ -400,26 +621,52 @@ def load_model(model_uri, dst_path=None):
 
     :return: A sktime model.
     """  # noqa: E501
-    local_model_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path
-    )
-    flavor_conf = _get_flavor_configuration(
-        model_path=local_model_path, flavor_name=FLAVOR_NAME
-    )
-    _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
-    sktime_model_file_path = os.path.join(
-        local_model_path, flavor_conf["pickled_model"]
-    )
-    serialization_format = flavor_conf.get(
-        "serialization_format", SERIALIZATION_FORMAT_PICKLE
-    )
-    return _load_model(
-        path=sktime_model_file_path, serialization_format=serialization_format
-    )
+    with download_model_artifacts(model_uri, output_path=dst_path) as local_model_path:
+        flavor_conf = _get_flavor_configuration(
+            model_path=local_model_path, flavor_name=FLAVOR_NAME
+        )
+        _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
+        sktime_model_file_path = os.path.join(
+            local_model_path, flavor_conf["pickled_model"]
+        )
+        serialization_format = flavor_conf.get(
+            "serialization_format", SERIALIZATION_FORMAT_PICKLE
+        )
+        return get_or_load(
+            _load_model,
+            path=sktime_model_file_path,
+            serialization_format=serialization_format,
+            compression=flavor_conf.get("compression"),
+        )
+
+
+async def load_model_async(model_uri, dst_path=None):
+    """
+    Asynchronous variant of :func:`load_model`.
+
+    The model is loaded on the executor configured with
+    :func:`mlflavors.utils.aio.configure`. The parameters are those of
+    :func:`load_model`.
 
+    :return: A sktime model.
+    """
+    return await run_blocking(load_model, model_uri, dst_path=dst_path)
+
+
+def _save_model(
+    model, path, serialization_format, compression=None, compression_level=None
+):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
 
-def _save_model(model, path, serialization_format):
-    with open(path, "wb") as out:
+        joblib.dump(model, path)
+        return
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        dump_out_of_band(model, path)
+        return
+
+    with open_model_file(path, "wb", compression, compression_level) as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             pickle.dump(model, out)
         else:
@@ -428,8 +675,16 @@ def _save_model(model, path, serialization_format):
             cloudpickle.dump(model, out)
 
 
-def _load_model(path, serialization_format):
-    with open(path, "rb") as pickled_model:
+def _load_model(path, serialization_format, compression=None):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        return joblib.load(path, mmap_mode="c")
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        return load_out_of_band(path)
+
+    with open_model_file(path, "rb", compression) as pickled_model:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             return pickle.load(pickled_model)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -438,11 +693,14 @@ def _load_model(path, serialization_format):
             return cloudpickle.load(pickled_model)
 
 
-def _load_pyfunc(path):
+def _load_pyfunc(path, model_config=None):
     """
     Load PyFunc implementation. Called by ``pyfunc.load_model``.
 
     :param path: Local filesystem path to the MLflow Model with the sktime flavor.
+    :param model_config: The model configuration of ``pyfunc.load_model``. Its
+        ``persist_root`` entry sets the directory under which updated models can be
+        persisted.
     """
     try:
         sktime_flavor_conf = _get_flavor_configuration(
@@ -451,12 +709,31 @@ def _load_pyfunc(path):
         serialization_format = sktime_flavor_conf.get(
             "serialization_format", SERIALIZATION_FORMAT_PICKLE
         )
+        compression = sktime_flavor_conf.get("compression")
+        forecast_table = sktime_flavor_conf.get("forecast_table")
     except MlflowException:
         _logger.warning(
             "Could not find sktime flavor configuration during model "
             "loading process. Assuming 'pickle' serialization format."
         )
         serialization_format = SERIALIZATION_FORMAT_PICKLE
+        compression = None
+        forecast_table = None
+
+    forecast_tables = None
+    if forecast_table is not None:
+        forecast_tables = load_forecast_tables(
+            os.path.join(path, forecast_table["path"])
+        )
+
+    # Updated models are persisted with the settings of the loaded model.
+    save_kwargs = {
+        "serialization_format": serialization_format,
+        "compression": compression,
+    }
+    requirements_path = os.path.join(path, _REQUIREMENTS_FILE_NAME)
+    if os.path.isfile(requirements_path):
+        save_kwargs["pip_requirements"] = requirements_path
 
     pyfunc_flavor_conf = _get_flavor_configuration(
         model_path=path, flavor_name=pyfunc.FLAVOR_NAME
@@ -464,82 +741,548 @@ def _load_pyfunc(path):
     path = os.path.join(path, pyfunc_flavor_conf["model_path"])
 
     return _SktimeModelWrapper(
-        _load_model(path, serialization_format=serialization_format)
+        get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        ),
+        forecast_table=forecast_table,
+        forecast_tables=forecast_tables,
+        save_kwargs=save_kwargs,
+        persist_root=(model_config or {}).get("persist_root"),
     )
 
 
 class _SktimeModelWrapper:
-    def __init__(self, sktime_model):
+    def __init__(
+        self,
+        sktime_model,
+        forecast_table=None,
+        forecast_tables=None,
+        save_kwargs=None,
+        persist_root=None,
+    ):
         self.sktime_model = sktime_model
+        self.forecast_table = forecast_table
+        self.forecast_tables = forecast_tables
+        self.save_kwargs = save_kwargs or {}
+        self.persist_root = persist_root
+        self.result_cache = create_result_cache()
+        self._owns_model = False
+        # The lock of the loaded model is kept after copying it on update, so that
+        # a copy is never made while another pyfunc model updates the loaded model.
+        self._lock = get_model_lock(sktime_model)
+
+    async def predict_async(self, dataframe) -> pd.DataFrame:
+        """
+        Asynchronous variant of ``predict``, run with :func:`run_blocking`.
+
+        :param dataframe: The prediction configuration ``Pandas DataFrame``.
+        :return: The predictions of ``predict``.
+        """
+        return await run_blocking(self.predict, dataframe)
 
     def predict(self, dataframe) -> pd.DataFrame:
         df_schema = dataframe.columns.values.tolist()
 
-        if len(dataframe) > 1:
-            raise MlflowException(
-                f"The provided prediction pd.DataFrame contains {len(dataframe)} rows. "
-                "Only 1 row should be supplied.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-
         # Convert the configuration dataframe into a dictionary to simplify the
         # extraction of parameters passed to the sktime predcition methods.
-        attrs = dataframe.to_dict(orient="index").get(0)
-        predict_method = attrs.get("predict_method")
-
-        if not predict_method:
-            raise MlflowException(
-                f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
-                do not contain the required column `predict_method` for specifying the \
-                prediction method.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-
-        if predict_method not in SUPPORTED_SKTIME_PREDICT_METHODS:
-            raise MlflowException(
-                "Invalid `predict_method` value."
-                f"The supported prediction methods are \
-                {SUPPORTED_SKTIME_PREDICT_METHODS}",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-
-        # For inference parameters 'fh', 'X', 'coverage', 'alpha', and 'cov'
-        # the respective sktime default value is used if the value was not
-        # provided in the configuration dataframe.
-        fh = attrs.get("fh", None)
+        rows = [
+            _parse_config(attrs, df_schema)
+            for attrs in dataframe.to_dict(orient="records")
+        ]
+
+        persist_dirs = [
+            _persist_dir(self.persist_root, config["update"]["persist_label"])
+            for config in rows
+            if config["update"] is not None
+            and config["update"]["persist_label"] is not None
+        ]
+
+        predictions = [None] * len(rows)
+        updated_models = []
+        # Updates modify the model and sktime's predict methods store the forecasting
+        # horizon in it, so calls into the model are serialized.
+        with self._lock, limit_threads():
+            for config in rows:
+                if config["update"] is not None:
+                    updated_model = self._update(config["update"])
+                    if updated_model is not None:
+                        updated_models.append(updated_model)
+
+            # Rows whose configuration was predicted before at the current cutoff
+            # of the model are answered from the result cache, if it is enabled.
+            keys = None
+            if self.result_cache is not None:
+                cutoff = _cutoff(self.sktime_model)
+                keys = [
+                    config_key(dict(config, update=None, cutoff=cutoff))
+                    for config in rows
+                ]
+                predictions = [self.result_cache.get(key) for key in keys]
+            pending = [i for i, p in enumerate(predictions) if p is None]
+
+            # Compatible rows are evaluated with a single call of the sktime
+            # prediction method, whose output is sliced back into the predictions of
+            # each row.
+            for pending_group in _group_configs([rows[i] for i in pending]):
+                group = [pending[j] for j in pending_group]
+                merged = _merge_configs(group, rows)
+                table_config = self._table_config(merged)
+                if table_config is not None:
+                    # Rows covered by the precomputed forecast table are sliced out of
+                    # it like out of merged predictions.
+                    group_predictions = self.forecast_tables[merged["predict_method"]]
+                    for i in group:
+                        predictions[i] = _select_predictions(
+                            group_predictions,
+                            dict(rows[i], fh=_relative_steps(rows[i]["fh"])),
+                            table_config,
+                        )
+                    continue
+
+                group_predictions = self._predict_config(merged)
+                for i in group:
+                    predictions[i] = _select_predictions(
+                        group_predictions, rows[i], merged
+                    )
+
+            if keys is not None:
+                for i in pending:
+                    self.result_cache.put(keys[i], predictions[i])
+
+        for persist_dir, updated_model in zip(persist_dirs, updated_models):
+            version_path = _new_version_path(persist_dir)
+            save_model(updated_model, version_path, **self.save_kwargs)
+            _logger.info("Saved the updated sktime model to %s.", version_path)
+
+        if len(rows) == 1:
+            return predictions[0]
+
+        # The predictions of multi-row configurations are concatenated with the index
+        # of the configuration row as the outer index level.
+        return pd.concat(
+            [p.to_frame() if isinstance(p, pd.Series) else p for p in predictions],
+            keys=dataframe.index,
+            names=[dataframe.index.name or "row"],
+        )
 
-        # Any model that is trained with exogenous regressor elements will need
-        # to provide `X` entries as a numpy ndarray to the predict method.
-        X = attrs.get("X", None)
+    def _update(self, update):
+        """
+        Update the model with new observations.
+
+        :return: A copy of the updated model if it is to be persisted, else ``None``.
+        """
+        if not update["in_place"] and not self._owns_model:
+            # The loaded model may be shared with other pyfunc models.
+            self.sktime_model = copy.deepcopy(self.sktime_model)
+            self._owns_model = True
+        sktime_model = self.sktime_model
+        y = _update_series(sktime_model, update["y"], update["index"])
+        X = update["X"]
+        if X is not None:
+            X_columns = getattr(getattr(sktime_model, "_X", None), "columns", None)
+            X = pd.DataFrame(X, index=y.index, columns=X_columns)
+        sktime_model.update(y=y, X=X, update_params=update["update_params"])
+
+        if update["persist_label"] is not None:
+            # The model is saved after releasing the lock, from a copy of its state
+            # after this update.
+            return copy.deepcopy(sktime_model)
+        return None
+
+    def _table_config(self, config):
+        """Return the configuration of the forecast table if it covers ``config``."""
+        if self.forecast_table is None or config["X"] is not None:
+            return None
+        if self.forecast_table.get("cutoff") != _cutoff(self.sktime_model):
+            # The model was updated since the table was computed.
+            return None
+        predict_method = config["predict_method"]
+        if predict_method not in self.forecast_tables:
+            return None
+
+        horizon = self.forecast_table["horizon"]
+        steps = _relative_steps(config["fh"])
+        if steps is None or not all(1 <= h <= horizon for h in steps):
+            return None
+        if predict_method == SKTIME_PREDICT_INTERVAL and not set(
+            _as_list(config["coverage"])
+        ).issubset(self.forecast_table["coverage"]):
+            return None
+        if predict_method == SKTIME_PREDICT_QUANTILES and (
+            config["alpha"] is None
+            or not set(_as_list(config["alpha"])).issubset(self.forecast_table["alpha"])
+        ):
+            return None
+
+        return dict(
+            config,
+            fh=list(range(1, horizon + 1)),
+            coverage=self.forecast_table["coverage"],
+            alpha=self.forecast_table["alpha"],
+        )
 
-        # When the model is served via REST API the exogenous regressor must be
-        # provided as a list to the configuration DataFrame to be JSON serializable.
-        # Below we convert the list back to ndarray type as required by sktime
-        # predict methods.
-        if isinstance(X, list):
-            X = np.array(X)
+    def _predict_config(self, config):
+        predict_method = config["predict_method"]
+        fh = config["fh"]
+        X = config["X"]
 
         if predict_method == SKTIME_PREDICT:
             predictions = self.sktime_model.predict(fh=fh, X=X)
 
         if predict_method == SKTIME_PREDICT_INTERVAL:
-            coverage = attrs.get("coverage", 0.9)
             predictions = self.sktime_model.predict_interval(
-                fh=fh, X=X, coverage=coverage
+                fh=fh, X=X, coverage=config["coverage"]
             )
 
         if predict_method == SKTIME_PREDICT_QUANTILES:
-            alpha = attrs.get("alpha", None)
-            predictions = self.sktime_model.predict_quantiles(fh=fh, X=X, alpha=alpha)
+            predictions = self.sktime_model.predict_quantiles(
+                fh=fh, X=X, alpha=config["alpha"]
+            )
 
         if predict_method == SKTIME_PREDICT_VAR:
-            cov = attrs.get("cov", False)
-            predictions = self.sktime_model.predict_var(fh=fh, X=X, cov=cov)
-
-        # Methods predict_interval() and predict_quantiles() return a pandas
-        # MultiIndex column structure. As MLflow signature inference does not
-        # support MultiIndex column structure the columns must be flattened.
-        if predict_method in [SKTIME_PREDICT_INTERVAL, SKTIME_PREDICT_QUANTILES]:
-            predictions.columns = flatten_multiindex(predictions)
+            predictions = self.sktime_model.predict_var(fh=fh, X=X, cov=config["cov"])
 
         return predictions
+
+
+def _validate_forecast_table(sktime_model, horizon, coverage, alpha):
+    if horizon is None:
+        if coverage is not None or alpha is not None:
+            raise MlflowException(
+                message=(
+                    "`forecast_table_coverage` and `forecast_table_alpha` require "
+                    "`forecast_table_horizon`."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return
+
+    if not isinstance(horizon, int) or isinstance(horizon, bool) or horizon < 1:
+        raise MlflowException(
+            message=(
+                f"`forecast_table_horizon` must be a positive integer, got {horizon}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if getattr(sktime_model, "_X", None) is not None:
+        raise MlflowException(
+            message=(
+                "A forecast table can only be precomputed for a model fitted without "
+                "exogenous regressor."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
+def _compute_forecast_tables(sktime_model, forecast_table):
+    # sktime's predict methods store the forecasting horizon in the model, so the
+    # tables are computed on a copy to leave the caller's model untouched.
+    sktime_model = copy.deepcopy(sktime_model)
+    fh = list(range(1, forecast_table["horizon"] + 1))
+    tables = {SKTIME_PREDICT: sktime_model.predict(fh=fh)}
+    if forecast_table["coverage"] is not None:
+        tables[SKTIME_PREDICT_INTERVAL] = sktime_model.predict_interval(
+            fh=fh, coverage=forecast_table["coverage"]
+        )
+    if forecast_table["alpha"] is not None:
+        tables[SKTIME_PREDICT_QUANTILES] = sktime_model.predict_quantiles(
+            fh=fh, alpha=forecast_table["alpha"]
+        )
+    return tables
+
+
+def _cutoff(sktime_model):
+    """Return the cutoff of a fitted model as list of strings."""
+    cutoff = getattr(sktime_model, "cutoff", None)
+    if cutoff is None:
+        return None
+    if isinstance(cutoff, pd.Index):
+        return [str(value) for value in cutoff]
+    return [str(cutoff)]
+
+
+def _persist_dir(persist_root, persist_label):
+    """Resolve the ``persist_label`` of a configuration row under ``persist_root``."""
+    if persist_root is None:
+        raise MlflowException(
+            message=(
+                "`persist_label` requires the `persist_root` model configuration, "
+                "set with `save_model` or when loading the pyfunc model."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if (
+        not isinstance(persist_label, str)
+        or not persist_label
+        or os.path.isabs(persist_label)
+    ):
+        raise MlflowException(
+            message=(
+                f"Invalid `persist_label` {persist_label!r}. It must be a relative "
+                "path."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    root = os.path.realpath(persist_root)
+    # Symbolic links are resolved, so that they cannot lead out of the root either.
+    persist_dir = os.path.realpath(os.path.join(root, persist_label))
+    if persist_dir == root or os.path.commonpath([root, persist_dir]) != root:
+        raise MlflowException(
+            message=(
+                f"Invalid `persist_label` {persist_label!r}. It must resolve to a "
+                "directory under `persist_root`."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return persist_dir
+
+
+def _new_version_path(persist_path):
+    """Create and return the next numbered version directory of ``persist_path``."""
+    os.makedirs(persist_path, exist_ok=True)
+    versions = [int(name) for name in os.listdir(persist_path) if name.isdigit()]
+    version = max(versions, default=0) + 1
+    while True:
+        version_path = os.path.join(persist_path, str(version))
+        try:
+            # Creating the directory claims the version, also against other
+            # processes persisting to the same path.
+            os.mkdir(version_path)
+            return version_path
+        except FileExistsError:
+            version += 1
+
+
+def _update_series(sktime_model, y, index):
+    """Build the series of new observations ``y`` following the model's cutoff."""
+    from sktime.forecasting.base import ForecastingHorizon
+
+    y_train = getattr(sktime_model, "_y", None)
+    if index is None:
+        index = ForecastingHorizon(list(range(1, len(y) + 1))).to_absolute_index(
+            sktime_model.cutoff
+        )
+        if y_train is not None:
+            index = index.rename(y_train.index.name)
+    elif y_train is not None and isinstance(y_train.index, pd.PeriodIndex):
+        index = pd.PeriodIndex(index, freq=y_train.index.freq, name=y_train.index.name)
+    elif y_train is not None and isinstance(y_train.index, pd.DatetimeIndex):
+        index = pd.DatetimeIndex(index, name=y_train.index.name)
+    else:
+        index = pd.Index(index)
+
+    if len(index) != len(y):
+        raise MlflowException(
+            f"The number of new observations `update_y` ({len(y)}) does not match "
+            f"the length of `update_index` ({len(index)}).",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if np.ndim(y) == 2:
+        columns = y_train.columns if isinstance(y_train, pd.DataFrame) else None
+        return pd.DataFrame(y, index=index, columns=columns)
+    return pd.Series(
+        y, index=index, name=y_train.name if isinstance(y_train, pd.Series) else None
+    )
+
+
+def _relative_steps(fh):
+    """Return the steps of a relative forecasting horizon, or ``None``."""
+    from sktime.forecasting.base import ForecastingHorizon
+
+    if fh is None:
+        return None
+    if np.ndim(fh) == 1 and all(
+        isinstance(h, (int, np.integer)) and not isinstance(h, bool) for h in fh
+    ):
+        # Lists of integers are relative steps, other horizons are interpreted by
+        # sktime (e.g. an integer ``h`` as the steps ``1, ..., h``).
+        return [int(h) for h in fh]
+    try:
+        fh = ForecastingHorizon(fh)
+    except (TypeError, ValueError):
+        return None
+    if not fh.is_relative:
+        return None
+    return [int(h) for h in fh.to_pandas()]
+
+
+def _parse_config(attrs, df_schema):
+    """Validate a configuration row and fill in the sktime default values."""
+    predict_method = _none_if_missing(attrs.get("predict_method"))
+
+    if not predict_method:
+        raise MlflowException(
+            f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
+            do not contain the required column `predict_method` for specifying the \
+            prediction method.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    if predict_method not in SUPPORTED_SKTIME_PREDICT_METHODS:
+        raise MlflowException(
+            "Invalid `predict_method` value."
+            f"The supported prediction methods are \
+            {SUPPORTED_SKTIME_PREDICT_METHODS}",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    # For inference parameters 'fh', 'X', 'coverage', 'alpha', and 'cov'
+    # the respective sktime default value is used if the value was not
+    # provided in the configuration dataframe.
+    fh = _none_if_missing(attrs.get("fh", None))
+
+    # Any model that is trained with exogenous regressor elements will need
+    # to provide `X` entries as a numpy ndarray to the predict method.
+    X = _none_if_missing(attrs.get("X", None))
+
+    # When the model is served via REST API the exogenous regressor must be
+    # provided as a list to the configuration DataFrame to be JSON serializable.
+    # Below we convert the list back to ndarray type as required by sktime
+    # predict methods.
+    if isinstance(X, list):
+        X = np.array(X)
+
+    coverage = _none_if_missing(attrs.get("coverage", None))
+    cov = _none_if_missing(attrs.get("cov", None))
+    return {
+        "predict_method": predict_method,
+        "fh": fh,
+        "X": X,
+        "coverage": 0.9 if coverage is None else coverage,
+        "alpha": _none_if_missing(attrs.get("alpha", None)),
+        "cov": False if cov is None else cov,
+        "update": _parse_update(attrs),
+    }
+
+
+def _parse_update(attrs):
+    """Return the update of the model requested by a configuration row, or ``None``."""
+    y = _none_if_missing(attrs.get("update_y", None))
+    if y is None:
+        return None
+    update_params = _none_if_missing(attrs.get("update_params", None))
+    return {
+        "y": np.asarray(y),
+        "index": _none_if_missing(attrs.get("update_index", None)),
+        "X": _none_if_missing(attrs.get("update_X", None)),
+        "update_params": bool(update_params),
+        "in_place": bool(_none_if_missing(attrs.get("update_in_place", None))),
+        "persist_label": _none_if_missing(attrs.get("persist_label", None)),
+    }
+
+
+def _none_if_missing(value):
+    # Columns that are only set in some rows of a multi-row configuration are NaN in
+    # the other rows.
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def _as_list(value):
+    if value is None:
+        return None
+    return list(value) if isinstance(value, (list, tuple, np.ndarray)) else [value]
+
+
+def _is_compatible(config, other):
+    """Return whether two configuration rows can be evaluated with one call."""
+    if config["predict_method"] != other["predict_method"]:
+        return False
+    if (config["X"] is None) != (other["X"] is None):
+        return False
+    if config["X"] is not None and not np.array_equal(config["X"], other["X"]):
+        return False
+    if config["fh"] is None or other["fh"] is None:
+        if config["fh"] is not other["fh"]:
+            return False
+    elif not np.ndim(config["fh"]) or not np.ndim(other["fh"]):
+        # Only horizons given as lists of steps can be merged.
+        if not np.array_equal(config["fh"], other["fh"]):
+            return False
+    predict_method = config["predict_method"]
+    if predict_method == SKTIME_PREDICT_QUANTILES:
+        # Without `alpha` sktime uses its default quantiles.
+        return (config["alpha"] is None) == (other["alpha"] is None)
+    if predict_method == SKTIME_PREDICT_VAR:
+        # Covariance matrices cannot be sliced into smaller horizons.
+        return config["cov"] == other["cov"] and (
+            not config["cov"] or np.array_equal(config["fh"], other["fh"])
+        )
+    return True
+
+
+def _group_configs(rows):
+    groups = []
+    for i, config in enumerate(rows):
+        for group in groups:
+            if _is_compatible(rows[group[0]], config):
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+    return groups
+
+
+def _union(values):
+    return sorted(set().union(*(_as_list(value) for value in values)))
+
+
+def _merge_configs(group, rows):
+    configs = [rows[i] for i in group]
+    merged = dict(configs[0])
+    if len(configs) == 1:
+        return merged
+    if merged["fh"] is not None and np.ndim(merged["fh"]):
+        merged["fh"] = _union(config["fh"] for config in configs)
+    if merged["predict_method"] == SKTIME_PREDICT_INTERVAL:
+        merged["coverage"] = _union(config["coverage"] for config in configs)
+    if merged["predict_method"] == SKTIME_PREDICT_QUANTILES and merged["alpha"]:
+        merged["alpha"] = _union(config["alpha"] for config in configs)
+    return merged
+
+
+def _select_predictions(predictions, config, merged):
+    """Slice the predictions of a configuration row out of merged predictions."""
+    predict_method = config["predict_method"]
+
+    if config["fh"] is not None and np.ndim(config["fh"]):
+        # sktime returns the forecasts in the order of the sorted unique horizon, so
+        # the time points of the row follow from their positions in the merged one.
+        fh = sorted(set(_as_list(config["fh"])))
+        merged_fh = sorted(set(_as_list(merged["fh"])))
+        if fh != merged_fh:
+            times = predictions.index.get_level_values(-1)
+            positions = [merged_fh.index(h) for h in fh]
+            predictions = predictions[times.isin(times.unique()[positions])]
+
+    if predict_method == SKTIME_PREDICT_INTERVAL:
+        predictions = _select_columns(predictions, _as_list(config["coverage"]))
+    if predict_method == SKTIME_PREDICT_QUANTILES and config["alpha"] is not None:
+        predictions = _select_columns(predictions, _as_list(config["alpha"]))
+
+    # Methods predict_interval() and predict_quantiles() return a pandas
+    # MultiIndex column structure. As MLflow signature inference does not
+    # support MultiIndex column structure the columns must be flattened.
+    if predict_method in [SKTIME_PREDICT_INTERVAL, SKTIME_PREDICT_QUANTILES]:
+        from sktime.utils.multiindex import flatten_multiindex
+
+        predictions = predictions.copy()
+        predictions.columns = flatten_multiindex(predictions)
+
+    return predictions
+
+
+def _select_columns(predictions, values):
+    """Select the columns of coverage or alpha ``values`` in the requested order."""
+    # sktime orders the columns by variable, then by the requested values.
+    columns = predictions.columns
+    variables = list(dict.fromkeys(columns.get_level_values(0)))
+    selected = sorted(
+        (i for i, column in enumerate(columns) if column[1] in values),
+        key=lambda i: (variables.index(columns[i][0]), values.index(columns[i][1])),
+    )
+    return predictions.iloc[:, selected]
@@ -15,9 +15,9 @@ statsforecast (native) format
     Produced for use by generic pyfunc-based deployment tools and batch inference.
 
     The interface for utilizing an statsforecast model loaded as a ``pyfunc`` type for
-    generating forecast predictions uses a *single-row* ``Pandas DataFrame``
-    configuration argument. The following columns in this configuration
-    ``Pandas DataFrame`` are supported:
+    generating forecast predictions uses a ``Pandas DataFrame`` configuration
+    argument, where each row configures one prediction. The following columns in this
+    configuration ``Pandas DataFrame`` are supported:
 
     .. list-table::
       :widths: 15 10 15
@@ -27,11 +27,23 @@ statsforecast (native) format
         - Type
         - Description
       * - X
-        - numpy ndarray or list (optional)
+        - numpy ndarray, list or str (optional)
         - | Exogenous regressor for future time period events.
           | For more information, read the underlying library explanation:
           | https://nixtla.github.io/statsforecast/.
+          | A base64 encoded binary payload if ``X_format`` is provided, see
+          | :mod:`mlflavors.utils.payload`.
           | (Default: ``None``)
+      * - X_path
+        - str (optional)
+        - | Path to a local file holding the exogenous regressor as binary payload.
+          | (Default: ``None``)
+      * - X_format
+        - str (optional)
+        - | Format of the binary payload of the exogenous regressor, ``arrow`` or
+          | ``npy``. The column names and types are taken from the payload, so
+          | ``X_cols`` and ``X_dtypes`` are not needed.
+          | (Default: ``None``, inferred from the extension of ``X_path``)
       * - X_cols
         - list (optional)
         - | Column names of the exogenous regressor matrix
@@ -55,15 +67,74 @@ statsforecast (native) format
           | example, ``level=[95]`` means that the range of values should include the
           | actual future value with probability 95%.
           | (Default: ``None``)
+      * - unique_ids
+        - list (optional)
+        - | Identifiers of the series to forecast. If the model was saved with
+          | ``shard_size``, only the shards containing these series are loaded.
+          | (Default: ``None``, i.e. all series)
+      * - n_jobs
+        - int (optional)
+        - | The number of processes forecasting the series in parallel, ``-1`` meaning
+          | the number of CPUs available to the serving process, which is bounded by
+          | the CPU quota of its container. Overrides the ``n_jobs`` the model was
+          | trained with.
+          | (Default: ``None``, i.e. the ``n_jobs`` of the model, but at most the
+          | number of available CPUs)
+      * - y
+        - list (optional)
+        - | New history of a subset of the series as rows of ``unique_id``, ``ds`` and
+          | ``y`` values followed by the values of the in-sample exogenous regressors,
+          | if the model was fitted with any. If provided, the fitted parameters of
+          | these series are applied to the new history without refitting the model
+          | and ``h`` periods after the last ``ds`` of each series are forecasted. The
+          | series to forecast are those of ``y``, so ``unique_ids`` cannot be set. The
+          | exogenous regressor ``X`` then holds the future values for these series.
+          | (Default: ``None``)
+      * - y_cols
+        - list (optional)
+        - | Column names of the new history ``y``.
+          | (Default: ``None``, i.e. ``["unique_id", "ds", "y"]``)
+      * - y_dtypes
+        - list (optional)
+        - | Data types of the columns of the new history ``y``.
+          | (Default: ``None``, i.e. inferred)
+
+    A configuration with multiple rows returns the predictions of all rows,
+    concatenated with the index of the configuration row as the outer index level.
+    Rows without exogenous regressor are evaluated with a single ``predict`` call at
+    their maximum ``h``, with the union of their ``level`` and ``unique_ids`` values,
+    and each row's predictions are sliced out of its result. Rows with exogenous
+    regressor are only evaluated together if their configurations are identical.
+    Point forecasts equal those of separate calls, whereas the prediction intervals of
+    models approximating the forecast variance over the whole horizon (e.g.
+    ``AutoETS`` with multiplicative components) can differ slightly.
+
+    If the model was saved with ``forecast_table_horizon``, rows without exogenous
+    regressor with ``h`` up to that horizon and ``level`` values stored in the
+    forecast table are answered by slicing the precomputed table, with the same
+    caveat for the prediction intervals. Other rows are predicted by the model.
+
+    Rows with new history ``y`` are forecasted separately with the ``forward`` method
+    of the fitted model of each of their series, which only loads and evaluates these
+    series. Models without ``forward`` are only supported if they estimate no
+    parameters (``Naive``, ``SeasonalNaive``, ``WindowAverage``,
+    ``SeasonalWindowAverage``, ``HistoricAverage``, ``RandomWalkWithDrift`` and the
+    fixed-parameter ``SimpleExponentialSmoothing``, ``SeasonalExponentialSmoothing``,
+    ``CrostonClassic`` and ``CrostonSBA``), which are applied to the new history with
+    ``forecast``. Other models (e.g. ``SimpleExponentialSmoothingOptimized`` or
+    ``GARCH``) would be refitted by ``forecast`` and are rejected.
 """  # noqa: E501
+import copy
+import inspect
 import logging
 import os
 import pickle
+import threading
+from importlib import metadata
 
 import mlflow
 import numpy as np
 import pandas as pd
-import statsforecast
 import yaml
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
@@ -72,7 +143,6 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.docstring_utils import LOG_MODEL_PARAM_DOCS, format_docstring
 from mlflow.utils.environment import (
     _CONDA_ENV_FILE_NAME,
@@ -95,20 +165,59 @@ from mlflow.utils.model_utils import (
 from mlflow.utils.requirements_utils import _get_pinned_requirement
 
 import mlflavors
+from mlflavors.utils.aio import run_blocking
+from mlflavors.utils.artifact_cache import download_model_artifacts
+from mlflavors.utils.casting import build_frame
+from mlflavors.utils.cpu import available_cpus, resolve_n_jobs
+from mlflavors.utils.forecast_table import (
+    FORECAST_TABLE_DIR,
+    load_forecast_tables,
+    save_forecast_tables,
+)
+from mlflavors.utils.model_cache import get_model_lock, get_or_load
+from mlflavors.utils.payload import decode_frame, is_payload
+from mlflavors.utils.serialization import (
+    COMPRESSION_FILE_EXTENSIONS,
+    dump_out_of_band,
+    get_compression_pip_requirements,
+    load_out_of_band,
+    open_model_file,
+    validate_compression,
+)
+from mlflavors.utils.thread_budget import limit_threads
 
 FLAVOR_NAME = "statsforecast"
 
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
+SERIALIZATION_FORMAT_PICKLE5 = "pickle5"
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
     SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB,
+    SERIALIZATION_FORMAT_PICKLE5,
 ]
 
+# Models without ``forward`` whose ``forecast`` on new history does not estimate
+# parameters, so that it applies the saved configuration without refitting.
+_PARAMETER_FREE_MODELS = {
+    "Naive",
+    "SeasonalNaive",
+    "WindowAverage",
+    "SeasonalWindowAverage",
+    "HistoricAverage",
+    "RandomWalkWithDrift",
+    "SimpleExponentialSmoothing",
+    "SeasonalExponentialSmoothing",
+    "CrostonClassic",
+    "CrostonSBA",
+}
+
 _logger = logging.getLogger(__name__)
 
 
-def get_default_pip_requirements(include_cloudpickle=False):
+def get_default_pip_requirements(include_cloudpickle=False, include_joblib=False):
     """
     :return: A list of default pip requirements for MLflow Models produced by this
              flavor. Calls to :func:`save_model()` and :func:`log_model()` produce a pip
@@ -117,17 +226,21 @@ def get_default_pip_requirements(include_cloudpickle=False):
     pip_deps = [_get_pinned_requirement("statsforecast")]
     if include_cloudpickle:
         pip_deps += [_get_pinned_requirement("cloudpickle")]
+    if include_joblib:
+        pip_deps += [_get_pinned_requirement("joblib")]
 
     return pip_deps
 
 
-def get_default_conda_env(include_cloudpickle=False):
+def get_default_conda_env(include_cloudpickle=False, include_joblib=False):
     """
     :return: The default Conda environment for MLflow Models produced by calls to
              :func:`save_model()` and :func:`log_model()`.
     """
     return _mlflow_conda_env(
-        additional_pip_deps=get_default_pip_requirements(include_cloudpickle)
+        additional_pip_deps=get_default_pip_requirements(
+            include_cloudpickle, include_joblib
+        )
     )
 
 
@@ -143,6 +256,12 @@ def save_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    slim=False,
+    shard_size=None,
+    forecast_table_horizon=None,
+    forecast_table_level=None,
 ):
     """
     Save an statsforecast model to a path on the local file system. Produces an MLflow Model
@@ -180,7 +299,47 @@ def save_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param slim: If ``True``, the training data held by a fitted ``StatsForecast``
+        model (the grouped array of every series' history and the training
+        ``unique_id``/``ds`` index) is removed before serialization. The fitted
+        models and last timestamps of each series are kept, so ``predict`` returns
+        the same results, but the saved model can no longer be used with
+        ``forecast``, ``fit`` without a new ``df`` or ``forecast_fitted_values``.
+        The number of bytes removed is recorded in the flavor configuration as
+        ``slim_bytes_saved``. (Default: ``False``)
+    :param shard_size: If specified, the fitted models and training data of a fitted
+        ``StatsForecast`` model are split into shards of ``shard_size`` series each,
+        which are serialized separately next to a model file holding the remaining
+        state and the ``unique_id`` index of all series. Loading the model with
+        ``unique_ids`` (or predicting with a ``unique_ids`` column through pyfunc)
+        only deserializes the shards containing the requested series.
+        (Default: ``None``)
+    :param forecast_table_horizon: If specified, the forecasts of all series up to
+        horizon ``forecast_table_horizon`` are precomputed and stored as Arrow table
+        with the model (see :mod:`mlflavors.utils.forecast_table`). The ``pyfunc``
+        model answers requests without exogenous regressor with ``h`` up to this
+        horizon by slicing the table instead of calling the model. Requires a fitted
+        model that does not use exogenous regressors. (Default: ``None``)
+    :param forecast_table_level: A list of confidence levels of the prediction
+        intervals stored in the forecast table. Requests with a subset of these
+        levels are answered from the table. Requires ``forecast_table_horizon``.
+        (Default: ``None``)
     """  # noqa: E501
     _validate_env_arguments(conda_env, pip_requirements, extra_pip_requirements)
 
@@ -197,6 +356,36 @@ def save_model(
             error_code=INVALID_PARAMETER_VALUE,
         )
 
+    validate_compression(compression, serialization_format, compression_level)
+
+    if slim and not hasattr(statsforecast_model, "fitted_"):
+        raise MlflowException(
+            message=(
+                "Slim serialization requires a fitted StatsForecast model. Please call "
+                "`fit` before saving the model with `slim=True`."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    if shard_size is not None:
+        if not hasattr(statsforecast_model, "fitted_"):
+            raise MlflowException(
+                message=(
+                    "Sharded serialization requires a fitted StatsForecast model. "
+                    "Please call `fit` before saving the model with `shard_size`."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if not isinstance(shard_size, int) or shard_size < 1:
+            raise MlflowException(
+                message=f"`shard_size` must be a positive integer, got {shard_size}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+    _validate_forecast_table(
+        statsforecast_model, forecast_table_horizon, forecast_table_level
+    )
+
     _validate_and_prepare_target_save_path(path)
     code_dir_subpath = _validate_and_copy_code_paths(code_paths, path)
 
@@ -208,10 +397,57 @@ def save_model(
         _save_example(mlflow_model, input_example, path)
 
     model_data_subpath = "model.pkl"
+    if compression is not None:
+        model_data_subpath += COMPRESSION_FILE_EXTENSIONS[compression]
     model_data_path = os.path.join(path, model_data_subpath)
-    _save_model(
-        statsforecast_model, model_data_path, serialization_format=serialization_format
-    )
+    forecast_table = None
+    if forecast_table_horizon is not None:
+        # The table is computed before the training data is removed or sharded.
+        forecast_table = {
+            "path": FORECAST_TABLE_DIR,
+            "horizon": forecast_table_horizon,
+            "level": (
+                None
+                if forecast_table_level is None
+                else [
+                    level.item() if isinstance(level, np.generic) else level
+                    for level in forecast_table_level
+                ]
+            ),
+        }
+        save_forecast_tables(
+            {
+                "predict": statsforecast_model.predict(
+                    h=forecast_table_horizon, level=forecast_table["level"]
+                )
+            },
+            os.path.join(path, FORECAST_TABLE_DIR),
+        )
+    slim_bytes_saved = None
+    if slim:
+        statsforecast_model, slim_bytes_saved = _slim_model(statsforecast_model)
+        _logger.info(
+            "Removed %d bytes of training data from the statsforecast model.",
+            slim_bytes_saved,
+        )
+    n_shards = None
+    if shard_size is not None:
+        n_shards = _save_sharded_model(
+            statsforecast_model,
+            model_data_path,
+            shard_size,
+            serialization_format=serialization_format,
+            compression=compression,
+            compression_level=compression_level,
+        )
+    else:
+        _save_model(
+            statsforecast_model,
+            model_data_path,
+            serialization_format=serialization_format,
+            compression=compression,
+            compression_level=compression_level,
+        )
 
     pyfunc.add_to_model(
         mlflow_model,
@@ -225,8 +461,14 @@ def save_model(
     mlflow_model.add_flavor(
         FLAVOR_NAME,
         pickled_model=model_data_subpath,
-        statsforecast_version=statsforecast.__version__,
+        statsforecast_version=metadata.version("statsforecast"),
         serialization_format=serialization_format,
+        compression=compression,
+        slim=slim,
+        slim_bytes_saved=slim_bytes_saved,
+        shard_size=shard_size,
+        n_shards=n_shards,
+        forecast_table=forecast_table,
         code=code_dir_subpath,
     )
     mlflow_model.save(os.path.join(path, MLMODEL_FILE_NAME))
@@ -236,7 +478,11 @@ def save_model(
             include_cloudpickle = (
                 serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE
             )
-            default_reqs = get_default_pip_requirements(include_cloudpickle)
+            include_joblib = serialization_format == SERIALIZATION_FORMAT_JOBLIB
+            default_reqs = get_default_pip_requirements(
+                include_cloudpickle, include_joblib
+            )
+            default_reqs += get_compression_pip_requirements(compression)
             # To ensure `_load_pyfunc` can successfully load the model during the
             # dependency inference, `mlflow_model.save` must be called beforehand
             # to save an MLmodel file.
@@ -278,6 +524,12 @@ def log_model(
     pip_requirements=None,
     extra_pip_requirements=None,
     serialization_format=SERIALIZATION_FORMAT_PICKLE,
+    compression=None,
+    compression_level=None,
+    slim=False,
+    shard_size=None,
+    forecast_table_horizon=None,
+    forecast_table_level=None,
     **kwargs,
 ):
     """
@@ -321,7 +573,47 @@ def log_model(
     :param pip_requirements: {{ pip_requirements }}
     :param extra_pip_requirements: {{ extra_pip_requirements }}
     :param serialization_format: The format in which to serialize the model. This should
-        be one of the formats "pickle" or "cloudpickle"
+        be one of the formats "pickle", "cloudpickle", "joblib" or "pickle5". The
+        "joblib" format stores NumPy arrays as uncompressed buffers which are
+        memory-mapped (copy-on-write) on load, so that processes serving the same
+        model share a single copy of the arrays through the page cache. The "pickle5"
+        format pickles with protocol 5 and writes out-of-band buffers as raw sidecar
+        files next to the pickle file, which are memory-mapped on load so that large
+        arrays are not copied out of the pickle stream.
+    :param compression: The codec used to compress the serialized model. This should
+        be one of "zstd", "lz4" or "gzip", or ``None`` (default) for no compression.
+        The "zstd" and "lz4" codecs require the ``zstandard`` and ``lz4`` packages
+        respectively, and "zstd" compresses using all available cores. Compression
+        can only be combined with the "pickle" and "cloudpickle" serialization
+        formats.
+    :param compression_level: The compression level passed to the codec, between 0
+        and 9 for "gzip", 0 and 16 for "lz4" and -131072 and 22 for "zstd". Requires
+        ``compression``. If ``None``, the default level of the codec is used.
+    :param slim: If ``True``, the training data held by a fitted ``StatsForecast``
+        model (the grouped array of every series' history and the training
+        ``unique_id``/``ds`` index) is removed before serialization. The fitted
+        models and last timestamps of each series are kept, so ``predict`` returns
+        the same results, but the saved model can no longer be used with
+        ``forecast``, ``fit`` without a new ``df`` or ``forecast_fitted_values``.
+        The number of bytes removed is recorded in the flavor configuration as
+        ``slim_bytes_saved``. (Default: ``False``)
+    :param shard_size: If specified, the fitted models and training data of a fitted
+        ``StatsForecast`` model are split into shards of ``shard_size`` series each,
+        which are serialized separately next to a model file holding the remaining
+        state and the ``unique_id`` index of all series. Loading the model with
+        ``unique_ids`` (or predicting with a ``unique_ids`` column through pyfunc)
+        only deserializes the shards containing the requested series.
+        (Default: ``None``)
+    :param forecast_table_horizon: If specified, the forecasts of all series up to
+        horizon ``forecast_table_horizon`` are precomputed and stored as Arrow table
+        with the model (see :mod:`mlflavors.utils.forecast_table`). The ``pyfunc``
+        model answers requests without exogenous regressor with ``h`` up to this
+        horizon by slicing the table instead of calling the model. Requires a fitted
+        model that does not use exogenous regressors. (Default: ``None``)
+    :param forecast_table_level: A list of confidence levels of the prediction
+        intervals stored in the forecast table. Requests with a subset of these
+        levels are answered from the table. Requires ``forecast_table_horizon``.
+        (Default: ``None``)
 
     :return: A :py:class:`ModelInfo` instance that contains the metadata of the logged
         model.
@@ -339,13 +631,23 @@ def log_model(
         pip_requirements=pip_requirements,
         extra_pip_requirements=extra_pip_requirements,
         serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+        slim=slim,
+        shard_size=shard_size,
+        forecast_table_horizon=forecast_table_horizon,
+        forecast_table_level=forecast_table_level,
         **kwargs,
     )
 
 
-def load_model(model_uri, dst_path=None):
+def load_model(model_uri, dst_path=None, unique_ids=None):
     """
     Load an statsforecast model from a local file or a run.
+    If the artifact cache is enabled (see :mod:`mlflavors.utils.artifact_cache`), the
+    model directory is downloaded through the cache.
+    If the model cache is enabled (see :mod:`mlflavors.utils.model_cache`), the
+    returned model is shared with other callers loading the same model file.
 
     :param model_uri: The location, in URI format, of the MLflow model, for example:
 
@@ -363,29 +665,310 @@ def load_model(model_uri, dst_path=None):
     :param dst_path: The local filesystem path to which to download the model artifact.
                      This directory must already exist. If unspecified, a local output
                      path will be created.
+    :param unique_ids: Identifiers of the series to load. If specified, the returned
+                       model only contains the fitted models of these series. For
+                       models saved with ``shard_size``, only the shards containing
+                       these series are deserialized. (Default: ``None``, i.e. all
+                       series)
 
     :return: An statsforecast model.
     """
-    local_model_path = _download_artifact_from_uri(
-        artifact_uri=model_uri, output_path=dst_path
+    with download_model_artifacts(model_uri, output_path=dst_path) as local_model_path:
+        flavor_conf = _get_flavor_configuration(
+            model_path=local_model_path, flavor_name=FLAVOR_NAME
+        )
+        _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
+        statsforecast_model_file_path = os.path.join(
+            local_model_path, flavor_conf["pickled_model"]
+        )
+        serialization_format = flavor_conf.get(
+            "serialization_format", SERIALIZATION_FORMAT_PICKLE
+        )
+        compression = flavor_conf.get("compression")
+        if flavor_conf.get("shard_size") is not None:
+            return _ShardedModel(
+                statsforecast_model_file_path,
+                serialization_format=serialization_format,
+                compression=compression,
+                shard_size=flavor_conf["shard_size"],
+            ).select(unique_ids)
+
+        statsforecast_model = get_or_load(
+            _load_model,
+            path=statsforecast_model_file_path,
+            serialization_format=serialization_format,
+            compression=compression,
+        )
+        if unique_ids is not None:
+            statsforecast_model = _select_loaded_series(statsforecast_model, unique_ids)
+        return statsforecast_model
+
+
+async def load_model_async(model_uri, dst_path=None, unique_ids=None):
+    """
+    Asynchronous variant of :func:`load_model`.
+
+    The model is loaded on the executor configured with
+    :func:`mlflavors.utils.aio.configure`. The parameters are those of
+    :func:`load_model`.
+
+    :return: An statsforecast model.
+    """
+    return await run_blocking(
+        load_model, model_uri, dst_path=dst_path, unique_ids=unique_ids
     )
-    flavor_conf = _get_flavor_configuration(
-        model_path=local_model_path, flavor_name=FLAVOR_NAME
+
+
+def _slim_model(statsforecast_model):
+    """
+    Return a shallow copy of a fitted ``StatsForecast`` model without the state that
+    is only needed for training, together with the number of bytes removed.
+    """
+    from statsforecast.core import GroupedArray
+
+    slim_model = copy.copy(statsforecast_model)
+    bytes_saved = 0
+
+    # ``predict`` only uses the grouped array for the number of series and the number
+    # of columns (target plus exogenous regressors), so the rows can be dropped.
+    ga = statsforecast_model.ga
+    slim_model.ga = GroupedArray(
+        np.empty((0,) + ga.data.shape[1:], dtype=ga.data.dtype),
+        np.zeros_like(ga.indptr),
     )
-    _add_code_from_conf_to_system_path(local_model_path, flavor_conf)
-    statsforecast_model_file_path = os.path.join(
-        local_model_path, flavor_conf["pickled_model"]
+    bytes_saved += ga.data.nbytes
+
+    if getattr(statsforecast_model, "ds", None) is not None:
+        bytes_saved += statsforecast_model.ds.memory_usage(deep=True)
+        slim_model.ds = None
+
+    # In-sample fitted values stored by ``forecast`` and ``cross_validation``.
+    for attr in ("fcst_fitted_values_", "cv_fitted_values_"):
+        fitted_values = slim_model.__dict__.pop(attr, None)
+        if fitted_values is not None:
+            bytes_saved += sum(
+                value.nbytes
+                for value in fitted_values.values()
+                if isinstance(value, np.ndarray)
+            )
+
+    return slim_model, int(bytes_saved)
+
+
+_SHARDS_DIR = "shards"
+
+
+def _shard_path(path, shard):
+    # Shards share the file extension (and thus the compression) of the model file.
+    directory, file_name = os.path.split(path)
+    return os.path.join(
+        directory, _SHARDS_DIR, f"{shard}.{file_name.partition('.')[2]}"
     )
-    serialization_format = flavor_conf.get(
-        "serialization_format", SERIALIZATION_FORMAT_PICKLE
+
+
+def _as_shard(statsforecast_model, start=0, stop=None):
+    """Return the per-series state of the series ``start:stop`` as a shard."""
+    ga = statsforecast_model.ga
+    stop = len(ga) if stop is None else stop
+    rows = slice(ga.indptr[start], ga.indptr[stop])
+    ds = getattr(statsforecast_model, "ds", None)
+    return {
+        "fitted": statsforecast_model.fitted_[start:stop],
+        "data": ga.data[rows],
+        "indptr": ga.indptr[start : stop + 1] - ga.indptr[start],
+        "ds": ds[rows] if ds is not None else None,
+    }
+
+
+def _save_sharded_model(
+    model, path, shard_size, serialization_format, compression, compression_level
+):
+    """
+    Serialize the per-series state of a fitted ``StatsForecast`` model in shards of
+    ``shard_size`` series and the remaining state to ``path``.
+
+    :return: The number of shards.
+    """
+    from statsforecast.core import GroupedArray
+
+    os.makedirs(os.path.join(os.path.dirname(path), _SHARDS_DIR))
+    n_series = len(model.ga)
+    shard_starts = range(0, n_series, shard_size)
+    for shard, start in enumerate(shard_starts):
+        _save_model(
+            _as_shard(model, start, min(start + shard_size, n_series)),
+            _shard_path(path, shard),
+            serialization_format=serialization_format,
+            compression=compression,
+            compression_level=compression_level,
+        )
+
+    # The model file keeps ``uids`` and ``last_dates``, which serve as the index of
+    # series to shards.
+    skeleton = copy.copy(model)
+    skeleton.fitted_ = None
+    skeleton.ga = GroupedArray(
+        np.empty((0,) + model.ga.data.shape[1:], dtype=model.ga.data.dtype),
+        np.zeros(1, dtype=model.ga.indptr.dtype),
+    )
+    skeleton.ds = None
+    _save_model(
+        skeleton,
+        path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=compression_level,
+    )
+    return len(shard_starts)
+
+
+def _as_id_list(unique_ids):
+    """Return ``unique_ids`` as a list, wrapping a single identifier."""
+    # A string is iterable, but ``"a"`` names one series, not the series "a".
+    if np.ndim(unique_ids) == 0:
+        return [unique_ids]
+    return list(unique_ids)
+
+
+def _series_positions(statsforecast_model, unique_ids):
+    if unique_ids is None:
+        return np.arange(len(statsforecast_model.uids))
+
+    unique_ids = _as_id_list(unique_ids)
+    positions = statsforecast_model.uids.get_indexer(unique_ids)
+    if (positions == -1).any():
+        missing = [uid for uid, pos in zip(unique_ids, positions) if pos == -1]
+        raise MlflowException(
+            message=f"The model does not contain the series {missing}.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    # Keep the order of the series in the model, which is the order of ``predict``.
+    return np.unique(positions)
+
+
+def _select_series(statsforecast_model, unique_ids, get_shard, shard_size):
+    """
+    Build a ``StatsForecast`` model containing only the series ``unique_ids``.
+
+    :param statsforecast_model: The model holding ``uids``, ``last_dates`` and the
+        remaining (not per-series) state.
+    :param unique_ids: Identifiers of the series to select or ``None`` for all series.
+    :param get_shard: A callable returning the shard (as returned by ``_as_shard``)
+        with a given shard number.
+    :param shard_size: Number of series per shard.
+    """
+    from statsforecast.core import GroupedArray
+
+    positions = _series_positions(statsforecast_model, unique_ids)
+    n_models = len(statsforecast_model.models)
+    # The positions are sorted, so the series of each shard are contiguous and every
+    # shard is gathered with a single fancy indexing of its arrays.
+    shard_numbers = positions // shard_size
+    groups = np.split(positions, np.flatnonzero(np.diff(shard_numbers)) + 1)
+    fitted, data, lengths, ds = [], [], [], []
+    for group in groups if len(positions) else []:
+        shard = get_shard(group[0] // shard_size)
+        series = group % shard_size
+        starts, stops = shard["indptr"][series], shard["indptr"][series + 1]
+        group_lengths = stops - starts
+        # Row ``k`` of series ``i`` is ``starts[i] + k``, the rows of the selected
+        # series are consecutive in the result.
+        offsets = np.cumsum(group_lengths) - group_lengths
+        rows = np.arange(group_lengths.sum()) + np.repeat(
+            starts - offsets, group_lengths
+        )
+        fitted.append(shard["fitted"][series])
+        data.append(shard["data"][rows])
+        lengths.append(group_lengths)
+        if shard["ds"] is not None:
+            ds.append(shard["ds"][rows])
+
+    model_data = statsforecast_model.ga.data
+    indptr = np.zeros(len(positions) + 1, dtype=statsforecast_model.ga.indptr.dtype)
+    if lengths:
+        np.cumsum(np.concatenate(lengths), out=indptr[1:])
+    selected_model = copy.copy(statsforecast_model)
+    selected_model.fitted_ = (
+        np.concatenate(fitted) if fitted else np.empty((0, n_models), dtype=object)
     )
-    return _load_model(
-        path=statsforecast_model_file_path, serialization_format=serialization_format
+    selected_model.ga = GroupedArray(
+        np.concatenate(data) if data else model_data[:0], indptr
     )
+    selected_model.uids = statsforecast_model.uids[positions]
+    selected_model.last_dates = statsforecast_model.last_dates[positions]
+    selected_model.ds = ds[0].append(ds[1:]) if ds else None
+    selected_model.n_jobs = max(1, min(statsforecast_model.n_jobs, len(positions)))
+    return selected_model
 
 
-def _save_model(model, path, serialization_format):
-    with open(path, "wb") as out:
+def _select_loaded_series(statsforecast_model, unique_ids):
+    """Select the series ``unique_ids`` of a model that is not sharded."""
+    if not hasattr(statsforecast_model, "fitted_"):
+        raise MlflowException(
+            message="Selecting series with `unique_ids` requires a fitted model.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    shard = _as_shard(statsforecast_model)
+    return _select_series(
+        statsforecast_model,
+        unique_ids,
+        lambda _: shard,
+        max(len(statsforecast_model.uids), 1),
+    )
+
+
+class _ShardedModel:
+    """Lazily deserializes the shards of a model saved with ``shard_size``."""
+
+    def __init__(self, path, serialization_format, compression, shard_size):
+        self.path = path
+        self.serialization_format = serialization_format
+        self.compression = compression
+        self.shard_size = shard_size
+        self.skeleton = get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        )
+        self._shards = {}
+        self._lock = threading.Lock()
+
+    def _get_shard(self, shard):
+        with self._lock:
+            if shard not in self._shards:
+                self._shards[shard] = get_or_load(
+                    _load_model,
+                    _shard_path(self.path, shard),
+                    serialization_format=self.serialization_format,
+                    compression=self.compression,
+                )
+            return self._shards[shard]
+
+    def select(self, unique_ids=None):
+        """
+        Return a ``StatsForecast`` model containing the series ``unique_ids``,
+        loading the shards that contain them on first use.
+        """
+        return _select_series(
+            self.skeleton, unique_ids, self._get_shard, self.shard_size
+        )
+
+
+def _save_model(
+    model, path, serialization_format, compression=None, compression_level=None
+):
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        joblib.dump(model, path)
+        return
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        dump_out_of_band(model, path)
+        return
+
+    with open_model_file(path, "wb", compression, compression_level) as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             pickle.dump(model, out)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -402,7 +985,7 @@ def _save_model(model, path, serialization_format):
             )
 
 
-def _load_model(path, serialization_format):
+def _load_model(path, serialization_format, compression=None):
     if serialization_format not in SUPPORTED_SERIALIZATION_FORMATS:
         raise MlflowException(
             message=(
@@ -416,7 +999,15 @@ def _load_model(path, serialization_format):
             error_code=INVALID_PARAMETER_VALUE,
         )
 
-    with open(path, "rb") as pickled_model:
+    if serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+        import joblib
+
+        return joblib.load(path, mmap_mode="c")
+
+    if serialization_format == SERIALIZATION_FORMAT_PICKLE5:
+        return load_out_of_band(path)
+
+    with open_model_file(path, "rb", compression) as pickled_model:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
             return pickle.load(pickled_model)
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
@@ -434,6 +1025,9 @@ def _load_pyfunc(path):
     """
     if os.path.isfile(path):
         serialization_format = SERIALIZATION_FORMAT_PICKLE
+        compression = None
+        shard_size = None
+        forecast_tables = None
         _logger.warning(
             "Loading procedure in older versions of MLflow using pickle.load()"
         )
@@ -445,62 +1039,471 @@ def _load_pyfunc(path):
             serialization_format = statsforecast_flavor_conf.get(
                 "serialization_format", SERIALIZATION_FORMAT_PICKLE
             )
+            compression = statsforecast_flavor_conf.get("compression")
+            shard_size = statsforecast_flavor_conf.get("shard_size")
+            forecast_table = statsforecast_flavor_conf.get("forecast_table")
         except MlflowException:
             _logger.warning(
                 "Could not find statsforecast flavor configuration during model "
                 "loading process. Assuming 'pickle' serialization format."
             )
             serialization_format = SERIALIZATION_FORMAT_PICKLE
+            compression = None
+            shard_size = None
+            forecast_table = None
+
+        forecast_tables = None
+        if forecast_table is not None:
+            forecast_tables = load_forecast_tables(
+                os.path.join(path, forecast_table["path"])
+            )
 
         pyfunc_flavor_conf = _get_flavor_configuration(
             model_path=path, flavor_name=pyfunc.FLAVOR_NAME
         )
         path = os.path.join(path, pyfunc_flavor_conf["model_path"])
 
+    if shard_size is not None:
+        return _StatsforecastModelWrapper(
+            _ShardedModel(
+                path,
+                serialization_format=serialization_format,
+                compression=compression,
+                shard_size=shard_size,
+            ),
+            forecast_table=forecast_table,
+            forecast_tables=forecast_tables,
+        )
+
     return _StatsforecastModelWrapper(
-        _load_model(path, serialization_format=serialization_format)
+        get_or_load(
+            _load_model,
+            path,
+            serialization_format=serialization_format,
+            compression=compression,
+        ),
+        forecast_table=forecast_table,
+        forecast_tables=forecast_tables,
     )
 
 
 class _StatsforecastModelWrapper:
-    def __init__(self, statsforecast_model):
+    def __init__(self, statsforecast_model, forecast_table=None, forecast_tables=None):
         self.statsforecast_model = statsforecast_model
+        self.forecast_table = forecast_table
+        self.forecast_tables = forecast_tables
+        self._lock = get_model_lock(statsforecast_model)
+
+    async def predict_async(self, dataframe) -> pd.DataFrame:
+        """
+        Asynchronous variant of ``predict``, run with :func:`run_blocking`.
+
+        :param dataframe: The prediction configuration ``Pandas DataFrame``.
+        :return: The predictions of ``predict``.
+        """
+        return await run_blocking(self.predict, dataframe)
 
     def predict(self, dataframe) -> pd.DataFrame:
         df_schema = dataframe.columns.values.tolist()
+        rows = [
+            _parse_config(attrs, df_schema)
+            for attrs in dataframe.to_dict(orient="records")
+        ]
+
+        # Compatible rows are evaluated with a single predict call at their maximum
+        # horizon and the union of their levels, whose output is sliced back into
+        # the predictions of each row.
+        predictions = [None] * len(rows)
+        # ``StatsForecast.predict`` only reads the fitted models, so concurrent
+        # predictions are not serialized.
+        with limit_threads():
+            for group in _group_configs(rows):
+                merged = _merge_configs(group, rows)
+                table_config = self._table_config(merged)
+                if table_config is not None:
+                    # Rows covered by the precomputed forecast table are sliced out of
+                    # it like out of merged predictions.
+                    group_predictions = self.forecast_tables["predict"]
+                    merged = table_config
+                else:
+                    group_predictions = self._predict_config(merged)
+                for i in group:
+                    predictions[i] = _select_predictions(
+                        group_predictions, rows[i], merged
+                    )
+
+        if len(rows) == 1:
+            return predictions[0]
+
+        # The predictions of multi-row configurations are concatenated with the index
+        # of the configuration row as the outer index level.
+        return pd.concat(
+            predictions, keys=dataframe.index, names=[dataframe.index.name or "row"]
+        )
+
+    def _table_config(self, config):
+        """Return the configuration of the forecast table if it covers ``config``."""
+        if (
+            self.forecast_table is None
+            or config["X_df"] is not None
+            or config["y_df"] is not None
+            or not 1 <= config["h"] <= self.forecast_table["horizon"]
+        ):
+            return None
+        if config["level"] is not None:
+            # The names of the interval columns depend on the type of the levels
+            # (``95`` and ``95.0`` yield ``model-lo-95`` and ``model-lo-95.0``) and
+            # some models order them like the requested levels, so only levels in
+            # the order of the stored ones are answered from the table.
+            levels = iter(str(level) for level in self.forecast_table["level"] or [])
+            if not all(str(level) in levels for level in config["level"]):
+                return None
+        if (
+            config["unique_ids"] is not None
+            and not pd.Index(config["unique_ids"])
+            .isin(self.forecast_tables["predict"].index)
+            .all()
+        ):
+            # Unknown series are reported by the model.
+            return None
+        return {
+            "h": self.forecast_table["horizon"],
+            "X_df": None,
+            "level": self.forecast_table["level"],
+            "unique_ids": None,
+            "n_jobs": None,
+        }
+
+    def _predict_config(self, config):
+        if config["y_df"] is not None:
+            return self._forward_config(config)
+
+        statsforecast_model = self.statsforecast_model
+        unique_ids = config["unique_ids"]
+        if isinstance(statsforecast_model, _ShardedModel):
+            statsforecast_model = statsforecast_model.select(unique_ids)
+        elif unique_ids is not None:
+            statsforecast_model = _select_loaded_series(statsforecast_model, unique_ids)
+
+        statsforecast_model = _with_n_jobs(statsforecast_model, config["n_jobs"])
+        return statsforecast_model.predict(
+            h=config["h"], X_df=config["X_df"], level=config["level"]
+        )
 
-        if len(dataframe) > 1:
+    def _forward_config(self, config):
+        """Forecast the new history ``y`` with the fitted parameters of its series."""
+        y_df = config["y_df"]
+        unique_ids = list(pd.unique(y_df["unique_id"]))
+        statsforecast_model = self.statsforecast_model
+        if isinstance(statsforecast_model, _ShardedModel):
+            statsforecast_model = statsforecast_model.select(unique_ids)
+        else:
+            statsforecast_model = _select_loaded_series(statsforecast_model, unique_ids)
+        # The ``forward`` methods run on the fitted models shared with other
+        # predictions, so they are serialized like updates of other flavors.
+        with self._lock:
+            return _forward(
+                statsforecast_model, y_df, config["h"], config["X_df"], config["level"]
+            )
+
+
+def _with_n_jobs(statsforecast_model, n_jobs):
+    """
+    Return ``statsforecast_model`` predicting its series with ``n_jobs`` processes.
+
+    If ``n_jobs`` is ``None``, the ``n_jobs`` of the model is bounded by the CPUs
+    available to the serving process, so that a model trained on a larger machine
+    does not oversubscribe the CPUs of its container.
+    """
+    if n_jobs is None:
+        n_jobs = min(statsforecast_model.n_jobs, available_cpus())
+    n_jobs = max(1, min(n_jobs, len(statsforecast_model.uids)))
+    if n_jobs == statsforecast_model.n_jobs:
+        return statsforecast_model
+    # The loaded model may be shared, so the override is set on a shallow copy.
+    statsforecast_model = copy.copy(statsforecast_model)
+    statsforecast_model.n_jobs = n_jobs
+    return statsforecast_model
+
+
+def _forward(statsforecast_model, y_df, h, X_df, level):
+    """
+    Apply the fitted models of the series of ``statsforecast_model`` to ``y_df``.
+
+    The output has the layout of ``StatsForecast.predict``, with the forecasts of
+    each series starting after the last ``ds`` of its new history.
+    """
+    y_df = y_df.sort_values(["unique_id", "ds"], kind="stable")
+    exog_cols = [col for col in y_df.columns if col not in ("unique_id", "ds", "y")]
+    y_rows = y_df.groupby("unique_id", sort=False, observed=True).indices
+    X_rows = None
+    if X_df is not None:
+        X_df = X_df.sort_values(["unique_id", "ds"], kind="stable")
+        X_rows = X_df.groupby("unique_id", sort=False, observed=True).indices
+
+    for model in statsforecast_model.models:
+        if not hasattr(model, "forward") and (
+            type(model).__name__ not in _PARAMETER_FREE_MODELS
+        ):
             raise MlflowException(
-                f"The provided prediction pd.DataFrame contains {len(dataframe)} rows. "
-                "Only 1 row should be supplied.",
+                message=(
+                    f"The model {model!r} has no `forward` method and would be "
+                    "refitted on the new history `y`. Forecasting new history is only "
+                    "supported for models with `forward` and for the parameter-free "
+                    f"models {sorted(_PARAMETER_FREE_MODELS)}."
+                ),
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        attrs = dataframe.to_dict(orient="index").get(0)
-        h = attrs.get("h")
-        X = attrs.get("X")
-        X_cols = attrs.get("X_cols")
-        X_dtypes = attrs.get("X_dtypes")
-        level = attrs.get("level")
+    level = list(level or [])
+    forecasts = []
+    for i, uid in enumerate(statsforecast_model.uids):
+        history = y_df.iloc[y_rows[uid]]
+        X = X_future = None
+        if exog_cols:
+            X = history[exog_cols].to_numpy(dtype=np.float32)
+        if X_rows is not None:
+            future = X_df.iloc[X_rows.get(uid, [])]
+            if len(future) != h:
+                raise MlflowException(
+                    message=(
+                        f"The exogenous regressor `X` holds {len(future)} rows for the "
+                        f"series {uid}, expected {h} rows for the horizon `h`."
+                    ),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            X_future = future.drop(columns=["unique_id", "ds"]).to_numpy(
+                dtype=np.float32
+            )
+
+        forecast = {
+            "ds": _future_dates(history["ds"].iloc[-1], h, statsforecast_model.freq),
+        }
+        for model in statsforecast_model.fitted_[i]:
+            # Models without ``forward`` are parameter-free, see above.
+            method = getattr(model, "forward", model.forecast)
+            kwargs = {}
+            if level and "level" in inspect.signature(method).parameters:
+                kwargs["level"] = level
+            res = method(
+                y=history["y"].to_numpy(dtype=np.float32),
+                h=h,
+                X=X,
+                X_future=X_future,
+                **kwargs,
+            )
+            # Forecasts are float32 like those of ``StatsForecast.predict``.
+            for key, values in res.items():
+                if key == "mean":
+                    forecast[repr(model)] = values.astype(np.float32)
+                elif key.startswith(("lo", "hi")):
+                    forecast[f"{repr(model)}-{key}"] = values.astype(np.float32)
+        forecasts.append(pd.DataFrame(forecast))
+
+    forecasts = pd.concat(forecasts, ignore_index=True)
+    forecasts.index = pd.Index(np.repeat(statsforecast_model.uids, h), name="unique_id")
+    return forecasts
+
+
+def _future_dates(last_date, h, freq):
+    if isinstance(last_date, (int, np.integer)):
+        return np.arange(last_date + 1, last_date + 1 + h)
+    return pd.date_range(last_date + freq, periods=h, freq=freq)
 
-        if isinstance(h, type(None)):
+
+def _validate_forecast_table(statsforecast_model, horizon, level):
+    if horizon is None:
+        if level is not None:
             raise MlflowException(
-                f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
-                do not contain the required column `h` for specifying the forecast \
-                horizon.",
+                message="`forecast_table_level` requires `forecast_table_horizon`.",
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        return
+
+    if not isinstance(horizon, int) or isinstance(horizon, bool) or horizon < 1:
+        raise MlflowException(
+            message=(
+                f"`forecast_table_horizon` must be a positive integer, got {horizon}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not hasattr(statsforecast_model, "fitted_"):
+        raise MlflowException(
+            message=(
+                "A forecast table can only be precomputed for a fitted StatsForecast "
+                "model. Please call `fit` before saving the model with "
+                "`forecast_table_horizon`."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    # The training data holds the target followed by the exogenous regressors.
+    if statsforecast_model.ga.data.shape[1] > 1:
+        raise MlflowException(
+            message=(
+                "A forecast table can only be precomputed for a model fitted without "
+                "exogenous regressor."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
 
-        # Create Pandas DataFrame if exogenous regressor is provided
-        if isinstance(X, (list, np.ndarray)):
-            df = pd.DataFrame(data=X, columns=X_cols)
 
-            # Cast columns to correct type
-            for col, dtype in zip(X_cols, X_dtypes):
-                df[col] = df[col].astype(dtype)
-        else:
-            df = None
+def _none_if_missing(value):
+    # Columns that are only set in some rows of a multi-row configuration are NaN in
+    # the other rows.
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
 
-        predictions = self.statsforecast_model.predict(h=h, X_df=df, level=level)
+def _parse_config(attrs, df_schema):
+    """Validate a configuration row and build its exogenous regressor DataFrame."""
+    attrs = {key: _none_if_missing(value) for key, value in attrs.items()}
+    h = attrs.get("h")
+    X = attrs.get("X")
+    X_cols = attrs.get("X_cols")
+    X_dtypes = attrs.get("X_dtypes")
+
+    if isinstance(h, type(None)):
+        raise MlflowException(
+            f"The provided prediction configuration pd.DataFrame columns ({df_schema}) \
+            do not contain the required column `h` for specifying the forecast \
+            horizon.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    # Create Pandas DataFrame if exogenous regressor is provided
+    if is_payload(attrs):
+        df = decode_frame(attrs)
+    elif isinstance(X, (list, np.ndarray)):
+        df = build_frame(X, X_cols, X_dtypes)
+    else:
+        df = None
+
+    unique_ids = attrs.get("unique_ids")
+    n_jobs = attrs.get("n_jobs")
+    y_df = _parse_history(attrs)
+    if y_df is not None and unique_ids is not None:
+        raise MlflowException(
+            "The series to forecast with new history `y` are those of `y`, "
+            "`unique_ids` cannot be provided together with `y`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return {
+        "h": int(h),
+        "X_df": df,
+        "level": None if attrs.get("level") is None else list(attrs["level"]),
+        "unique_ids": None if unique_ids is None else _as_id_list(unique_ids),
+        "n_jobs": None if n_jobs is None else resolve_n_jobs(n_jobs),
+        "y_df": y_df,
+    }
+
+
+def _parse_history(attrs):
+    """Build the DataFrame of the new history ``y`` of a configuration row."""
+    y = attrs.get("y")
+    if not isinstance(y, (list, np.ndarray)):
+        return None
+
+    y_cols = attrs.get("y_cols")
+    y_cols = ["unique_id", "ds", "y"] if y_cols is None else list(y_cols)
+    y_dtypes = attrs.get("y_dtypes")
+    if y_dtypes is not None:
+        y_df = build_frame(y, y_cols, y_dtypes)
+    else:
+        y_df = pd.DataFrame(list(y), columns=y_cols)
+    if y_df.empty or not {"unique_id", "ds", "y"}.issubset(y_df.columns):
+        raise MlflowException(
+            f"The new history `y` with columns {y_cols} must contain rows of the "
+            "columns `unique_id`, `ds` and `y`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not pd.api.types.is_datetime64_any_dtype(
+        y_df["ds"]
+    ) and not pd.api.types.is_integer_dtype(y_df["ds"]):
+        y_df["ds"] = pd.to_datetime(y_df["ds"])
+    return y_df
+
+
+def _is_compatible(config, other):
+    """Return whether two configuration rows can be evaluated with one call."""
+    if config["y_df"] is not None or other["y_df"] is not None:
+        # Rows with new history are forecasted on their own.
+        return False
+    if config["X_df"] is None and other["X_df"] is None:
+        return True
+    # The exogenous regressor covers exactly the horizon of its series.
+    return (
+        config["X_df"] is not None
+        and other["X_df"] is not None
+        and config["h"] == other["h"]
+        and config["unique_ids"] == other["unique_ids"]
+        and config["X_df"].equals(other["X_df"])
+    )
+
+
+def _group_configs(rows):
+    groups = []
+    for i, config in enumerate(rows):
+        for group in groups:
+            if _is_compatible(rows[group[0]], config):
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+    return groups
+
+
+def _merge_configs(group, rows):
+    configs = [rows[i] for i in group]
+    merged = dict(configs[0])
+    if len(configs) == 1:
+        return merged
+    merged["h"] = max(config["h"] for config in configs)
+    levels = [config["level"] for config in configs if config["level"] is not None]
+    merged["level"] = sorted(set().union(*levels)) if levels else None
+    n_jobs = [config["n_jobs"] for config in configs if config["n_jobs"] is not None]
+    merged["n_jobs"] = max(n_jobs) if n_jobs else None
+    if any(config["unique_ids"] is None for config in configs):
+        merged["unique_ids"] = None
+    else:
+        merged["unique_ids"] = list(
+            dict.fromkeys(uid for config in configs for uid in config["unique_ids"])
+        )
+    return merged
+
+
+def _interval_level(column):
+    """Return the level of a prediction interval column, or ``None``."""
+    parts = str(column).rsplit("-", 2)
+    if len(parts) != 3 or parts[1] not in ("lo", "hi"):
+        return None
+    try:
+        return float(parts[2])
+    except ValueError:
+        return None
+
+
+def _select_predictions(predictions, config, merged):
+    """Slice the predictions of a configuration row out of merged predictions."""
+    if (
+        config["unique_ids"] is not None
+        and config["unique_ids"] != merged["unique_ids"]
+    ):
+        predictions = predictions[predictions.index.isin(config["unique_ids"])]
+
+    if config["h"] < merged["h"]:
+        predictions = predictions.groupby(level=0, sort=False, observed=True).head(
+            config["h"]
+        )
 
-        return predictions
+    if config["level"] != merged["level"]:
+        levels = {float(level) for level in config["level"] or []}
+        predictions = predictions[
+            [
+                column
+                for column in predictions.columns
+                if _interval_level(column) is None or _interval_level(column) in levels
+            ]
+        ]
+
+    return predictions
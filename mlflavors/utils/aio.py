@@ -0,0 +1,126 @@
+"""
+Asyncio entry points for loading models and predicting.
+
+Every flavor provides ``load_model_async``, an awaitable variant of its
+``load_model`` function, and its pyfunc wrapper provides ``predict_async``, an
+awaitable variant of ``predict``. Models loaded with ``mlflow.pyfunc.load_model``
+can be loaded and queried with :func:`load_pyfunc_async` and :func:`predict_async`.
+
+The blocking work (download, deserialization and prediction) runs on the executor
+set with :func:`configure`, by default the default executor of the event loop. At
+most ``max_concurrency`` calls per event loop run at the same time, the others wait
+without blocking the loop. Models live in the calling process, so the executor must
+be a thread pool.
+"""
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+_config = {"executor": None, "max_concurrency": None}
+_semaphores = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def configure(executor=None, max_concurrency=None):
+    """
+    Configure the executor and the concurrency limit of the asyncio entry points.
+
+    :param executor: An instance of :class:`concurrent.futures.ThreadPoolExecutor`
+        running the blocking calls. If ``None``, the default executor of the event
+        loop is used.
+    :param max_concurrency: Maximum number of blocking calls running at the same time
+        per event loop. If ``None``, the number of calls is only bounded by the
+        executor.
+    """
+    # Models and their caches live in the calling process, a process pool would
+    # pickle them for every call.
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise MlflowException(
+            message=(
+                "`executor` must be an instance of "
+                "`concurrent.futures.ThreadPoolExecutor`, "
+                f"got {type(executor).__name__}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if max_concurrency is not None and max_concurrency <= 0:
+        raise MlflowException(
+            message=(
+                f"`max_concurrency` must be a positive integer, got {max_concurrency}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    with _lock:
+        _config["executor"] = executor
+        _config["max_concurrency"] = max_concurrency
+        _semaphores.clear()
+
+
+def _get_semaphore(loop):
+    with _lock:
+        if _config["max_concurrency"] is None:
+            return None
+        # Semaphores are bound to an event loop, so every loop gets its own.
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _semaphores[loop] = asyncio.Semaphore(
+                _config["max_concurrency"]
+            )
+        return semaphore
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Run ``func(*args, **kwargs)`` on the configured executor.
+
+    :param func: The blocking function.
+    :param args: Positional arguments of ``func``.
+    :param kwargs: Keyword arguments of ``func``.
+    :return: The return value of ``func``.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    semaphore = _get_semaphore(loop)
+    if semaphore is None:
+        return await loop.run_in_executor(_config["executor"], call)
+    async with semaphore:
+        return await loop.run_in_executor(_config["executor"], call)
+
+
+async def load_pyfunc_async(model_uri, suppress_warnings=False, dst_path=None):
+    """
+    Asynchronous variant of ``mlflow.pyfunc.load_model``.
+
+    :param model_uri: The location, in URI format, of the MLflow model.
+    :param suppress_warnings: If ``True``, non-fatal warning messages associated with
+        the model loading process will be suppressed.
+    :param dst_path: The local filesystem path to which to download the model
+        artifact.
+    :return: A ``mlflow.pyfunc.PyFuncModel``.
+    """
+    from mlflow import pyfunc
+
+    return await run_blocking(
+        pyfunc.load_model,
+        model_uri,
+        suppress_warnings=suppress_warnings,
+        dst_path=dst_path,
+    )
+
+
+async def predict_async(pyfunc_model, data):
+    """
+    Asynchronous variant of ``mlflow.pyfunc.PyFuncModel.predict``.
+
+    :param pyfunc_model: A model loaded with ``mlflow.pyfunc.load_model`` or
+        :func:`load_pyfunc_async`.
+    :param data: The prediction configuration ``Pandas DataFrame`` of the model's
+        flavor.
+    :return: The predictions.
+    """
+    return await run_blocking(pyfunc_model.predict, data)
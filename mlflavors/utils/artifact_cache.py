@@ -0,0 +1,311 @@
+"""
+Opt-in on-disk cache of downloaded model artifacts.
+
+The flavors' ``load_model`` functions download the model directory of ``model_uri``
+into a fresh temporary directory on every call. When the cache is enabled, either
+with :func:`enable` or by setting the ``MLFLAVORS_ARTIFACT_CACHE_DIR`` environment
+variable, model directories are instead downloaded once into the cache directory and
+reused by subsequent loads in the same or other processes.
+
+Entries are keyed by the resolved artifact URI (``models:/`` and ``runs:/`` URIs are
+resolved to the URI of the underlying artifact location), the SHA-256 digest of the
+``MLmodel`` file, which is downloaded on every load to validate the entry, and the
+paths and sizes of all files of the model directory, which are listed on every load.
+Files overwritten in place with contents of the same size are not detected, so
+models should not be overwritten at the same artifact location. The
+total size of the cache is bounded by ``max_bytes`` (or the
+``MLFLAVORS_ARTIFACT_CACHE_MAX_BYTES`` environment variable), evicting the least
+recently used entries first. Concurrent access from multiple processes is
+synchronized with ``fcntl`` file locks, so the cache requires a POSIX system.
+
+Models referenced by a local path are loaded in place and bypass the cache.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+
+from mlflow.exceptions import MlflowException
+from mlflow.models.model import MLMODEL_FILE_NAME
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.utils.uri import append_to_uri_path
+
+ENV_CACHE_DIR = "MLFLAVORS_ARTIFACT_CACHE_DIR"
+ENV_CACHE_MAX_BYTES = "MLFLAVORS_ARTIFACT_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 10 * 1024**3
+
+_ENTRIES_DIR = "entries"
+_LOCKS_DIR = "locks"
+_INDEX_FILE_NAME = "index.json"
+_INDEX_LOCK_FILE_NAME = "index.lock"
+
+_config = {"cache_dir": None, "max_bytes": None}
+_stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+
+def enable(cache_dir, max_bytes=None):
+    """
+    Enable the artifact cache for the current process.
+
+    :param cache_dir: Local directory holding the cache. It is created if it does not
+        exist and can be shared between processes.
+    :param max_bytes: Upper bound of the total size of the cached artifacts in bytes.
+        If ``None``, the ``MLFLAVORS_ARTIFACT_CACHE_MAX_BYTES`` environment variable
+        or a default of 10 GiB is used.
+    """
+    try:
+        import fcntl  # noqa: F401
+    except ImportError:
+        raise MlflowException(
+            message="The artifact cache requires a platform supporting `fcntl`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if max_bytes is not None and max_bytes <= 0:
+        raise MlflowException(
+            message=f"`max_bytes` must be a positive integer, got {max_bytes}.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    _config["cache_dir"] = os.path.abspath(cache_dir)
+    _config["max_bytes"] = max_bytes
+
+
+def disable():
+    """Disable the artifact cache for the current process."""
+    _config["cache_dir"] = None
+    _config["max_bytes"] = None
+
+
+def get_cache_dir():
+    """Return the cache directory if the cache is enabled, otherwise ``None``."""
+    return _config["cache_dir"] or os.environ.get(ENV_CACHE_DIR) or None
+
+
+def _get_max_bytes():
+    if _config["max_bytes"] is not None:
+        return _config["max_bytes"]
+    return int(os.environ.get(ENV_CACHE_MAX_BYTES, DEFAULT_MAX_BYTES))
+
+
+def stats():
+    """
+    :return: A dictionary with the number of cache ``hits`` and ``misses``, the number
+             of ``bytes_saved`` by cache hits and the number of ``evictions`` performed
+             by the current process.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    """Reset the counters returned by :func:`stats`."""
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def _increment(**counts):
+    with _stats_lock:
+        for key, count in counts.items():
+            _stats[key] += count
+
+
+def clear():
+    """Remove all entries of the cache that are not in use."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return
+    with _index(cache_dir) as index:
+        for key in list(index):
+            if _try_remove_entry(cache_dir, key):
+                del index[key]
+
+
+@contextlib.contextmanager
+def _flock(path, operation):
+    import fcntl
+
+    with open(path, "a+") as f:
+        fcntl.flock(f, operation)
+        try:
+            yield f
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _index(cache_dir):
+    """Lock, read and (on exit) atomically write the index of cache entries."""
+    import fcntl
+
+    index_path = os.path.join(cache_dir, _INDEX_FILE_NAME)
+    with _flock(os.path.join(cache_dir, _INDEX_LOCK_FILE_NAME), fcntl.LOCK_EX):
+        index = {}
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+        yield index
+        tmp_path = f"{index_path}.{uuid.uuid4().hex}"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
+
+def _entry_path(cache_dir, key):
+    return os.path.join(cache_dir, _ENTRIES_DIR, key)
+
+
+def _lock_path(cache_dir, key):
+    return os.path.join(cache_dir, _LOCKS_DIR, f"{key}.lock")
+
+
+def _try_remove_entry(cache_dir, key):
+    """Remove an entry unless another process holds its lock."""
+    import fcntl
+
+    with open(_lock_path(cache_dir, key), "a+") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        try:
+            shutil.rmtree(_entry_path(cache_dir, key), ignore_errors=True)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+    return True
+
+
+def _record_access(cache_dir, key, size):
+    """Update the LRU index with an access of ``key`` and evict entries over budget."""
+    max_bytes = _get_max_bytes()
+    evictions = 0
+    with _index(cache_dir) as index:
+        index[key] = {"size": size, "last_access": time.time()}
+        total = sum(entry["size"] for entry in index.values())
+        lru_keys = sorted(
+            (k for k in index if k != key), key=lambda k: index[k]["last_access"]
+        )
+        for lru_key in lru_keys:
+            if total <= max_bytes:
+                break
+            if _try_remove_entry(cache_dir, lru_key):
+                total -= index.pop(lru_key)["size"]
+                evictions += 1
+    _increment(evictions=evictions)
+
+
+def _is_local_uri(model_uri):
+    scheme = urllib.parse.urlparse(str(model_uri)).scheme
+    # Single letter schemes are Windows drive letters.
+    return scheme in ("", "file") or len(scheme) == 1
+
+
+def _resolve_uri(model_uri):
+    from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+    from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+
+    if ModelsArtifactRepository.is_models_uri(model_uri):
+        model_uri = ModelsArtifactRepository.get_underlying_uri(model_uri)
+    if RunsArtifactRepository.is_runs_uri(model_uri):
+        model_uri = RunsArtifactRepository.get_underlying_uri(model_uri)
+    return model_uri
+
+
+def _list_files(repository, path=None):
+    """Yield the relative path and size of every file under ``path``."""
+    for file_info in repository.list_artifacts(path):
+        if file_info.is_dir:
+            yield from _list_files(repository, file_info.path)
+        else:
+            yield f"{file_info.path}\t{file_info.file_size}"
+
+
+def _cache_key(resolved_uri, tmp_dir):
+    from mlflow.store.artifact.artifact_repository_registry import (
+        get_artifact_repository,
+    )
+
+    mlmodel_path = _download_artifact_from_uri(
+        append_to_uri_path(resolved_uri, MLMODEL_FILE_NAME), output_path=tmp_dir
+    )
+    with open(mlmodel_path, "rb") as f:
+        mlmodel_digest = hashlib.sha256(f.read()).hexdigest()
+    # Model files overwritten with an identical MLmodel file change the listing.
+    files = sorted(_list_files(get_artifact_repository(resolved_uri)))
+    key = "\n".join([resolved_uri, mlmodel_digest] + files)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+@contextlib.contextmanager
+def download_model_artifacts(model_uri, output_path=None):
+    """
+    Download the model directory of ``model_uri`` through the artifact cache.
+
+    The yielded directory must only be read within the ``with`` block, during which
+    the entry is protected from eviction by other processes. If the cache is
+    disabled, ``output_path`` is given or ``model_uri`` is a local path, the model is
+    downloaded with ``_download_artifact_from_uri`` as usual.
+
+    :param model_uri: The location, in URI format, of the MLflow model.
+    :param output_path: The local filesystem path to which to download the model
+        artifact, which bypasses the cache.
+    :return: A context manager yielding the local path of the model directory.
+    """
+    import fcntl
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None or output_path is not None or _is_local_uri(model_uri):
+        yield _download_artifact_from_uri(
+            artifact_uri=model_uri, output_path=output_path
+        )
+        return
+
+    for directory in (_ENTRIES_DIR, _LOCKS_DIR):
+        os.makedirs(os.path.join(cache_dir, directory), exist_ok=True)
+    resolved_uri = _resolve_uri(model_uri)
+
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+        key = _cache_key(resolved_uri, tmp_dir)
+        entry_path = _entry_path(cache_dir, key)
+        while True:
+            with _flock(_lock_path(cache_dir, key), fcntl.LOCK_EX) as lock:
+                hit = os.path.isdir(entry_path)
+                if not hit:
+                    download_dir = os.path.join(tmp_dir, "download")
+                    shutil.rmtree(download_dir, ignore_errors=True)
+                    os.makedirs(download_dir)
+                    # The resolved URI is downloaded, so that the entry holds the
+                    # artifacts of its key even if e.g. a model stage moves meanwhile.
+                    local_path = _download_artifact_from_uri(
+                        artifact_uri=resolved_uri, output_path=download_dir
+                    )
+                    os.replace(local_path, entry_path)
+                size = _dir_size(entry_path)
+                _record_access(cache_dir, key, size)
+                # Downgrade to a shared lock, so that other processes can read the
+                # entry concurrently while eviction (which needs an exclusive lock) is
+                # blocked. The downgrade is not atomic and an eviction may take the
+                # exclusive lock in between, so the entry is checked again.
+                fcntl.flock(lock, fcntl.LOCK_SH)
+                if os.path.isdir(entry_path):
+                    if hit:
+                        _increment(hits=1, bytes_saved=size)
+                    else:
+                        _increment(misses=1)
+                    yield entry_path
+                    return
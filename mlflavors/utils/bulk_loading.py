@@ -0,0 +1,138 @@
+"""
+Parallel loading of many models.
+
+:func:`load_models` loads a list of models of any of the mlflavors flavors, for
+example when a serving process starts with one model per region or product line.
+The flavor of every model is read from its ``MLmodel`` file. Model directories are
+downloaded by a thread pool, through the artifact cache if it is enabled (see
+:mod:`mlflavors.utils.artifact_cache`), and the models are deserialized either in
+the download threads or in a process pool.
+"""
+import importlib
+import os
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+from mlflow.exceptions import MlflowException
+from mlflow.models import Model
+from mlflow.models.model import MLMODEL_FILE_NAME
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+import mlflavors
+from mlflavors.utils.artifact_cache import download_model_artifacts
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+SUPPORTED_EXECUTORS = [EXECUTOR_THREAD, EXECUTOR_PROCESS]
+
+ModelLoadResult = namedtuple(
+    "ModelLoadResult", ["model_uri", "flavor", "model", "error"]
+)
+ModelLoadResult.__doc__ = """
+Result of loading a single model with :func:`load_models`.
+
+``model`` is ``None`` and ``error`` holds the raised exception if the model could
+not be loaded. ``flavor`` is ``None`` if the failure happened before the flavor of
+the model was known.
+"""
+
+
+def _get_flavor(local_model_path):
+    flavors = Model.load(os.path.join(local_model_path, MLMODEL_FILE_NAME)).flavors
+    for flavor in mlflavors.__all__:
+        if flavor in flavors:
+            return flavor
+    raise MlflowException(
+        message=(
+            f"The model at '{local_model_path}' has none of the flavors "
+            f"{mlflavors.__all__}, found {sorted(flavors)}."
+        ),
+        error_code=INVALID_PARAMETER_VALUE,
+    )
+
+
+def _load_local_model(flavor, local_model_path):
+    return importlib.import_module(f"mlflavors.{flavor}").load_model(local_model_path)
+
+
+def _load(model_uri, load_executor):
+    flavor = None
+    try:
+        with download_model_artifacts(model_uri) as local_model_path:
+            flavor = _get_flavor(local_model_path)
+            if load_executor is None:
+                model = _load_local_model(flavor, local_model_path)
+            else:
+                model = load_executor.submit(
+                    _load_local_model, flavor, local_model_path
+                ).result()
+        return ModelLoadResult(model_uri, flavor, model, None)
+    except Exception as e:
+        return ModelLoadResult(model_uri, flavor, None, e)
+
+
+def load_models(model_uris, max_workers=None, executor=EXECUTOR_THREAD):
+    """
+    Load several models of any mlflavors flavor in parallel.
+
+    Errors raised while loading a model do not interrupt the other loads, they are
+    returned in the ``error`` field of the model's result instead.
+
+    :param model_uris: The locations, in URI format, of the MLflow models. See the
+        ``load_model`` function of the flavors for the supported URI schemes.
+    :param max_workers: The number of threads downloading models. If ``None``, the
+        default number of workers of :class:`concurrent.futures.ThreadPoolExecutor`
+        is used. If ``executor`` is ``"process"``, it also bounds the number of
+        worker processes, which never exceeds the number of CPUs.
+    :param executor: Where the models are deserialized:
+
+        - ``"thread"`` (default): In the download threads. This avoids copying
+          the models between processes and suits models whose deserialization
+          releases the GIL or is cheap compared to the download.
+        - ``"process"``: In a pool of ``max_workers`` processes started with the
+          ``spawn`` method. The models are pickled back to the calling process,
+          so this only pays off for models that are expensive to deserialize,
+          e.g. compressed artifacts.
+        - An instance of :class:`concurrent.futures.Executor`, which is used as
+          is and not shut down.
+
+    :return: A list of :class:`ModelLoadResult` in the order of ``model_uris``.
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise MlflowException(
+            message=f"`max_workers` must be a positive integer, got {max_workers}.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not isinstance(executor, Executor) and executor not in SUPPORTED_EXECUTORS:
+        raise MlflowException(
+            message=(
+                f"Unrecognized executor: {executor}. Please specify one of "
+                f"{SUPPORTED_EXECUTORS} or an instance of "
+                "`concurrent.futures.Executor`."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    model_uris = list(model_uris)
+    load_executor = None
+    if executor == EXECUTOR_PROCESS:
+        # Forking a process running download threads can deadlock on locks held by
+        # those threads, so the workers are spawned instead.
+        # Deserialization is CPU bound, so there is no point in more workers than
+        # CPUs.
+        n_processes = min(max_workers or os.cpu_count(), os.cpu_count())
+        load_executor = ProcessPoolExecutor(
+            max_workers=n_processes, mp_context=get_context("spawn")
+        )
+    elif isinstance(executor, Executor):
+        load_executor = executor
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as download_executor:
+            return list(
+                download_executor.map(lambda uri: _load(uri, load_executor), model_uris)
+            )
+    finally:
+        if executor == EXECUTOR_PROCESS:
+            load_executor.shutdown()
@@ -0,0 +1,131 @@
+"""
+Cached plans for building typed exogenous regressors from ``X_cols`` and ``X_dtypes``.
+
+The pyfunc wrappers of the orbit and statsforecast flavors receive the exogenous
+regressor ``X`` as rows of Python objects together with the column names ``X_cols``
+and the column types ``X_dtypes``. Casting the columns of an inferred ``Pandas
+DataFrame`` one by one reassigns (and often consolidates) a block per column on every
+request, although consecutive requests almost always share the same schema.
+
+:func:`get_cast_plan` compiles ``(X_cols, X_dtypes)`` into a :class:`CastPlan`, which
+resolves every dtype once and selects a converter per column, and keeps the most
+recently used plans in an LRU cache. :meth:`CastPlan.build` then converts each column
+of the rows to its typed array in a single pass and assembles the ``Pandas
+DataFrame`` from these arrays without further copies.
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+_PLAN_CACHE_SIZE = 256
+
+
+class CastPlan:
+    """
+    Conversion plan from rows of an exogenous regressor to a typed DataFrame.
+
+    :param columns: The column names of the regressor.
+    :param dtypes: The data types of the columns, in any form accepted by
+        ``pandas.api.types.pandas_dtype``.
+    """
+
+    def __init__(self, columns, dtypes):
+        self.columns = list(columns)
+        self.dtypes = [pd.api.types.pandas_dtype(dtype) for dtype in dtypes]
+        if len(self.columns) != len(self.dtypes):
+            raise MlflowException(
+                f"The number of regressor columns `X_cols` ({len(self.columns)}) does "
+                f"not match the number of column types `X_dtypes` "
+                f"({len(self.dtypes)}).",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        self._converters = [_converter(dtype) for dtype in self.dtypes]
+
+    def build(self, X):
+        """
+        Build the typed ``Pandas DataFrame`` of the regressor rows.
+
+        :param X: The regressor as a list of rows or a two-dimensional array.
+        :return: A ``Pandas DataFrame`` with the columns and types of the plan.
+        """
+        values = X if isinstance(X, np.ndarray) and X.ndim == 2 else None
+        if values is None:
+            # Column-major object array of the rows, without inferring any types.
+            values = pd.DataFrame(X, dtype=object).to_numpy()
+            if values.size == 0 and len(values) == 0:
+                values = values.reshape(0, len(self.columns))
+        if values.ndim != 2 or values.shape[1] != len(self.columns):
+            raise MlflowException(
+                f"The exogenous regressor `X` with shape {values.shape} does not "
+                f"match the {len(self.columns)} regressor columns `X_cols`.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        # Positional keys keep duplicate column names intact.
+        arrays = {
+            i: convert(values[:, i]) for i, convert in enumerate(self._converters)
+        }
+        df = pd.DataFrame(arrays, copy=False)
+        df.columns = self.columns
+        return df
+
+
+def _converter(dtype):
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufc":
+        # NumPy converts object columns of numbers (or numeric strings) directly.
+        return functools.partial(np.asarray, dtype=dtype)
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        return functools.partial(_to_datetime, dtype=dtype)
+    return functools.partial(_astype, dtype=dtype)
+
+
+def _astype(values, dtype):
+    return pd.Series(values, copy=False).astype(dtype).array
+
+
+def _to_datetime(values, dtype):
+    # Parsing ISO 8601 strings with a fixed format is much faster than casting
+    # them, other formats and timezone-aware values take the casting path.
+    try:
+        parsed = pd.to_datetime(values, format="ISO8601")
+    except (ValueError, TypeError):
+        return _astype(values, dtype)
+    if parsed.tz is not None:
+        return _astype(values, dtype)
+    return parsed.array.astype(dtype, copy=False)
+
+
+@functools.lru_cache(maxsize=_PLAN_CACHE_SIZE)
+def _cached_plan(columns, dtypes):
+    return CastPlan(columns, dtypes)
+
+
+def get_cast_plan(X_cols, X_dtypes):
+    """
+    Return the cached conversion plan for a regressor schema.
+
+    :param X_cols: The column names of the regressor.
+    :param X_dtypes: The data types of the columns.
+    :return: A :class:`CastPlan`, shared between calls with the same schema.
+    """
+    columns, dtypes = tuple(X_cols), tuple(X_dtypes)
+    try:
+        return _cached_plan(columns, dtypes)
+    except TypeError:
+        # Unhashable column names or dtypes are compiled for this call only.
+        return CastPlan(columns, dtypes)
+
+
+def build_frame(X, X_cols, X_dtypes):
+    """
+    Build the typed ``Pandas DataFrame`` of an exogenous regressor.
+
+    :param X: The regressor as a list of rows or a two-dimensional array.
+    :param X_cols: The column names of the regressor.
+    :param X_dtypes: The data types of the columns.
+    :return: A ``Pandas DataFrame`` with columns ``X_cols`` of types ``X_dtypes``.
+    """
+    return get_cast_plan(X_cols, X_dtypes).build(X)
@@ -0,0 +1,104 @@
+"""
+Number of CPUs available to the current process.
+
+``os.cpu_count`` reports the CPUs of the host, which overstates the parallelism a
+process can use in a container limited by a CPU quota (e.g. a Kubernetes CPU limit)
+or pinned to a subset of the CPUs. :func:`available_cpus` bounds the host CPUs by the
+CPU affinity of the process and by the CPU quota of its cgroup (v2 ``cpu.max`` or v1
+``cpu.cfs_quota_us`` and ``cpu.cfs_period_us``), rounding fractional quotas up.
+"""
+import functools
+import math
+import os
+
+import numpy as np
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _cgroup_paths():
+    """Return the cgroup directories of the current process, most specific first."""
+    paths = []
+    for line in (_read("/proc/self/cgroup") or "").splitlines():
+        hierarchy, _, path = line.partition(":")[2].partition(":")
+        if hierarchy in ("", "cpu", "cpu,cpuacct", "cpuacct,cpu") and path != "/":
+            paths.append(path.lstrip("/"))
+    return paths + [""]
+
+
+def cgroup_cpu_limit(root=CGROUP_ROOT):
+    """
+    Return the CPU quota of the cgroup of the current process.
+
+    :param root: The mount point of the cgroup file system.
+    :return: The quota as a (possibly fractional) number of CPUs, or ``None`` if the
+             cgroup does not limit the CPU time.
+    """
+    for path in _cgroup_paths():
+        # cgroup v2: "<quota> <period>" with quota "max" if unlimited.
+        cpu_max = _read(os.path.join(root, path, "cpu.max"))
+        if cpu_max is not None:
+            quota, _, period = cpu_max.partition(" ")
+            if quota == "max":
+                return None
+            return int(quota) / int(period or 100000)
+
+        # cgroup v1: the quota is -1 if unlimited.
+        for controller in ("cpu", "cpu,cpuacct"):
+            directory = os.path.join(root, controller, path)
+            quota = _read(os.path.join(directory, "cpu.cfs_quota_us"))
+            period = _read(os.path.join(directory, "cpu.cfs_period_us"))
+            if quota is not None and period is not None:
+                return int(quota) / int(period) if int(quota) > 0 else None
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def available_cpus():
+    """
+    Return the number of CPUs the current process can use in parallel.
+
+    :return: The number of host CPUs bounded by the CPU affinity of the process and
+             the CPU quota of its cgroup, at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+
+def resolve_n_jobs(n_jobs):
+    """
+    Validate an ``n_jobs`` value and resolve ``-1`` to :func:`available_cpus`.
+
+    :param n_jobs: A positive number of jobs or ``-1`` for all available CPUs.
+    :return: The positive number of jobs.
+    """
+    if isinstance(n_jobs, (float, np.floating)) and float(n_jobs).is_integer():
+        # Integer columns of configuration rows are cast to floats by missing values.
+        n_jobs = int(n_jobs)
+    if (
+        not isinstance(n_jobs, (int, np.integer))
+        or isinstance(n_jobs, bool)
+        or n_jobs == 0
+        or n_jobs < -1
+    ):
+        raise MlflowException(
+            f"Invalid `n_jobs` value {n_jobs}. It must be a positive integer or -1.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return available_cpus() if n_jobs == -1 else int(n_jobs)
@@ -0,0 +1,72 @@
+"""
+Precomputed forecast tables stored next to a saved model.
+
+Forecasters without exogenous regressor return the same predictions for the same
+prediction parameters once they are fitted. The sktime and statsforecast flavors can
+therefore precompute the predictions up to a maximum horizon at save time (see the
+``forecast_table_*`` parameters of their ``save_model`` functions), which their pyfunc
+wrappers slice to answer matching requests without calling the model.
+
+Each table is a ``Pandas Series`` or ``DataFrame`` of predictions stored as an Arrow
+IPC file ``<name>.arrow`` in the table directory, with the index and column structure
+kept in the Arrow pandas metadata. The files are memory mapped on load.
+"""
+import json
+import os
+import warnings
+
+import pandas as pd
+
+FORECAST_TABLE_DIR = "forecast_table"
+
+_SERIES_METADATA_KEY = b"mlflavors.series_name"
+
+
+def save_forecast_tables(tables, path):
+    """
+    Write precomputed predictions as Arrow IPC files.
+
+    :param tables: A dict mapping table names (e.g. predict methods) to the
+        predictions as ``Pandas Series`` or ``DataFrame``.
+    :param path: The directory to create and write the tables to.
+    """
+    import pyarrow as pa
+
+    os.makedirs(path)
+    for name, predictions in tables.items():
+        metadata = {}
+        if isinstance(predictions, pd.Series):
+            metadata[_SERIES_METADATA_KEY] = json.dumps(predictions.name).encode()
+            predictions = predictions.to_frame(name="predictions")
+        table = pa.Table.from_pandas(predictions)
+        table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+        with pa.OSFile(os.path.join(path, f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+def load_forecast_tables(path):
+    """
+    Read the precomputed predictions written by :func:`save_forecast_tables`.
+
+    :param path: The directory holding the tables.
+    :return: A dict mapping table names to the predictions.
+    """
+    import pyarrow as pa
+
+    tables = {}
+    for file_name in sorted(os.listdir(path)):
+        name, extension = os.path.splitext(file_name)
+        if extension != ".arrow":
+            continue
+        with pa.memory_map(os.path.join(path, file_name)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        with warnings.catch_warnings():
+            # pyarrow rebuilds period indexes through a deprecated pandas inference.
+            warnings.simplefilter("ignore", FutureWarning)
+            predictions = table.to_pandas()
+        series_name = table.schema.metadata.get(_SERIES_METADATA_KEY)
+        if series_name is not None:
+            predictions = predictions.iloc[:, 0].rename(json.loads(series_name))
+        tables[name] = predictions
+    return tables
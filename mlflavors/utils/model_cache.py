@@ -0,0 +1,213 @@
+"""
+Opt-in in-process cache of deserialized models.
+
+When the cache is enabled, either with :func:`enable` or by setting the
+``MLFLAVORS_MODEL_CACHE_MAX_ENTRIES`` environment variable, the flavors'
+``load_model`` and ``_load_pyfunc`` functions return the model object deserialized by
+an earlier call for the same model file instead of deserializing it again.
+
+Entries are keyed by the real path of the model file, its modification time and size
+and the serialization settings, so re-saving a model at the same path invalidates its
+entry. The cache is bounded by the number of entries and by the estimated memory
+footprint of the models, which is approximated by the size of their serialized
+artifacts (``MLFLAVORS_MODEL_CACHE_MAX_BYTES``), evicting the least recently used
+entries first.
+
+Cached models are shared between all callers. The pyfunc wrappers of the flavors
+serialize the calls that modify a shared model (e.g. sktime updates, or predictions
+of frameworks storing prediction state in the model like sktime, orbit and SDV) with
+the lock returned by :func:`get_model_lock`, while read-only predictions (pyod and
+statsforecast) run concurrently. Callers of ``load_model`` must not modify the
+returned model (e.g. by refitting it) while the cache is enabled.
+"""
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+from mlflavors.utils.serialization import BUFFERS_DIR_SUFFIX
+
+ENV_MAX_ENTRIES = "MLFLAVORS_MODEL_CACHE_MAX_ENTRIES"
+ENV_MAX_BYTES = "MLFLAVORS_MODEL_CACHE_MAX_BYTES"
+
+_config = {"max_entries": None, "max_bytes": None}
+_cache = OrderedDict()
+_loading_locks = {}
+_model_locks = {}
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_lock = threading.Lock()
+
+
+class _Entry:
+    def __init__(self, model, nbytes):
+        self.model = model
+        self.nbytes = nbytes
+
+
+def enable(max_entries=32, max_bytes=None):
+    """
+    Enable the model cache for the current process.
+
+    :param max_entries: Maximum number of cached models.
+    :param max_bytes: Upper bound of the estimated memory footprint of the cached
+        models in bytes. If ``None``, the footprint is not bounded.
+    """
+    for name, value in (("max_entries", max_entries), ("max_bytes", max_bytes)):
+        if value is not None and value <= 0:
+            raise MlflowException(
+                message=f"`{name}` must be a positive integer, got {value}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+    with _lock:
+        _config["max_entries"] = max_entries
+        _config["max_bytes"] = max_bytes
+        _evict()
+
+
+def disable():
+    """Disable the model cache for the current process and remove all entries."""
+    with _lock:
+        _config["max_entries"] = None
+        _config["max_bytes"] = None
+    clear()
+
+
+def _get_limits():
+    if _config["max_entries"] is not None:
+        return _config["max_entries"], _config["max_bytes"]
+    if os.environ.get(ENV_MAX_ENTRIES):
+        max_bytes = os.environ.get(ENV_MAX_BYTES)
+        return int(os.environ[ENV_MAX_ENTRIES]), int(max_bytes) if max_bytes else None
+    return None, None
+
+
+def is_enabled():
+    """Return whether the model cache is enabled."""
+    return _get_limits()[0] is not None
+
+
+def clear():
+    """Remove all entries of the cache."""
+    with _lock:
+        _cache.clear()
+
+
+def stats():
+    """
+    :return: A dictionary with the number of cache ``hits``, ``misses`` and
+             ``evictions`` of the current process, the number of cached ``entries``
+             and their estimated size in ``bytes``.
+    """
+    with _lock:
+        return dict(
+            _stats,
+            entries=len(_cache),
+            bytes=sum(entry.nbytes for entry in _cache.values()),
+        )
+
+
+def reset_stats():
+    """Reset the counters returned by :func:`stats`."""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def _evict():
+    max_entries, max_bytes = _get_limits()
+    if max_entries is None:
+        return
+    total = sum(entry.nbytes for entry in _cache.values())
+    while _cache and (
+        len(_cache) > max_entries or (max_bytes is not None and total > max_bytes)
+    ):
+        _, entry = _cache.popitem(last=False)
+        total -= entry.nbytes
+        _stats["evictions"] += 1
+
+
+def _artifact_size(path):
+    size = os.path.getsize(path)
+    buffers_dir = f"{path}{BUFFERS_DIR_SUFFIX}"
+    if os.path.isdir(buffers_dir):
+        size += sum(
+            entry.stat().st_size for entry in os.scandir(buffers_dir) if entry.is_file()
+        )
+    return size
+
+
+def get_or_load(loader, path, **kwargs):
+    """
+    Return the cached model of the model file ``path`` or load it with ``loader``.
+
+    :param loader: Function deserializing the model, called as
+        ``loader(path=path, **kwargs)`` on a cache miss.
+    :param path: Local path of the model file.
+    :param kwargs: Serialization settings passed to ``loader``, which are part of the
+        cache key.
+    :return: The deserialized model.
+    """
+    if not is_enabled():
+        return loader(path=path, **kwargs)
+
+    stat = os.stat(path)
+    key = (
+        os.path.realpath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        tuple(sorted(kwargs.items())),
+    )
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return entry.model
+        loading_lock = _loading_locks.setdefault(key, threading.Lock())
+
+    # Only one thread deserializes a given model, the others wait for the entry.
+    with loading_lock:
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                _cache.move_to_end(key)
+                _stats["hits"] += 1
+                return entry.model
+        try:
+            model = loader(path=path, **kwargs)
+            with _lock:
+                _stats["misses"] += 1
+                _, max_bytes = _get_limits()
+                nbytes = _artifact_size(path)
+                if max_bytes is None or nbytes <= max_bytes:
+                    _cache[key] = _Entry(model, nbytes)
+                    _evict()
+        finally:
+            with _lock:
+                _loading_locks.pop(key, None)
+    return model
+
+
+def get_model_lock(model):
+    """
+    Return the lock guarding calls into ``model``.
+
+    All callers share a single lock per model object, whether it is cached, has been
+    evicted or was loaded with the cache disabled. The lock lives as long as the
+    model.
+
+    :param model: A model returned by :func:`get_or_load`.
+    :return: A reentrant lock.
+    """
+    with _lock:
+        lock = _model_locks.get(id(model))
+        if lock is None:
+            lock = _model_locks[id(model)] = threading.RLock()
+            # Models are not necessarily hashable (e.g. sktime estimators), so locks
+            # are keyed by identity and dropped when the model is garbage collected.
+            weakref.finalize(model, _model_locks.pop, id(model), None)
+        return lock
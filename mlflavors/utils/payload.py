@@ -0,0 +1,147 @@
+"""
+Binary payloads of exogenous regressors.
+
+The pyfunc wrappers of the orbit and statsforecast flavors accept the exogenous
+regressor ``X`` as a binary payload instead of a list of rows, which avoids building
+the ``Pandas DataFrame`` from Python objects and casting every column. The payload is
+either passed base64 encoded in the ``X`` column of the configuration, or as a path
+to a local file in the ``X_path`` column. The ``X_format`` column specifies the
+format of the payload:
+
+- ``"arrow"``: An Arrow IPC stream or file (e.g. a Feather V2 file). The column
+  names and types are taken from the Arrow schema.
+- ``"npy"``: A NumPy ``.npy`` array. Structured arrays provide the column names and
+  types through their fields, plain two-dimensional arrays require the ``X_cols``
+  column.
+
+:func:`encode_frame` encodes a ``Pandas DataFrame`` for the ``X`` column.
+"""
+import base64
+import io
+import os
+
+import numpy as np
+import pandas as pd
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+PAYLOAD_FORMAT_ARROW = "arrow"
+PAYLOAD_FORMAT_NPY = "npy"
+SUPPORTED_PAYLOAD_FORMATS = [PAYLOAD_FORMAT_ARROW, PAYLOAD_FORMAT_NPY]
+
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+
+def encode_frame(df, payload_format=PAYLOAD_FORMAT_ARROW):
+    """
+    Encode a ``Pandas DataFrame`` as base64 payload for the ``X`` column.
+
+    :param df: The exogenous regressor.
+    :param payload_format: ``"arrow"`` (default) or ``"npy"``, which stores the
+        columns as fields of a structured array.
+    :return: The base64 encoded payload.
+    """
+    _validate_payload_format(payload_format)
+    out = io.BytesIO()
+    if payload_format == PAYLOAD_FORMAT_ARROW:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.ipc.new_stream(out, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        # Object columns cannot be stored without pickle, so strings are stored as
+        # fixed width unicode fields.
+        column_dtypes = {
+            column: f"U{max(df[column].astype(str).str.len().max(), 1)}"
+            for column in df.columns
+            if df[column].dtype == object
+        }
+        records = df.to_records(index=False, column_dtypes=column_dtypes)
+        np.save(out, records, allow_pickle=False)
+    return base64.b64encode(out.getvalue()).decode("ascii")
+
+
+def is_payload(attrs):
+    """Return whether a configuration row passes ``X`` as binary payload."""
+    return attrs.get("X_format") is not None or attrs.get("X_path") is not None
+
+
+def decode_frame(attrs):
+    """
+    Build the exogenous regressor ``Pandas DataFrame`` of a configuration row.
+
+    :param attrs: The configuration row with the ``X`` or ``X_path``, ``X_format``
+        and optionally ``X_cols`` entries.
+    :return: A ``Pandas DataFrame``.
+    """
+    X = attrs.get("X")
+    X_path = attrs.get("X_path")
+    payload_format = attrs.get("X_format")
+    if payload_format is None and X_path is not None:
+        payload_format = (
+            PAYLOAD_FORMAT_NPY if str(X_path).endswith(".npy") else PAYLOAD_FORMAT_ARROW
+        )
+    _validate_payload_format(payload_format)
+
+    if X_path is not None:
+        if not os.path.isfile(X_path):
+            raise MlflowException(
+                f"The regressor payload file `X_path` {X_path} does not exist.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+    elif not isinstance(X, (str, bytes)):
+        raise MlflowException(
+            "The regressor payload `X` must be a base64 encoded string if `X_format` "
+            "is provided without `X_path`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    if payload_format == PAYLOAD_FORMAT_ARROW:
+        return _decode_arrow(X, X_path)
+    return _decode_npy(X, X_path, attrs.get("X_cols"))
+
+
+def _validate_payload_format(payload_format):
+    if payload_format not in SUPPORTED_PAYLOAD_FORMATS:
+        raise MlflowException(
+            f"Unrecognized regressor payload format: {payload_format}. Please "
+            f"specify one of {SUPPORTED_PAYLOAD_FORMATS}.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
+def _decode_arrow(X, X_path):
+    import pyarrow as pa
+
+    # Files are memory mapped, so that columns without nulls are not copied until
+    # the conversion to pandas.
+    source = (
+        pa.memory_map(X_path)
+        if X_path
+        else pa.BufferReader(pa.py_buffer(base64.b64decode(X)))
+    )
+    if source.read(len(_ARROW_FILE_MAGIC)) == _ARROW_FILE_MAGIC:
+        table = pa.ipc.open_file(source).read_all()
+    else:
+        source.seek(0)
+        table = pa.ipc.open_stream(source).read_all()
+    # Keeping a block per column avoids copying the columns into consolidated blocks.
+    return table.to_pandas(split_blocks=True)
+
+
+def _decode_npy(X, X_path, X_cols):
+    if X_path:
+        array = np.load(X_path, mmap_mode="r", allow_pickle=False)
+    else:
+        array = np.load(io.BytesIO(base64.b64decode(X)), allow_pickle=False)
+
+    if array.dtype.names is not None:
+        return pd.DataFrame({name: array[name] for name in array.dtype.names})
+    if array.ndim != 2 or X_cols is None:
+        raise MlflowException(
+            "A regressor payload in `npy` format must be a structured array or a "
+            "two-dimensional array with its column names provided in `X_cols`.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return pd.DataFrame(array, columns=X_cols, copy=False)
@@ -0,0 +1,262 @@
+"""
+Opt-in cache of forecast results for repeated identical prediction requests.
+
+When the cache is enabled, either with :func:`enable` or by setting the
+``MLFLAVORS_RESULT_CACHE_MAX_ENTRIES`` environment variable, pyfunc wrappers created
+afterwards (currently the sktime wrapper) keep a :class:`ResultCache` of the
+predictions of each configuration row. A row whose parsed configuration equals that
+of an earlier request is answered from the cache instead of calling the model.
+
+Entries are keyed by a hash of the canonicalized configuration, which includes a
+content hash of the exogenous regressor ``X`` if present. Each cache is bounded by
+the number of entries, by the memory footprint of the cached predictions
+(``MLFLAVORS_RESULT_CACHE_MAX_BYTES``) and by the age of the entries in seconds
+(``MLFLAVORS_RESULT_CACHE_TTL``), evicting the least recently used entries first.
+Predictions are copied when they are cached and when they are returned, so callers
+cannot modify the cached results.
+"""
+import hashlib
+import os
+import pickle
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+ENV_MAX_ENTRIES = "MLFLAVORS_RESULT_CACHE_MAX_ENTRIES"
+ENV_MAX_BYTES = "MLFLAVORS_RESULT_CACHE_MAX_BYTES"
+ENV_TTL = "MLFLAVORS_RESULT_CACHE_TTL"
+
+_config = {"max_entries": None, "max_bytes": None, "ttl": None}
+_caches = weakref.WeakSet()
+_lock = threading.Lock()
+
+
+class _Entry:
+    def __init__(self, value, nbytes, expires):
+        self.value = value
+        self.nbytes = nbytes
+        self.expires = expires
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of predictions with optional expiry.
+
+    :param max_entries: Maximum number of cached predictions.
+    :param max_bytes: Upper bound of the memory footprint of the cached predictions
+        in bytes. If ``None``, the footprint is not bounded.
+    :param ttl: Number of seconds after which an entry expires. If ``None``, entries
+        do not expire.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=None):
+        _validate_limits(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return a copy of the cached predictions of ``key``, or ``None``.
+
+        :param key: A key returned by :func:`config_key`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires < time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return entry.value.copy()
+
+    def put(self, key, value):
+        """
+        Cache a copy of the predictions ``value`` under ``key``.
+
+        :param key: A key returned by :func:`config_key`.
+        :param value: The predictions as ``Pandas Series`` or ``DataFrame``.
+        """
+        value = value.copy()
+        nbytes = _memory_usage(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        expires = np.inf if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, nbytes, expires)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _remove(self, key):
+        self._nbytes -= self._entries.pop(key).nbytes
+
+    def clear(self):
+        """Remove all entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        """
+        :return: A dictionary with the number of cache ``hits``, ``misses``,
+                 ``evictions`` and ``expirations``, the ``hit_rate``, and the number
+                 of cached ``entries`` and their size in ``bytes``.
+        """
+        with self._lock:
+            return _with_hit_rate(
+                dict(self._stats, entries=len(self._entries), bytes=self._nbytes)
+            )
+
+    def reset_stats(self):
+        """Reset the counters returned by :meth:`stats`."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+def _validate_limits(**limits):
+    for name, value in limits.items():
+        if value is not None and value <= 0:
+            raise MlflowException(
+                message=f"`{name}` must be a positive number, got {value}.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+
+def _memory_usage(value):
+    usage = value.memory_usage(deep=True)
+    return int(usage if np.isscalar(usage) else usage.sum())
+
+
+def _with_hit_rate(stats):
+    requests = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / requests if requests else 0.0
+    return stats
+
+
+def enable(max_entries=1024, max_bytes=None, ttl=None):
+    """
+    Enable result caches for pyfunc wrappers created in the current process.
+
+    :param max_entries: Maximum number of cached predictions per wrapper.
+    :param max_bytes: Upper bound of the memory footprint of the cached predictions
+        per wrapper in bytes. If ``None``, the footprint is not bounded.
+    :param ttl: Number of seconds after which a cached prediction expires. If
+        ``None``, cached predictions do not expire.
+    """
+    if max_entries is None:
+        raise MlflowException(
+            message="`max_entries` must be a positive number, got None.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    _validate_limits(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+    with _lock:
+        _config.update(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+
+
+def disable():
+    """Disable result caches for pyfunc wrappers created afterwards."""
+    with _lock:
+        _config.update(max_entries=None, max_bytes=None, ttl=None)
+
+
+def _get_limits():
+    with _lock:
+        if _config["max_entries"] is not None:
+            return dict(_config)
+    if os.environ.get(ENV_MAX_ENTRIES):
+        max_bytes = os.environ.get(ENV_MAX_BYTES)
+        ttl = os.environ.get(ENV_TTL)
+        return {
+            "max_entries": int(os.environ[ENV_MAX_ENTRIES]),
+            "max_bytes": int(max_bytes) if max_bytes else None,
+            "ttl": float(ttl) if ttl else None,
+        }
+    return None
+
+
+def is_enabled():
+    """Return whether result caches are enabled."""
+    return _get_limits() is not None
+
+
+def create_result_cache():
+    """
+    Create the result cache of a pyfunc wrapper.
+
+    :return: A :class:`ResultCache` with the configured limits, or ``None`` if result
+             caches are disabled.
+    """
+    limits = _get_limits()
+    if limits is None:
+        return None
+    cache = ResultCache(**limits)
+    with _lock:
+        _caches.add(cache)
+    return cache
+
+
+def stats():
+    """
+    :return: The counters of :meth:`ResultCache.stats` summed over all result caches
+             of the current process.
+    """
+    with _lock:
+        caches = list(_caches)
+    totals = dict.fromkeys(
+        ["hits", "misses", "evictions", "expirations", "entries", "bytes"], 0
+    )
+    for cache in caches:
+        for key, value in cache.stats().items():
+            if key in totals:
+                totals[key] += value
+    return _with_hit_rate(totals)
+
+
+def _canonical(value):
+    if value is None or isinstance(value, (str, bytes, bool)):
+        return value
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        return ("pandas", hashlib.sha256(pickle.dumps(value, protocol=5)).hexdigest())
+    if isinstance(value, np.ndarray):
+        return ("ndarray", hashlib.sha256(pickle.dumps(value, protocol=5)).hexdigest())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canonical(item)) for key, item in value.items()))
+    return value
+
+
+def config_key(config):
+    """
+    Return the cache key of a parsed prediction configuration.
+
+    Sequences and NumPy scalars are canonicalized and arrays and ``Pandas`` objects
+    (e.g. the exogenous regressor) are represented by a hash of their content.
+
+    :param config: A dictionary of prediction parameters.
+    :return: A hash of the canonicalized configuration.
+    """
+    return hashlib.sha256(pickle.dumps(_canonical(config), protocol=5)).digest()
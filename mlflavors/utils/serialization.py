@@ -0,0 +1,242 @@
+"""Serialization helpers shared by the flavor modules."""
+import json
+import mmap
+import os
+import pickle
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.requirements_utils import _get_pinned_requirement
+
+BUFFERS_DIR_SUFFIX = ".buffers"
+BUFFERS_MANIFEST = "manifest.json"
+
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_LZ4 = "lz4"
+COMPRESSION_GZIP = "gzip"
+SUPPORTED_COMPRESSIONS = [
+    COMPRESSION_ZSTD,
+    COMPRESSION_LZ4,
+    COMPRESSION_GZIP,
+]
+COMPRESSION_FILE_EXTENSIONS = {
+    COMPRESSION_ZSTD: ".zst",
+    COMPRESSION_LZ4: ".lz4",
+    COMPRESSION_GZIP: ".gz",
+}
+# Valid compression levels of the codecs (zstd also accepts negative fast levels).
+COMPRESSION_LEVELS = {
+    COMPRESSION_ZSTD: (-131072, 22),
+    COMPRESSION_LZ4: (0, 16),
+    COMPRESSION_GZIP: (0, 9),
+}
+_COMPRESSION_PACKAGES = {
+    COMPRESSION_ZSTD: "zstandard",
+    COMPRESSION_LZ4: "lz4",
+}
+# Compression is applied to the pickle stream, which rules out the formats that
+# memory-map parts of the artifact on load.
+_COMPRESSIBLE_SERIALIZATION_FORMATS = ["pickle", "cloudpickle"]
+
+
+def _buffers_dir(path):
+    return f"{path}{BUFFERS_DIR_SUFFIX}"
+
+
+def dump_out_of_band(model, path):
+    """
+    Pickle ``model`` to ``path`` with pickle protocol 5, writing out-of-band buffers
+    (e.g. the data of contiguous NumPy arrays) as raw sidecar files.
+
+    The buffers are written to ``<path>.buffers/<index>.bin`` in the order in which
+    the pickler emits them, which is the order in which :func:`load_out_of_band`
+    must provide them. Their number and sizes are recorded in
+    ``<path>.buffers/manifest.json``.
+
+    :param model: Object to serialize.
+    :param path: Local path of the pickle file.
+    """
+    buffers_dir = _buffers_dir(path)
+    os.makedirs(buffers_dir, exist_ok=True)
+    sizes = []
+
+    def buffer_callback(buffer):
+        raw = buffer.raw()
+        with open(os.path.join(buffers_dir, f"{len(sizes)}.bin"), "wb") as out:
+            out.write(raw)
+        sizes.append(raw.nbytes)
+
+    with open(path, "wb") as out:
+        pickle.dump(model, out, protocol=5, buffer_callback=buffer_callback)
+    with open(os.path.join(buffers_dir, BUFFERS_MANIFEST), "w") as out:
+        json.dump({"sizes": sizes}, out)
+
+
+def load_out_of_band(path):
+    """
+    Load an object written by :func:`dump_out_of_band`.
+
+    Each sidecar file is memory-mapped copy-on-write and handed to the unpickler
+    as-is, so NumPy arrays are reconstructed on top of the mapped pages instead of
+    being copied out of the pickle stream. Processes loading the same model share
+    these pages through the page cache until they are written to.
+
+    :param path: Local path of the pickle file.
+    :return: The deserialized object.
+    """
+    buffers_dir = _buffers_dir(path)
+    try:
+        with open(os.path.join(buffers_dir, BUFFERS_MANIFEST)) as f:
+            sizes = json.load(f)["sizes"]
+    except FileNotFoundError:
+        raise MlflowException(
+            message=(
+                f"The out-of-band buffers of {path} are incomplete, the manifest "
+                f"{BUFFERS_MANIFEST} is missing."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    buffers = []
+    for i, expected_size in enumerate(sizes):
+        with open(os.path.join(buffers_dir, f"{i}.bin"), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size != expected_size:
+                # E.g. a partially downloaded artifact.
+                raise MlflowException(
+                    message=(
+                        f"The out-of-band buffer {i}.bin of {path} has {size} bytes, "
+                        f"expected {expected_size} bytes."
+                    ),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            # Empty files cannot be memory-mapped.
+            if size == 0:
+                buffers.append(bytearray())
+            else:
+                buffers.append(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_COPY))
+
+    with open(path, "rb") as pickled_model:
+        return pickle.load(pickled_model, buffers=buffers)
+
+
+def validate_compression(compression, serialization_format, compression_level=None):
+    """
+    Validate the ``compression`` and ``compression_level`` arguments of ``save_model``.
+
+    :param compression: Name of the compression codec or ``None``.
+    :param serialization_format: The serialization format of the model.
+    :param compression_level: The compression level or ``None``.
+    """
+    if compression is None:
+        if compression_level is not None:
+            raise MlflowException(
+                message="`compression_level` requires `compression`.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return
+
+    if compression not in SUPPORTED_COMPRESSIONS:
+        raise MlflowException(
+            message=(
+                f"Unrecognized compression: {compression}. Please specify one of the "
+                f"following supported compressions: {SUPPORTED_COMPRESSIONS}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    if serialization_format not in _COMPRESSIBLE_SERIALIZATION_FORMATS:
+        raise MlflowException(
+            message=(
+                f"Compression is not supported for serialization format "
+                f"{serialization_format}. Please specify one of the following "
+                f"serialization formats: {_COMPRESSIBLE_SERIALIZATION_FORMATS}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    package = _COMPRESSION_PACKAGES.get(compression)
+    if package is not None:
+        try:
+            __import__(package)
+        except ImportError:
+            raise MlflowException(
+                message=(
+                    f"The {compression} compression requires the {package} package. "
+                    f"Please install it with `pip install {package}`."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+    if compression_level is not None:
+        low, high = COMPRESSION_LEVELS[compression]
+        if (
+            not isinstance(compression_level, int)
+            or isinstance(compression_level, bool)
+            or not low <= compression_level <= high
+        ):
+            raise MlflowException(
+                message=(
+                    f"Invalid `compression_level` {compression_level} for the "
+                    f"{compression} compression. It must be an integer between {low} "
+                    f"and {high}."
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+
+def get_compression_pip_requirements(compression):
+    """
+    :return: A list of pip requirements needed to decompress models saved with
+             ``compression``.
+    """
+    package = _COMPRESSION_PACKAGES.get(compression)
+    return [_get_pinned_requirement(package)] if package is not None else []
+
+
+def open_model_file(path, mode, compression=None, compression_level=None):
+    """
+    Open a model file for reading or writing, (de)compressing it transparently.
+
+    :param path: Local path of the model file.
+    :param mode: Either ``"rb"`` or ``"wb"``.
+    :param compression: Name of the compression codec or ``None`` for no compression.
+    :param compression_level: Compression level passed to the codec when writing. If
+        ``None``, the default level of the codec is used.
+    :return: A binary file object.
+    """
+    if compression is None:
+        return open(path, mode)
+
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+
+        if mode == "wb":
+            # Use all logical cores for compression.
+            cctx = zstandard.ZstdCompressor(
+                level=3 if compression_level is None else compression_level,
+                threads=-1,
+            )
+            return zstandard.open(path, mode, cctx=cctx)
+        return zstandard.open(path, mode)
+
+    if compression == COMPRESSION_LZ4:
+        import lz4.frame
+
+        kwargs = {}
+        if compression_level is not None:
+            kwargs["compression_level"] = compression_level
+        return lz4.frame.open(path, mode, **kwargs)
+
+    if compression == COMPRESSION_GZIP:
+        import gzip
+
+        kwargs = {}
+        if compression_level is not None:
+            kwargs["compresslevel"] = compression_level
+        return gzip.open(path, mode, **kwargs)
+
+    raise MlflowException(
+        message=f"Unrecognized compression: {compression}",
+        error_code=INVALID_PARAMETER_VALUE,
+    )
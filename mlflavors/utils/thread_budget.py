@@ -0,0 +1,130 @@
+"""
+Opt-in process-wide budget of the threads used by native thread pools.
+
+The numerical libraries behind the flavors size their thread pools to the whole
+machine: BLAS and OpenMP (e.g. used by scikit-learn for pyod detectors and by
+statsmodels for sktime forecasters) and torch (e.g. used by SDV synthesizers). When
+several serving workers run on the same machine, e.g. ``mlflow models serve`` with
+multiple workers, each of them starts as many threads as there are cores, which
+oversubscribes the CPUs and collapses the latency of every request.
+
+When the budget is set, either with :func:`enable` or with the
+``MLFLAVORS_THREAD_BUDGET`` environment variable, the pyfunc wrappers of the flavors
+call the framework within :func:`limit_threads`, which limits the BLAS and OpenMP
+thread pools of the process through ``threadpoolctl`` and the intra-op threads of
+torch (if it is imported) to the budget. With ``n`` workers on ``c`` cores, a budget
+of ``c // n`` threads per worker avoids oversubscription.
+
+The limits of native thread pools are global to the process, so restoring them after
+each call would race with concurrent calls of other wrappers. The budget is therefore
+applied on the first call (and again whenever new modules, which may load further
+thread pools, have been imported since) and kept until :func:`disable` restores the
+original limits.
+"""
+import contextlib
+import os
+import sys
+import threading
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+ENV_THREAD_BUDGET = "MLFLAVORS_THREAD_BUDGET"
+
+_config = {"max_threads": None}
+_state = {"applied": None, "limiter": None, "torch_threads": None}
+_lock = threading.Lock()
+
+
+def _validate_max_threads(max_threads):
+    if (
+        not isinstance(max_threads, int)
+        or isinstance(max_threads, bool)
+        or max_threads <= 0
+    ):
+        raise MlflowException(
+            message=f"`max_threads` must be a positive integer, got {max_threads}.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
+def enable(max_threads):
+    """
+    Set the thread budget of the current process.
+
+    :param max_threads: Maximum number of threads of each native thread pool.
+    """
+    _validate_max_threads(max_threads)
+    with _lock:
+        _config["max_threads"] = max_threads
+
+
+def disable():
+    """Remove the thread budget and restore the original thread pool limits."""
+    with _lock:
+        _config["max_threads"] = None
+        _restore()
+
+
+def get_thread_budget():
+    """
+    Return the thread budget of the current process.
+
+    :return: The maximum number of threads set with :func:`enable` or the
+             ``MLFLAVORS_THREAD_BUDGET`` environment variable, or ``None`` if no
+             budget is set.
+    """
+    if _config["max_threads"] is not None:
+        return _config["max_threads"]
+    if os.environ.get(ENV_THREAD_BUDGET):
+        max_threads = int(os.environ[ENV_THREAD_BUDGET])
+        _validate_max_threads(max_threads)
+        return max_threads
+    return None
+
+
+def is_enabled():
+    """Return whether a thread budget is set."""
+    return get_thread_budget() is not None
+
+
+def _restore():
+    if _state["limiter"] is not None:
+        _state["limiter"].restore_original_limits()
+    if _state["torch_threads"] is not None and "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(_state["torch_threads"])
+    _state.update(applied=None, limiter=None, torch_threads=None)
+
+
+def _apply(max_threads):
+    from threadpoolctl import ThreadpoolController
+
+    # Inspecting the loaded libraries takes milliseconds, so it is only repeated if
+    # modules have been imported since the budget was last applied.
+    applied = (max_threads, len(sys.modules))
+    if _state["applied"] == applied:
+        return
+    if _state["limiter"] is not None:
+        _state["limiter"].restore_original_limits()
+    _state["limiter"] = ThreadpoolController().limit(limits=max_threads)
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        if _state["torch_threads"] is None:
+            _state["torch_threads"] = torch.get_num_threads()
+        torch.set_num_threads(max_threads)
+    _state["applied"] = applied
+
+
+@contextlib.contextmanager
+def limit_threads():
+    """
+    Context manager running framework calls within the thread budget.
+
+    Does nothing if no budget is set.
+    """
+    max_threads = get_thread_budget()
+    if max_threads is not None:
+        with _lock:
+            _apply(max_threads)
+    yield
@@ -16,8 +16,14 @@ ORBIT_REQUIREMENTS = [
     "orbit-ml",
 ]
 
+COMPRESSION_REQUIREMENTS = [
+    "lz4",
+    "zstandard",
+]
+
 DEV_REQUIREMENTS = [
     "datasetsforecast==0.0.8",
+    "lz4",
     "pmdarima",
     "pre-commit",
     "pytest",
@@ -29,6 +35,7 @@ DEV_REQUIREMENTS = [
     "sphinx_rtd_theme==1.1.1",
     "sphinx==5.3.0",
     "urllib3<2",
+    "zstandard",
 ]
 
 setup(
@@ -52,6 +59,7 @@ setup(
     extras_require={
         "dev": DEV_REQUIREMENTS,
         "orbit": ORBIT_REQUIREMENTS,
+        "compression": COMPRESSION_REQUIREMENTS,
     },
     version=__version__,
     keywords="machine-learning ai mlflow",
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from mlflow.exceptions import MlflowException
+from pandas.testing import assert_series_equal
+from sktime.datasets import load_airline
+from sktime.forecasting.naive import NaiveForecaster
+
+import mlflavors.sktime
+from mlflavors.utils import aio
+
+FH = [1, 2, 3]
+
+
+@pytest.fixture(scope="module")
+def naive_model():
+    """Create instance of fitted sktime model."""
+    return NaiveForecaster(strategy="drift").fit(load_airline())
+
+
+@pytest.fixture
+def model_path(tmp_path, naive_model):
+    """Save a sktime model."""
+    path = tmp_path.joinpath("model")
+    mlflavors.sktime.save_model(naive_model, path)
+    return path
+
+
+@pytest.fixture
+def executor():
+    """Configure the asyncio entry points with a thread pool."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        aio.configure(executor=executor, max_concurrency=2)
+        yield executor
+        aio.configure()
+
+
+def test_load_model_async(model_path, naive_model, executor):
+    """Test the asynchronous variant of load_model."""
+    loaded_model = asyncio.run(mlflavors.sktime.load_model_async(model_path))
+
+    assert_series_equal(loaded_model.predict(fh=FH), naive_model.predict(fh=FH))
+
+
+def test_pyfunc_predict_async(model_path, naive_model, executor):
+    """Test concurrent asynchronous pyfunc predictions."""
+    predict_conf = pd.DataFrame([{"fh": FH, "predict_method": "predict"}])
+
+    async def predict():
+        loaded_pyfunc = await aio.load_pyfunc_async(model_path)
+        wrapper = loaded_pyfunc._model_impl
+        return await asyncio.gather(
+            aio.predict_async(loaded_pyfunc, predict_conf),
+            wrapper.predict_async(predict_conf),
+        )
+
+    predictions = asyncio.run(predict())
+
+    expected = naive_model.predict(fh=FH)
+    for prediction in predictions:
+        assert_series_equal(prediction, expected)
+
+
+def test_run_blocking_limits_concurrency(executor):
+    """Test at most max_concurrency blocking calls run at the same time."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def block():
+        with lock:
+            running.append(None)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    async def run():
+        await asyncio.gather(*(aio.run_blocking(block) for _ in range(8)))
+
+    asyncio.run(run())
+
+    assert max(max_running) == 2
+
+
+def test_configure_raises_invalid_arguments():
+    """Test configure with invalid arguments."""
+    with pytest.raises(MlflowException, match="`executor` must be an instance"):
+        aio.configure(executor="thread")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(
+            MlflowException, match="ThreadPoolExecutor`, got ProcessPoolExecutor"
+        ):
+            aio.configure(executor=executor)
+    with pytest.raises(MlflowException, match="`max_concurrency` must be a positive"):
+        aio.configure(max_concurrency=0)
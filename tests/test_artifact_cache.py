@@ -0,0 +1,204 @@
+import fcntl
+import os
+import shutil
+import subprocess
+import sys
+from unittest import mock
+
+import mlflow
+import pytest
+from mlflow.utils.file_utils import local_file_uri_to_path
+from numpy.testing import assert_array_equal
+from pyod.models.knn import KNN
+from pyod.utils.data import generate_data
+
+import mlflavors.pyod
+from mlflavors.utils import artifact_cache
+
+
+@pytest.fixture(scope="module")
+def data():
+    """Create sample data for pyod model."""
+    X_train, X_test, _, _ = generate_data(
+        n_train=200, n_test=50, n_features=2, random_state=42
+    )
+    return X_train, X_test
+
+
+@pytest.fixture(scope="module")
+def knn_model(data):
+    """Create instance of fitted pyod model."""
+    X_train, _ = data
+    return KNN().fit(X_train)
+
+
+@pytest.fixture
+def tracking_uri(tmp_path):
+    """Use a file store in a temporary directory for tracking."""
+    previous_uri = mlflow.get_tracking_uri()
+    uri = tmp_path.joinpath("mlruns").as_uri()
+    mlflow.set_tracking_uri(uri)
+    yield uri
+    mlflow.set_tracking_uri(previous_uri)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Enable the artifact cache in a temporary directory."""
+    cache_dir = tmp_path.joinpath("cache")
+    artifact_cache.enable(cache_dir)
+    artifact_cache.reset_stats()
+    yield cache_dir
+    artifact_cache.disable()
+    artifact_cache.reset_stats()
+
+
+def _log_model(model):
+    with mlflow.start_run():
+        return mlflavors.pyod.log_model(model, "model").model_uri
+
+
+def test_load_model_hits_cache(tracking_uri, cache_dir, knn_model, data):
+    """Test repeated loads of a model are served from the cache."""
+    _, X_test = data
+    model_uri = _log_model(knn_model)
+
+    first = mlflavors.pyod.load_model(model_uri)
+    assert artifact_cache.stats()["misses"] == 1
+    assert artifact_cache.stats()["hits"] == 0
+
+    second = mlflavors.pyod.load_model(model_uri)
+    stats = artifact_cache.stats()
+    entries = os.listdir(cache_dir.joinpath("entries"))
+
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["bytes_saved"] > 0
+    assert len(entries) == 1
+    assert_array_equal(
+        first.decision_function(X_test), knn_model.decision_function(X_test)
+    )
+    assert_array_equal(
+        second.decision_function(X_test), knn_model.decision_function(X_test)
+    )
+
+
+def test_cache_evicts_least_recently_used(tracking_uri, cache_dir, knn_model):
+    """Test the cache evicts the least recently used entries when over budget."""
+    first_uri = _log_model(knn_model)
+    second_uri = _log_model(knn_model)
+
+    mlflavors.pyod.load_model(first_uri)
+    entry_size = sum(
+        f.stat().st_size
+        for f in cache_dir.joinpath("entries").rglob("*")
+        if f.is_file()
+    )
+    artifact_cache.enable(cache_dir, max_bytes=entry_size + entry_size // 2)
+    mlflavors.pyod.load_model(second_uri)
+
+    assert artifact_cache.stats()["evictions"] == 1
+    assert len(os.listdir(cache_dir.joinpath("entries"))) == 1
+
+    mlflavors.pyod.load_model(second_uri)
+    assert artifact_cache.stats()["hits"] == 1
+
+    artifact_cache.clear()
+    assert len(os.listdir(cache_dir.joinpath("entries"))) == 0
+
+
+def test_cache_is_shared_between_processes(tracking_uri, cache_dir, knn_model):
+    """Test models downloaded by another process are served from the cache."""
+    model_uri = _log_model(knn_model)
+    snippet = (
+        "import mlflow, mlflavors.pyod\n"
+        "from mlflavors.utils import artifact_cache\n"
+        f"mlflow.set_tracking_uri({tracking_uri!r})\n"
+        f"mlflavors.pyod.load_model({model_uri!r})\n"
+        "print(artifact_cache.stats()['misses'])\n"
+    )
+    env = dict(os.environ, MLFLAVORS_ARTIFACT_CACHE_DIR=str(cache_dir))
+    out = subprocess.run(
+        [sys.executable, "-c", snippet],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert out.stdout.strip().splitlines()[-1] == "1"
+
+    mlflavors.pyod.load_model(model_uri)
+    assert artifact_cache.stats()["hits"] == 1
+    assert artifact_cache.stats()["misses"] == 0
+
+
+def test_cache_downloads_resolved_uri(tracking_uri, cache_dir, knn_model):
+    """Test the cached entry is downloaded from the URI of its key."""
+    model_uri = _log_model(knn_model)
+    download = artifact_cache._download_artifact_from_uri
+
+    with mock.patch.object(
+        artifact_cache, "_download_artifact_from_uri", wraps=download
+    ) as download_mock:
+        mlflavors.pyod.load_model(model_uri)
+
+    uris = [call.kwargs.get("artifact_uri") for call in download_mock.call_args_list]
+    assert artifact_cache._resolve_uri(model_uri) in uris
+    assert model_uri not in uris
+
+
+def test_overwritten_model_files_miss_cache(
+    tracking_uri, cache_dir, knn_model, data, tmp_path
+):
+    """Test model files overwritten with an identical MLmodel file are not stale."""
+    X_train, X_test = data
+    model_uri = _log_model(knn_model)
+    mlflavors.pyod.load_model(model_uri)
+
+    other_model = KNN(n_neighbors=3).fit(X_train[:100])
+    mlflavors.pyod.save_model(other_model, tmp_path.joinpath("other"))
+    artifact_path = local_file_uri_to_path(artifact_cache._resolve_uri(model_uri))
+    shutil.copy(
+        tmp_path.joinpath("other", "model.pkl"),
+        os.path.join(artifact_path, "model.pkl"),
+    )
+    loaded_model = mlflavors.pyod.load_model(model_uri)
+
+    assert artifact_cache.stats()["misses"] == 2
+    assert_array_equal(
+        loaded_model.decision_function(X_test), other_model.decision_function(X_test)
+    )
+
+
+def test_entry_evicted_while_downgrading_lock(tracking_uri, cache_dir, knn_model):
+    """Test an entry evicted before the shared lock is taken is downloaded again."""
+    model_uri = _log_model(knn_model)
+    flock = fcntl.flock
+    evicted = []
+
+    def flock_with_eviction(f, operation):
+        flock(f, operation)
+        if operation == fcntl.LOCK_SH and not evicted:
+            # Another process evicting the entry between unlock and shared lock.
+            evicted.append(True)
+            shutil.rmtree(cache_dir.joinpath("entries"))
+            os.makedirs(cache_dir.joinpath("entries"))
+
+    with mock.patch("fcntl.flock", side_effect=flock_with_eviction):
+        mlflavors.pyod.load_model(model_uri)
+
+    assert evicted
+    assert artifact_cache.stats()["misses"] == 1
+    assert len(os.listdir(cache_dir.joinpath("entries"))) == 1
+
+
+def test_local_paths_bypass_cache(cache_dir, knn_model, tmp_path):
+    """Test models referenced by a local path are not cached."""
+    model_path = tmp_path.joinpath("model")
+    mlflavors.pyod.save_model(knn_model, model_path)
+    mlflavors.pyod.load_model(model_path)
+
+    assert artifact_cache.stats()["hits"] == 0
+    assert artifact_cache.stats()["misses"] == 0
+    assert not cache_dir.exists()
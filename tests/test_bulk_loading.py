@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import mlflow
+import pytest
+from mlflow.exceptions import MlflowException
+from numpy.testing import assert_array_equal
+from pyod.models.knn import KNN
+from pyod.utils.data import generate_data
+from sktime.datasets import load_airline
+from sktime.forecasting.naive import NaiveForecaster
+
+import mlflavors
+import mlflavors.pyod
+import mlflavors.sktime
+
+
+@pytest.fixture(scope="module")
+def naive_model():
+    """Create instance of fitted sktime model."""
+    return NaiveForecaster(strategy="drift").fit(load_airline())
+
+
+@pytest.fixture(scope="module")
+def knn_model():
+    """Create instance of fitted pyod model."""
+    X_train, _, _, _ = generate_data(n_train=100, n_features=2, random_state=42)
+    return KNN().fit(X_train)
+
+
+@pytest.fixture
+def model_uris(tmp_path, naive_model, knn_model):
+    """Save a sktime and a pyod model."""
+    sktime_path = tmp_path.joinpath("sktime")
+    pyod_path = tmp_path.joinpath("pyod")
+    mlflavors.sktime.save_model(naive_model, sktime_path)
+    mlflavors.pyod.save_model(knn_model, pyod_path)
+    return [str(sktime_path), str(pyod_path)]
+
+
+def _assert_loaded(results, model_uris, naive_model, knn_model):
+    assert [result.model_uri for result in results] == model_uris
+    assert [result.flavor for result in results] == ["sktime", "pyod"]
+    assert all(result.error is None for result in results)
+    assert_array_equal(
+        results[0].model.predict(fh=[1, 2, 3]), naive_model.predict(fh=[1, 2, 3])
+    )
+    assert_array_equal(results[1].model.decision_scores_, knn_model.decision_scores_)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_models(model_uris, naive_model, knn_model, executor):
+    """Test models of different flavors are loaded in input order."""
+    results = mlflavors.load_models(model_uris, max_workers=2, executor=executor)
+
+    _assert_loaded(results, model_uris, naive_model, knn_model)
+
+
+def test_load_models_with_custom_executor(model_uris, naive_model, knn_model):
+    """Test models are deserialized in a given executor."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = mlflavors.load_models(model_uris, executor=executor)
+        assert executor.submit(lambda: True).result()
+
+    _assert_loaded(results, model_uris, naive_model, knn_model)
+
+
+def test_load_models_collects_errors(tmp_path, model_uris):
+    """Test errors of individual models are returned rather than raised."""
+    sklearn_path = tmp_path.joinpath("sklearn")
+    mlflow.sklearn.save_model(mlflavors.sktime.load_model(model_uris[0]), sklearn_path)
+    missing_path = tmp_path.joinpath("missing")
+
+    results = mlflavors.load_models(
+        [str(missing_path), model_uris[0], str(sklearn_path)]
+    )
+
+    assert results[0].flavor is None and results[0].model is None
+    assert isinstance(results[0].error, Exception)
+    assert results[1].flavor == "sktime" and results[1].error is None
+    assert results[2].flavor is None
+    assert isinstance(results[2].error, MlflowException)
+    assert "has none of the flavors" in results[2].error.message
+
+
+def test_load_models_raises_invalid_executor(model_uris):
+    """Test load_models with an invalid executor."""
+    with pytest.raises(MlflowException, match="Unrecognized executor"):
+        mlflavors.load_models(model_uris, executor="fork")
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mlflow.exceptions import MlflowException
+from pandas.testing import assert_frame_equal
+
+from mlflavors.utils.casting import build_frame, get_cast_plan
+
+
+@pytest.fixture(scope="module")
+def regressor_df():
+    """Create an exogenous regressor with columns of different types."""
+    return pd.DataFrame(
+        {
+            "unique_id": ["a", "a", "bb"],
+            "ds": pd.date_range("2020-01-01", periods=3, freq="D"),
+            "promo": [0.0, 1.0, 0.5],
+            "store": np.arange(3, dtype="int32"),
+            "event": pd.Categorical(["x", "y", "x"]),
+            "holiday": [True, False, True],
+        }
+    )
+
+
+def test_build_frame_matches_column_casting(regressor_df):
+    """Test the plan produces the same frame as casting every column."""
+    X_cols, X_dtypes = regressor_df.columns, list(regressor_df.dtypes)
+    rows = regressor_df.astype({"ds": str, "event": str}).to_numpy().tolist()
+
+    for X in [regressor_df.to_numpy(), rows]:
+        expected = pd.DataFrame(data=X, columns=X_cols)
+        for col, dtype in zip(X_cols, X_dtypes):
+            expected[col] = expected[col].astype(dtype)
+
+        assert_frame_equal(expected, build_frame(X, X_cols, X_dtypes))
+
+
+def test_get_cast_plan_is_cached(regressor_df):
+    """Test plans are shared between calls with the same schema."""
+    X_dtypes = [str(dtype) for dtype in regressor_df.dtypes]
+
+    plan = get_cast_plan(regressor_df.columns, X_dtypes)
+
+    assert get_cast_plan(list(regressor_df.columns), X_dtypes) is plan
+    assert get_cast_plan(regressor_df.columns[:2], X_dtypes[:2]) is not plan
+
+
+def test_build_frame_raises_invalid_shape():
+    """Test building a frame from rows not matching the schema."""
+    with pytest.raises(MlflowException, match="does not match the number"):
+        build_frame([[1.0]], ["a"], ["float64", "int64"])
+
+    with pytest.raises(MlflowException, match="does not match the 2 regressor"):
+        build_frame([[1.0, 2.0, 3.0]], ["a", "b"], ["float64", "int64"])
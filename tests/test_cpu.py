@@ -0,0 +1,67 @@
+import os
+from unittest import mock
+
+import pytest
+from mlflow.exceptions import MlflowException
+
+from mlflavors.utils import cpu
+
+
+def write_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.mark.parametrize(
+    "files, expected",
+    [
+        ({"cpu.max": "150000 100000\n"}, 1.5),
+        ({"cpu.max": "max 100000\n"}, None),
+        (
+            {
+                "cpu/cpu.cfs_quota_us": "200000\n",
+                "cpu/cpu.cfs_period_us": "100000\n",
+            },
+            2.0,
+        ),
+        (
+            {
+                "cpu,cpuacct/cpu.cfs_quota_us": "-1\n",
+                "cpu,cpuacct/cpu.cfs_period_us": "100000\n",
+            },
+            None,
+        ),
+        ({}, None),
+    ],
+)
+def test_cgroup_cpu_limit(tmp_path, files, expected):
+    """Test the CPU quota is read from cgroup v2 and v1 files."""
+    for name, content in files.items():
+        write_file(os.path.join(tmp_path, name), content)
+    assert cpu.cgroup_cpu_limit(root=str(tmp_path)) == expected
+
+
+@pytest.mark.parametrize("limit, expected", [(None, 8), (1.5, 2), (0.5, 1), (16, 8)])
+def test_available_cpus_bounded_by_cgroup_limit(limit, expected):
+    """Test the available CPUs are bounded by the CPU quota, rounded up."""
+    cpu.available_cpus.cache_clear()
+    try:
+        with mock.patch.object(
+            cpu.os, "sched_getaffinity", return_value=set(range(8)), create=True
+        ), mock.patch.object(cpu, "cgroup_cpu_limit", return_value=limit):
+            assert cpu.available_cpus() == expected
+    finally:
+        cpu.available_cpus.cache_clear()
+
+
+def test_resolve_n_jobs():
+    """Test n_jobs values are validated and -1 resolves to the available CPUs."""
+    with mock.patch.object(cpu, "available_cpus", return_value=3):
+        assert cpu.resolve_n_jobs(-1) == 3
+    assert cpu.resolve_n_jobs(2) == 2
+    assert cpu.resolve_n_jobs(2.0) == 2
+
+    for n_jobs in [0, -2, 1.5, "2", True]:
+        with pytest.raises(MlflowException, match="Invalid `n_jobs` value"):
+            cpu.resolve_n_jobs(n_jobs)
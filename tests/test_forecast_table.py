@@ -0,0 +1,28 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from mlflavors.utils.forecast_table import load_forecast_tables, save_forecast_tables
+
+
+def test_save_and_load_forecast_tables(tmp_path):
+    """Test tables keep their index, column structure and series names."""
+    index = pd.period_range("2020-01", periods=3, freq="M")
+    predictions = pd.Series([1.0, 2.0, 3.0], index=index, name="y")
+    intervals = pd.DataFrame(
+        [[0.5, 1.5], [1.0, 3.0], [2.0, 4.0]],
+        index=index,
+        columns=pd.MultiIndex.from_tuples([("y", 0.9, "lower"), ("y", 0.9, "upper")]),
+    )
+    unnamed = predictions.rename(None)
+    path = tmp_path.joinpath("forecast_table")
+
+    save_forecast_tables(
+        {"predict": predictions, "predict_interval": intervals, "unnamed": unnamed},
+        path,
+    )
+    tables = load_forecast_tables(path)
+
+    assert sorted(tables) == ["predict", "predict_interval", "unnamed"]
+    assert_series_equal(tables["predict"], predictions)
+    assert_series_equal(tables["unnamed"], unnamed)
+    assert_frame_equal(tables["predict_interval"], intervals)
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import mlflavors
+
+
+def _loaded_modules(code):
+    """Run ``code`` in a fresh interpreter and return the loaded module names."""
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_import_does_not_load_flavors():
+    """Test that importing the package does not import any flavor module."""
+    modules = _loaded_modules("import mlflavors")
+
+    for name in mlflavors.__all__:
+        assert f"mlflavors.{name}" not in modules
+        assert name not in modules
+
+
+def test_flavor_access_only_loads_requested_framework():
+    """Test that accessing one flavor does not import the other frameworks."""
+    modules = _loaded_modules("import mlflavors\nmlflavors.pyod")
+
+    assert "mlflavors.pyod" in modules
+    for name in ["sktime", "sdv", "orbit", "statsforecast"]:
+        assert name not in modules
+        assert f"mlflavors.{name}" not in modules
+
+
+def test_flavor_attribute_resolves_submodule():
+    """Test that flavor attributes resolve to their submodules."""
+    import mlflavors.pyod
+
+    assert mlflavors.pyod.FLAVOR_NAME == "pyod"
+    assert "pyod" in dir(mlflavors)
+
+
+def test_load_models_is_public():
+    """Test that package-level functions are exported and resolved lazily."""
+    from mlflavors.utils.bulk_loading import load_models
+
+    assert "load_models" in mlflavors.__all__
+    assert "load_models" in dir(mlflavors)
+    assert mlflavors.load_models is load_models
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes raise an AttributeError."""
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        mlflavors.unknown
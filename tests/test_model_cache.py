@@ -0,0 +1,113 @@
+import gc
+import shutil
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from sktime.datasets import load_airline
+from sktime.forecasting.naive import NaiveForecaster
+
+import mlflavors.sktime
+from mlflavors.utils import model_cache
+
+
+@pytest.fixture(scope="module")
+def naive_model():
+    """Create instance of fitted sktime model."""
+    return NaiveForecaster(strategy="drift").fit(load_airline())
+
+
+@pytest.fixture
+def model_paths(tmp_path, naive_model):
+    """Save two sktime models."""
+    paths = [tmp_path.joinpath("first"), tmp_path.joinpath("second")]
+    for path in paths:
+        mlflavors.sktime.save_model(naive_model, path)
+    return paths
+
+
+@pytest.fixture
+def cache():
+    """Enable the model cache."""
+    model_cache.enable()
+    model_cache.reset_stats()
+    yield model_cache
+    model_cache.disable()
+
+
+def test_load_model_is_not_cached_by_default(model_paths):
+    """Test models are deserialized on every load if the cache is disabled."""
+    assert not model_cache.is_enabled()
+    assert mlflavors.sktime.load_model(model_paths[0]) is not (
+        mlflavors.sktime.load_model(model_paths[0])
+    )
+
+
+def test_load_model_returns_cached_model(cache, model_paths, naive_model):
+    """Test repeated loads and pyfunc loads share the cached model."""
+    first = mlflavors.sktime.load_model(model_paths[0])
+    second = mlflavors.sktime.load_model(model_paths[0])
+    wrappers = [mlflavors.sktime._load_pyfunc(str(model_paths[0])) for _ in range(2)]
+    stats = cache.stats()
+
+    assert first is second
+    assert all(wrapper.sktime_model is first for wrapper in wrappers)
+    assert wrappers[0]._lock is wrappers[1]._lock
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+
+    predict_conf = pd.DataFrame([{"predict_method": "predict", "fh": [1, 2, 3]}])
+    assert_frame_equal(
+        wrappers[0].predict(predict_conf).to_frame(),
+        naive_model.predict(fh=[1, 2, 3]).to_frame(),
+    )
+
+
+def test_resaved_model_invalidates_entry(cache, model_paths, naive_model):
+    """Test saving a new model at the same path invalidates the cached model."""
+    first = mlflavors.sktime.load_model(model_paths[0])
+    shutil.rmtree(model_paths[0])
+    mlflavors.sktime.save_model(
+        naive_model, model_paths[0], serialization_format="cloudpickle"
+    )
+
+    assert mlflavors.sktime.load_model(model_paths[0]) is not first
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_evicts_least_recently_used(cache, model_paths):
+    """Test the cache is bounded by number of entries and estimated size."""
+    cache.enable(max_entries=1)
+    first = mlflavors.sktime.load_model(model_paths[0])
+    mlflavors.sktime.load_model(model_paths[1])
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 1
+    assert mlflavors.sktime.load_model(model_paths[0]) is not first
+
+    cache.clear()
+    cache.enable(max_entries=10, max_bytes=1)
+    mlflavors.sktime.load_model(model_paths[0])
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_model_lock_is_shared_after_eviction(cache, model_paths):
+    """Test wrappers of the same model keep sharing its lock once it is evicted."""
+    cache.enable(max_entries=1)
+    first = mlflavors.sktime._load_pyfunc(str(model_paths[0]))
+    mlflavors.sktime.load_model(model_paths[1])
+    second = mlflavors.sktime._SktimeModelWrapper(first.sktime_model)
+
+    assert cache.stats()["evictions"] == 1
+    assert second._lock is first._lock
+    assert model_cache.get_model_lock(first.sktime_model) is first._lock
+
+    model = NaiveForecaster()
+    model_id = id(model)
+    model_cache.get_model_lock(model)
+    del model
+    gc.collect()
+    assert model_id not in model_cache._model_locks
@@ -16,6 +16,7 @@ from orbit.utils.dataset import load_iclaims
 from pandas.testing import assert_frame_equal
 
 import mlflavors.orbit
+from mlflavors.utils.payload import encode_frame
 
 SEED = 2023
 DECOMPOSE = True
@@ -59,7 +60,9 @@ def dlt_model(data_iclaims):
     return dlt.fit(df=train_df)
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_dlt_model_save_and_load(
     dlt_model, model_path, serialization_format, data_iclaims
 ):
@@ -79,7 +82,9 @@ def test_dlt_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_dlt_model_pyfunc_output(
     dlt_model, model_path, serialization_format, data_iclaims
 ):
@@ -117,6 +122,79 @@ def test_dlt_model_pyfunc_output(
     assert_frame_equal(model_predictions, pyfunc_predict)
 
 
+@pytest.mark.parametrize("payload_format", ["arrow", "npy"])
+def test_dlt_model_pyfunc_binary_payload(
+    dlt_model, model_path, data_iclaims, payload_format
+):
+    """Test dlt pyfunc prediction with the regressor passed as binary payload."""
+    _, test_df = data_iclaims
+    mlflavors.orbit.save_model(orbit_model=dlt_model, path=model_path)
+    loaded_pyfunc = mlflavors.orbit.pyfunc.load_model(model_uri=model_path)
+    predict_conf = pd.DataFrame(
+        [
+            {
+                "X": encode_frame(test_df, payload_format),
+                "X_format": payload_format,
+                "seed": SEED,
+            }
+        ]
+    )
+
+    model_predictions = dlt_model.predict(test_df, seed=SEED)
+    pyfunc_predict = loaded_pyfunc.predict(predict_conf)
+
+    assert_frame_equal(model_predictions, pyfunc_predict)
+
+
+def test_dlt_model_posterior_subsampling(dlt_model, tmp_path, data_iclaims):
+    """Test saving orbit model with a subsample of the posterior draws."""
+    _, test_df = data_iclaims
+    chains = dlt_model.estimator.chains
+    num_samples = len(next(iter(dlt_model.get_posterior_samples().values())))
+    num_posterior_samples = 5 * chains
+
+    model_paths = [tmp_path.joinpath("first"), tmp_path.joinpath("second")]
+    for model_path in model_paths:
+        mlflavors.orbit.save_model(
+            orbit_model=dlt_model,
+            path=model_path,
+            num_posterior_samples=num_posterior_samples,
+        )
+    # The default seed retains the same draws in both saves.
+    loaded_models = [
+        mlflavors.orbit.load_model(model_uri=model_path) for model_path in model_paths
+    ]
+    flavor_conf = Model.load(model_paths[0]).flavors["orbit"]
+    posterior_samples = loaded_models[0].get_posterior_samples(permute=False)
+
+    assert flavor_conf["original_posterior_samples"] == num_samples
+    assert flavor_conf["retained_posterior_samples"] == num_posterior_samples
+    assert loaded_models[0].estimator.num_sample == num_posterior_samples
+    assert all(
+        value.shape[:2] == (chains, num_posterior_samples // chains)
+        for value in posterior_samples.values()
+    )
+    assert dlt_model.estimator.num_sample == num_samples
+    for key, value in loaded_models[0].get_posterior_samples().items():
+        np.testing.assert_array_equal(
+            value, loaded_models[1].get_posterior_samples()[key]
+        )
+    assert_frame_equal(
+        loaded_models[0].predict(test_df, seed=SEED),
+        loaded_models[1].predict(test_df, seed=SEED),
+    )
+
+
+def test_orbit_save_model_raises_invalid_num_posterior_samples(dlt_model, model_path):
+    """Test save_model call raises error with invalid number of posterior samples."""
+    with pytest.raises(MlflowException, match="`num_posterior_samples` must be"):
+        mlflavors.orbit.save_model(
+            orbit_model=dlt_model,
+            path=model_path,
+            num_posterior_samples=dlt_model.estimator.chains + 1,
+        )
+
+
 @pytest.mark.parametrize("use_signature", [True, False])
 def test_signature_and_examples_saved_correctly(
     dlt_model,
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mlflow.exceptions import MlflowException
+from pandas.testing import assert_frame_equal
+
+from mlflavors.utils.payload import decode_frame, encode_frame
+
+
+@pytest.fixture(scope="module")
+def regressor_df():
+    """Create an exogenous regressor with datetime, string and numeric columns."""
+    return pd.DataFrame(
+        {
+            "unique_id": ["a", "a", "bb", "bb"],
+            "ds": pd.date_range("2020-01-01", periods=4, freq="D"),
+            "promo": [0.0, 1.0, 0.5, 1.5],
+            "store": np.arange(4, dtype="int32"),
+        }
+    )
+
+
+@pytest.mark.parametrize("payload_format", ["arrow", "npy"])
+def test_encode_and_decode_frame(regressor_df, payload_format):
+    """Test base64 payloads preserve column names and types."""
+    X = encode_frame(regressor_df, payload_format)
+
+    decoded = decode_frame({"X": X, "X_format": payload_format})
+
+    assert_frame_equal(regressor_df, decoded)
+
+
+def test_decode_frame_from_files(regressor_df, tmp_path):
+    """Test payloads referenced by path with the format inferred from extension."""
+    arrow_path = tmp_path.joinpath("X.feather")
+    regressor_df.to_feather(arrow_path)
+    npy_path = tmp_path.joinpath("X.npy")
+    np.save(npy_path, regressor_df[["promo", "store"]].to_numpy(dtype=float))
+
+    assert_frame_equal(regressor_df, decode_frame({"X_path": str(arrow_path)}))
+    assert_frame_equal(
+        regressor_df[["promo", "store"]].astype(float),
+        decode_frame({"X_path": str(npy_path), "X_cols": ["promo", "store"]}),
+    )
+
+
+def test_decode_frame_raises_invalid_payload(tmp_path):
+    """Test decoding invalid payload configurations."""
+    with pytest.raises(MlflowException, match="Unrecognized regressor payload"):
+        decode_frame({"X": "", "X_format": "json"})
+
+    with pytest.raises(MlflowException, match="does not exist"):
+        decode_frame({"X_path": str(tmp_path.joinpath("missing.arrow"))})
+
+    with pytest.raises(MlflowException, match="must be a base64 encoded string"):
+        decode_frame({"X": [[1.0]], "X_format": "arrow"})
+
+    npy_path = tmp_path.joinpath("X.npy")
+    np.save(npy_path, np.zeros((2, 2)))
+    with pytest.raises(MlflowException, match="`X_cols`"):
+        decode_frame({"X_path": str(npy_path)})
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
@@ -12,7 +14,7 @@ from mlflow.models.utils import _read_example
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 from pyod.models.knn import KNN
 from pyod.utils.data import generate_data
 
@@ -62,7 +64,9 @@ def knn_model(data):
     return clf.fit(X_train)
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_knn_model_save_and_load(knn_model, model_path, serialization_format, data):
     """Test saving and loading of native pyod model."""
     _, X_test, _, _ = data
@@ -81,7 +85,85 @@ def test_knn_model_save_and_load(knn_model, model_path, serialization_format, da
     )
 
 
+def test_knn_model_joblib_memory_maps_arrays(knn_model, model_path):
+    """Test that arrays of joblib serialized models are loaded memory-mapped."""
+    mlflavors.pyod.save_model(
+        pyod_model=knn_model,
+        path=model_path,
+        serialization_format="joblib",
+    )
+    loaded_model = mlflavors.pyod.load_model(model_uri=model_path)
+    flavor_conf = Model.load(model_path).flavors["pyod"]
+
+    assert flavor_conf["serialization_format"] == "joblib"
+    assert isinstance(loaded_model.decision_scores_, np.memmap)
+    assert_array_equal(loaded_model.decision_scores_, knn_model.decision_scores_)
+
+
+def test_knn_model_pickle5_writes_out_of_band_buffers(knn_model, model_path, data):
+    """Test that pickle5 serialization stores arrays as sidecar buffer files."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(
+        pyod_model=knn_model,
+        path=model_path,
+        serialization_format="pickle5",
+    )
+    loaded_model = mlflavors.pyod.load_model(model_uri=model_path)
+    buffers_dir = model_path.joinpath("model.pkl.buffers")
+
+    assert len(list(buffers_dir.glob("*.bin"))) > 0
+    assert not loaded_model.decision_scores_.flags.owndata
+    assert_array_equal(loaded_model.decision_scores_, knn_model.decision_scores_)
+    assert_array_equal(
+        knn_model.decision_function(X_test), loaded_model.decision_function(X_test)
+    )
+
+    # Files other than the buffers (e.g. .DS_Store) are ignored.
+    buffers_dir.joinpath(".DS_Store").write_bytes(b"\0" * 8)
+    loaded_model = mlflavors.pyod.load_model(model_uri=model_path)
+    assert_array_equal(loaded_model.decision_scores_, knn_model.decision_scores_)
+
+    # Truncated buffers (e.g. a partial download) are reported.
+    buffer_path = next(buffers_dir.glob("*.bin"))
+    buffer_path.write_bytes(buffer_path.read_bytes()[:-1])
+    with pytest.raises(MlflowException, match="expected"):
+        mlflavors.pyod.load_model(model_uri=model_path)
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4", "gzip"])
 @pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+def test_knn_model_compressed_save_and_load(
+    knn_model, model_path, serialization_format, compression, data
+):
+    """Test saving and loading of compressed pyod model."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(
+        pyod_model=knn_model,
+        path=model_path,
+        serialization_format=serialization_format,
+        compression=compression,
+        compression_level=1,
+    )
+    flavor_conf = Model.load(model_path).flavors["pyod"]
+    loaded_model = mlflavors.pyod.load_model(model_uri=model_path)
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+
+    assert flavor_conf["compression"] == compression
+    assert model_path.joinpath(flavor_conf["pickled_model"]).is_file()
+    assert_array_equal(
+        knn_model.decision_function(X_test), loaded_model.decision_function(X_test)
+    )
+    assert_array_equal(
+        knn_model.decision_function(X_test),
+        loaded_pyfunc.predict(
+            pd.DataFrame([{"predict_method": "decision_function", "X": X_test}])
+        )[0],
+    )
+
+
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_knn_model_pyfunc_output(knn_model, model_path, serialization_format, data):
     """Test pyod prediction of loaded pyfunc model with parameters."""
     _, X_test, _, _ = data
@@ -158,6 +240,157 @@ def test_knn_model_pyfunc_output(knn_model, model_path, serialization_format, da
     assert_array_equal(y_test_pred_confidence, pyfunc_predict[0])
 
 
+@pytest.mark.parametrize("method", ["linear", "unify"])
+def test_knn_model_pyfunc_multiple_predict_methods(knn_model, model_path, data, method):
+    """Test multiple predict methods are derived from a single scoring pass."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(pyod_model=knn_model, path=model_path)
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+    predict_methods = [
+        "decision_function",
+        "predict",
+        "predict_proba",
+        "predict_confidence",
+    ]
+    predict_conf = pd.DataFrame(
+        [
+            {
+                "predict_method": predict_methods,
+                "X": X_test,
+                "return_confidence": True,
+                "method": method,
+            }
+        ]
+    )
+
+    loaded_model = loaded_pyfunc._model_impl.pyod_model
+    with mock.patch.object(
+        loaded_model, "decision_function", wraps=loaded_model.decision_function
+    ) as decision_function:
+        pyfunc_predict = loaded_pyfunc.predict(predict_conf)[0]
+
+    decision_function.assert_called_once()
+    assert list(pyfunc_predict) == predict_methods
+    assert_array_equal(
+        knn_model.decision_function(X_test), pyfunc_predict["decision_function"]
+    )
+    for predict_method, expected in [
+        ("predict", knn_model.predict(X_test, return_confidence=True)),
+        (
+            "predict_proba",
+            knn_model.predict_proba(X_test, method=method, return_confidence=True),
+        ),
+    ]:
+        assert_array_equal(expected[0], pyfunc_predict[predict_method][0])
+        assert_allclose(expected[1], pyfunc_predict[predict_method][1])
+    assert_allclose(
+        knn_model.predict_confidence(X_test), pyfunc_predict["predict_confidence"]
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_knn_model_pyfunc_chunked_output(knn_model, model_path, data, n_jobs):
+    """Test chunked scoring returns the same outputs as scoring all rows at once."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(pyod_model=knn_model, path=model_path)
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+    predict_conf = pd.DataFrame(
+        [
+            {
+                "predict_method": ["decision_function", "predict_proba"],
+                "X": X_test.tolist(),
+                "return_confidence": True,
+                "chunk_size": 7,
+                "n_jobs": n_jobs,
+            }
+        ]
+    )
+
+    pyfunc_predict = loaded_pyfunc.predict(predict_conf)[0]
+
+    assert_array_equal(
+        knn_model.decision_function(X_test), pyfunc_predict["decision_function"]
+    )
+    probs, confidence = knn_model.predict_proba(X_test, return_confidence=True)
+    assert_array_equal(probs, pyfunc_predict["predict_proba"][0])
+    assert_allclose(confidence, pyfunc_predict["predict_proba"][1])
+
+
+def test_knn_model_pyfunc_concurrent_predictions(knn_model, model_path, data):
+    """Test two threads can score with one pyfunc model at the same time."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(pyod_model=knn_model, path=model_path)
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+    pyod_model = loaded_pyfunc._model_impl.pyod_model
+    predict_conf = pd.DataFrame(
+        [{"predict_method": "decision_function", "X": X_test.tolist()}]
+    )
+
+    # Each call waits for the other one, which times out if calls are serialized.
+    barrier = threading.Barrier(2, timeout=30)
+    decision_function = pyod_model.decision_function
+
+    def wait_for_other_call(X):
+        barrier.wait()
+        return decision_function(X)
+
+    with mock.patch.object(
+        pyod_model, "decision_function", side_effect=wait_for_other_call
+    ), ThreadPoolExecutor(max_workers=2) as executor:
+        outputs = list(
+            executor.map(lambda _: loaded_pyfunc.predict(predict_conf), range(2))
+        )
+
+    for output in outputs:
+        assert_array_equal(knn_model.decision_function(X_test), output[0])
+
+
+def test_knn_model_pyfunc_feature_frame_with_params(knn_model, model_path, data):
+    """Test scoring a feature matrix pd.DataFrame with options passed as params."""
+    _, X_test, _, _ = data
+    X_df = pd.DataFrame(X_test, columns=["a", "b"])
+    signature = infer_signature(X_df, params={"predict_method": "predict"})
+    mlflavors.pyod.save_model(
+        pyod_model=knn_model, path=model_path, signature=signature
+    )
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+
+    pyfunc_predict = loaded_pyfunc.predict(
+        X_df, params={"predict_method": "decision_function"}
+    )
+
+    assert_array_equal(knn_model.decision_function(X_test), pyfunc_predict[0])
+    assert_array_equal(knn_model.predict(X_test), loaded_pyfunc.predict(X_df)[0])
+
+    # The wrapper passes the values of the pd.DataFrame to the detector without copy.
+    wrapper = loaded_pyfunc._model_impl
+    with mock.patch.object(
+        wrapper.pyod_model,
+        "decision_function",
+        wraps=wrapper.pyod_model.decision_function,
+    ) as decision_function:
+        wrapper.predict(X_df, params={"predict_method": "decision_function"})
+    assert np.shares_memory(decision_function.call_args.args[0], X_df.to_numpy())
+
+
+def test_knn_model_pyfunc_feature_frame_with_reserved_columns(
+    knn_model, model_path, data
+):
+    """Test scoring a feature matrix pd.DataFrame with options passed as columns."""
+    _, X_test, _, _ = data
+    mlflavors.pyod.save_model(pyod_model=knn_model, path=model_path)
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(model_uri=model_path)
+    X_df = pd.DataFrame(X_test, columns=["a", "b"]).assign(
+        predict_method="predict_proba", method="unify"
+    )
+
+    pyfunc_predict = loaded_pyfunc.predict(X_df)
+
+    assert_array_equal(
+        knn_model.predict_proba(X_test, method="unify"), pyfunc_predict[0]
+    )
+
+
 @pytest.mark.parametrize("use_signature", [True, False])
 @pytest.mark.parametrize("use_example", [True, False])
 def test_signature_and_examples_saved_correctly(
@@ -309,3 +542,51 @@ def test_pyod_pyfunc_raises_invalid_df_input(knn_model, model_path, data):
         loaded_pyfunc.predict(
             pd.DataFrame([{"X": X_test, "predict_method": "forecast"}])
         )
+
+    with pytest.raises(MlflowException, match="Invalid `chunk_size` "):
+        loaded_pyfunc.predict(
+            pd.DataFrame([{"X": X_test, "predict_method": "predict", "chunk_size": 0}])
+        )
+
+    with pytest.raises(MlflowException, match="Invalid `n_jobs` "):
+        loaded_pyfunc.predict(
+            pd.DataFrame(
+                [
+                    {
+                        "X": X_test,
+                        "predict_method": "predict",
+                        "chunk_size": 10,
+                        "n_jobs": 0,
+                    }
+                ]
+            )
+        )
+
+    with pytest.raises(MlflowException, match="in combination with `chunk_size`"):
+        loaded_pyfunc.predict(
+            pd.DataFrame([{"X": X_test, "predict_method": "predict", "n_jobs": 2}])
+        )
+
+
+def test_pyod_save_model_raises_invalid_compression(knn_model, model_path):
+    """Test save_model call raises error with invalid compression settings."""
+    with pytest.raises(MlflowException, match="Unrecognized compression: "):
+        mlflavors.pyod.save_model(
+            pyod_model=knn_model, path=model_path, compression="brotli"
+        )
+
+    with pytest.raises(MlflowException, match="Compression is not supported "):
+        mlflavors.pyod.save_model(
+            pyod_model=knn_model,
+            path=model_path,
+            serialization_format="joblib",
+            compression="zstd",
+        )
+
+    with pytest.raises(MlflowException, match="must be an integer between 0 and 16"):
+        mlflavors.pyod.save_model(
+            pyod_model=knn_model,
+            path=model_path,
+            compression="lz4",
+            compression_level=17,
+        )
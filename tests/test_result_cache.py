@@ -0,0 +1,155 @@
+import time
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from mlflow.exceptions import MlflowException
+from pandas.testing import assert_frame_equal, assert_series_equal
+from sktime.datasets import load_airline
+from sktime.forecasting.naive import NaiveForecaster
+
+import mlflavors.sktime
+from mlflavors.utils import result_cache
+from mlflavors.utils.result_cache import ResultCache, config_key
+
+FH = [1, 2, 3]
+
+
+@pytest.fixture(scope="module")
+def naive_model():
+    """Create instance of fitted sktime model."""
+    return NaiveForecaster(strategy="drift").fit(load_airline())
+
+
+@pytest.fixture
+def model_path(tmp_path, naive_model):
+    """Save a sktime model."""
+    path = tmp_path.joinpath("model")
+    mlflavors.sktime.save_model(naive_model, path)
+    return path
+
+
+@pytest.fixture
+def cache():
+    """Enable result caches."""
+    result_cache.enable(max_entries=8)
+    yield result_cache
+    result_cache.disable()
+
+
+def test_config_key_hashes_content():
+    """Test keys canonicalize sequences and hash the content of arrays."""
+    X = np.arange(6.0).reshape(3, 2)
+    config = {"predict_method": "predict", "fh": [1, 2], "X": X}
+
+    assert config_key(config) == config_key(dict(config, fh=(np.int64(1), 2)))
+    assert config_key(config) == config_key(dict(config, X=X.copy()))
+    assert config_key(config) != config_key(dict(config, X=X + 1))
+    assert config_key(config) != config_key(dict(config, fh=[1.0, 2.0]))
+
+
+def test_result_cache_returns_copies():
+    """Test cached predictions cannot be modified through cached or returned values."""
+    cache = ResultCache(max_entries=2)
+    predictions = pd.DataFrame({"y": [1.0, 2.0]})
+
+    assert cache.get("key") is None
+    cache.put("key", predictions)
+    predictions.loc[0, "y"] = -1.0
+    cache.get("key").loc[1, "y"] = -1.0
+
+    assert_frame_equal(cache.get("key"), pd.DataFrame({"y": [1.0, 2.0]}))
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "entries": 1,
+        "bytes": cache.stats()["bytes"],
+        "hit_rate": 2 / 3,
+    }
+
+
+def test_result_cache_evicts_and_expires():
+    """Test the cache is bounded by entries, bytes and age of the entries."""
+    predictions = pd.Series(np.zeros(100))
+    nbytes = predictions.memory_usage(deep=True)
+    cache = ResultCache(max_entries=2, max_bytes=int(2.5 * nbytes))
+
+    for key in ["a", "b", "c"]:
+        cache.put(key, predictions)
+    cache.put("large", pd.Series(np.zeros(1000)))
+
+    assert cache.get("a") is None
+    assert cache.get("large") is None
+    assert_series_equal(cache.get("c"), predictions)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 2 * nbytes
+
+    cache = ResultCache(ttl=0.01)
+    cache.put("a", predictions)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_result_cache_raises_invalid_limits():
+    """Test caches cannot be created with invalid limits."""
+    with pytest.raises(MlflowException, match="`ttl` must be a positive number"):
+        ResultCache(ttl=0)
+
+    with pytest.raises(MlflowException, match="`max_entries` must be a positive"):
+        result_cache.enable(max_entries=None)
+
+
+def test_sktime_pyfunc_is_not_cached_by_default(model_path):
+    """Test pyfunc wrappers have no result cache unless it is enabled."""
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_path)
+
+    assert not result_cache.is_enabled()
+    assert loaded_pyfunc._model_impl.result_cache is None
+
+
+def test_sktime_pyfunc_caches_repeated_requests(cache, model_path, naive_model):
+    """Test identical configuration rows are predicted once."""
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_path)
+    wrapper = loaded_pyfunc._model_impl
+    predict_conf = pd.DataFrame([{"predict_method": "predict", "fh": FH}])
+
+    with mock.patch.object(
+        wrapper.sktime_model, "predict", wraps=wrapper.sktime_model.predict
+    ) as predict:
+        first = loaded_pyfunc.predict(predict_conf)
+        first.iloc[0] = -1.0
+        second = loaded_pyfunc.predict(predict_conf)
+        multi_row = loaded_pyfunc.predict(
+            pd.DataFrame([{"predict_method": "predict", "fh": FH}] * 2)
+        )
+
+    predict.assert_called_once()
+    assert_series_equal(second, naive_model.predict(fh=FH))
+    assert_frame_equal(multi_row.loc[1], second.to_frame())
+    assert wrapper.result_cache.stats()["hits"] == 3
+    assert wrapper.result_cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] >= 3
+
+
+def test_sktime_pyfunc_update_invalidates_cached_results(cache, model_path):
+    """Test results cached before an update of the model are not returned."""
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_path)
+    predict_conf = pd.DataFrame([{"predict_method": "predict", "fh": FH}])
+
+    before = loaded_pyfunc.predict(predict_conf)
+    loaded_pyfunc.predict(
+        pd.DataFrame([{"predict_method": "predict", "fh": FH, "update_y": [500.0]}])
+    )
+    after = loaded_pyfunc.predict(predict_conf)
+
+    # The prediction of the update row is cached at the new cutoff.
+    stats = loaded_pyfunc._model_impl.result_cache.stats()
+    assert after.index[0] == before.index[1]
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
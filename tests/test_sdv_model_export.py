@@ -82,7 +82,9 @@ def multi_table_model(multi_table):
     return synthesizer
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_single_table_model_save_and_load(
     single_table_model, model_path, serialization_format
 ):
@@ -102,7 +104,9 @@ def test_single_table_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_multi_table_model_save_and_load(
     multi_table_model, model_path, serialization_format
 ):
@@ -130,7 +134,9 @@ def test_multi_table_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_single_table_model_pyfunc_output(
     single_table_model, model_path, serialization_format
 ):
@@ -157,7 +163,9 @@ def test_single_table_model_pyfunc_output(
     assert_frame_equal(model_predictions, pyfunc_predict)
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_multi_table_model_pyfunc_output(
     multi_table_model, model_path, serialization_format
 ):
@@ -1,5 +1,7 @@
 """Tests for sktime custom model flavor."""
 
+import copy
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -16,7 +18,7 @@ from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
 from sktime.datasets import load_airline, load_longley
 from sktime.datatypes import convert
-from sktime.forecasting.arima import AutoARIMA
+from sktime.forecasting.arima import ARIMA, AutoARIMA
 from sktime.forecasting.model_selection import temporal_train_test_split
 from sktime.forecasting.naive import NaiveForecaster
 
@@ -72,7 +74,9 @@ def naive_forecaster_model_with_regressor(data_longley):
     return model.fit(y_train, X_train)
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_auto_arima_model_save_and_load(
     auto_arima_model, model_path, serialization_format
 ):
@@ -91,7 +95,60 @@ def test_auto_arima_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "compression, compression_level", [("zstd", 19), ("lz4", 16), ("gzip", 1)]
+)
+def test_auto_arima_model_compressed_save_and_load(
+    auto_arima_model, model_path, compression, compression_level
+):
+    """Test saving and loading of compressed sktime model."""
+    mlflavors.sktime.save_model(
+        sktime_model=auto_arima_model,
+        path=model_path,
+        compression=compression,
+        compression_level=compression_level,
+    )
+    flavor_conf = Model.load(model_path).flavors["sktime"]
+    loaded_model = mlflavors.sktime.load_model(model_uri=model_path)
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
+
+    assert flavor_conf["compression"] == compression
+    np.testing.assert_array_equal(
+        auto_arima_model.predict(fh=FH), loaded_model.predict(fh=FH)
+    )
+    np.testing.assert_array_equal(
+        auto_arima_model.predict(fh=FH),
+        loaded_pyfunc.predict(pd.DataFrame([{"predict_method": "predict", "fh": FH}])),
+    )
+
+
+@pytest.mark.parametrize(
+    "compression, compression_level, match",
+    [
+        ("gzip", 10, "must be an integer between 0 and 9"),
+        ("lz4", -1, "must be an integer between 0 and 16"),
+        ("zstd", 23, "must be an integer between -131072 and 22"),
+        ("zstd", 1.5, "must be an integer"),
+        (None, 3, "`compression_level` requires `compression`"),
+    ],
+)
+def test_sktime_save_model_raises_invalid_compression_level(
+    auto_arima_model, model_path, compression, compression_level, match
+):
+    """Test save_model call raises error with invalid compression level."""
+    with pytest.raises(MlflowException, match=match):
+        mlflavors.sktime.save_model(
+            sktime_model=auto_arima_model,
+            path=model_path,
+            compression=compression,
+            compression_level=compression_level,
+        )
+    assert not model_path.exists()
+
+
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_auto_arima_model_pyfunc_output(
     auto_arima_model, model_path, serialization_format
 ):
@@ -384,12 +441,287 @@ def test_log_model_no_registered_model_name(auto_arima_model, tmp_path):
         mlflow.register_model.assert_not_called()
 
 
+def test_auto_arima_model_pyfunc_multi_row_output(auto_arima_model, model_path):
+    """Test multi-row configurations merge compatible rows into one call."""
+    mlflavors.sktime.save_model(sktime_model=auto_arima_model, path=model_path)
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
+    rows = [
+        {"predict_method": "predict", "fh": FH},
+        {"predict_method": "predict_interval", "fh": [1, 2], "coverage": 0.5},
+        {"predict_method": "predict_interval", "fh": [3], "coverage": [0.1, 0.9]},
+        {"predict_method": "predict_quantiles", "fh": FH, "alpha": ALPHA},
+        {"predict_method": "predict_var", "fh": [2]},
+    ]
+
+    loaded_model = loaded_pyfunc._model_impl.sktime_model
+    with mock.patch.object(
+        loaded_model, "predict_interval", wraps=loaded_model.predict_interval
+    ) as predict_interval:
+        pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame(rows))
+
+    predict_interval.assert_called_once()
+    assert set(pyfunc_predict.index.get_level_values(0)) == set(range(len(rows)))
+    for i, row in enumerate(rows):
+        expected = loaded_pyfunc.predict(pd.DataFrame([row]))
+        if isinstance(expected, pd.Series):
+            expected = expected.to_frame()
+        np.testing.assert_array_equal(
+            pyfunc_predict.loc[i, expected.columns].to_numpy(), expected.to_numpy()
+        )
+
+
+def test_auto_arima_model_pyfunc_forecast_table(auto_arima_model, model_path):
+    """Test rows covered by the forecast table are answered without the model."""
+    mlflavors.sktime.save_model(
+        sktime_model=auto_arima_model,
+        path=model_path,
+        forecast_table_horizon=len(FH),
+        forecast_table_coverage=COVERAGE,
+        forecast_table_alpha=ALPHA,
+    )
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
+    model_wrapper = mlflavors.sktime._SktimeModelWrapper(auto_arima_model)
+    covered = [
+        {"predict_method": "predict", "fh": [1, 3]},
+        {"predict_method": "predict", "fh": 2},
+        {"predict_method": "predict_interval", "fh": FH, "coverage": [0.9, 0.1]},
+        {"predict_method": "predict_quantiles", "fh": [2], "alpha": 0.5},
+    ]
+    not_covered = [
+        {"predict_method": "predict", "fh": [4]},
+        {"predict_method": "predict_interval", "fh": FH, "coverage": 0.8},
+        {"predict_method": "predict_quantiles", "fh": FH},
+        {"predict_method": "predict_var", "fh": FH},
+    ]
+
+    loaded_model = loaded_pyfunc._model_impl.sktime_model
+    for method in ["predict", "predict_interval", "predict_quantiles"]:
+        with mock.patch.object(loaded_model, method) as predict:
+            for row in covered:
+                pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame([row]))
+                expected = model_wrapper.predict(pd.DataFrame([row]))
+                if isinstance(expected, pd.Series):
+                    pd.testing.assert_series_equal(pyfunc_predict, expected)
+                else:
+                    pd.testing.assert_frame_equal(pyfunc_predict, expected)
+        predict.assert_not_called()
+
+    for row in not_covered:
+        pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame([row]))
+        expected = model_wrapper.predict(pd.DataFrame([row]))
+        np.testing.assert_array_equal(pyfunc_predict, expected)
+
+
+def test_sktime_save_model_raises_invalid_forecast_table(
+    auto_arima_model, data_longley, model_path
+):
+    """Test save_model call raises error with invalid forecast table arguments."""
+    with pytest.raises(MlflowException, match="require `forecast_table_horizon`"):
+        mlflavors.sktime.save_model(
+            sktime_model=auto_arima_model,
+            path=model_path,
+            forecast_table_coverage=COVERAGE,
+        )
+
+    with pytest.raises(MlflowException, match="must be a positive integer"):
+        mlflavors.sktime.save_model(
+            sktime_model=auto_arima_model, path=model_path, forecast_table_horizon=0
+        )
+
+    y_train, _, X_train, _ = data_longley
+    arima_model_with_regressor = ARIMA(order=(1, 0, 0)).fit(y_train, X_train)
+    with pytest.raises(MlflowException, match="without exogenous regressor"):
+        mlflavors.sktime.save_model(
+            sktime_model=arima_model_with_regressor,
+            path=model_path,
+            forecast_table_horizon=len(FH),
+        )
+
+
+def test_forecast_table_leaves_model_horizon_unchanged(auto_arima_model, model_path):
+    """Test computing the forecast table does not change the model's horizon."""
+    sktime_model = copy.deepcopy(auto_arima_model)
+    sktime_model.predict(fh=[1, 2])
+    mlflavors.sktime.save_model(
+        sktime_model=sktime_model, path=model_path, forecast_table_horizon=5
+    )
+
+    assert list(sktime_model._fh) == [1, 2]
+
+
+def test_auto_arima_model_pyfunc_update(auto_arima_model, data_airline, tmp_path):
+    """Test pyfunc updates the model with new observations before predicting."""
+    model_path = tmp_path.joinpath("model")
+    mlflavors.sktime.save_model(
+        sktime_model=auto_arima_model, path=model_path, forecast_table_horizon=3
+    )
+    persist_root = tmp_path.joinpath("updates")
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(
+        model_uri=model_path, model_config={"persist_root": str(persist_root)}
+    )
+    new_y = data_airline.iloc[-3:].to_numpy()
+    updated_model = copy.deepcopy(auto_arima_model).update(
+        pd.Series(
+            new_y,
+            index=pd.period_range("1961-01", periods=3, freq="M", name="Period"),
+            name=data_airline.name,
+        ),
+        update_params=False,
+    )
+    persist_path = persist_root.joinpath("updated_model")
+    loaded_model = loaded_pyfunc._model_impl.sktime_model
+
+    pyfunc_predict = loaded_pyfunc.predict(
+        pd.DataFrame(
+            [
+                {
+                    "predict_method": "predict",
+                    "fh": FH,
+                    "update_y": new_y.tolist(),
+                    "persist_label": "updated_model",
+                }
+            ]
+        )
+    )
+
+    pd.testing.assert_series_equal(pyfunc_predict, updated_model.predict(fh=FH))
+    pd.testing.assert_series_equal(
+        loaded_pyfunc.predict(pd.DataFrame([{"predict_method": "predict", "fh": FH}])),
+        updated_model.predict(fh=FH),
+    )
+    persisted_model = mlflavors.sktime.load_model(model_uri=persist_path / "1")
+    assert persisted_model.cutoff.equals(updated_model.cutoff)
+    # The update applies to a copy of the loaded model.
+    assert loaded_pyfunc._model_impl.sktime_model is not loaded_model
+    assert loaded_model.cutoff.equals(auto_arima_model.cutoff)
+
+    loaded_pyfunc.predict(
+        pd.DataFrame(
+            [
+                {
+                    "predict_method": "predict",
+                    "fh": FH,
+                    "update_y": [500.0],
+                    "update_index": ["1961-04"],
+                    "persist_label": "updated_model",
+                }
+            ]
+        )
+    )
+    assert str(loaded_pyfunc._model_impl.sktime_model.cutoff[0]) == "1961-04"
+    # Each persisted update is saved as a new version.
+    persisted_model = mlflavors.sktime.load_model(model_uri=persist_path / "2")
+    assert str(persisted_model.cutoff[0]) == "1961-04"
+
+    in_place_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
+    loaded_model = in_place_pyfunc._model_impl.sktime_model
+    in_place_pyfunc.predict(
+        pd.DataFrame(
+            [
+                {
+                    "predict_method": "predict",
+                    "fh": FH,
+                    "update_y": new_y.tolist(),
+                    "update_in_place": True,
+                }
+            ]
+        )
+    )
+    assert in_place_pyfunc._model_impl.sktime_model is loaded_model
+    assert loaded_model.cutoff.equals(updated_model.cutoff)
+
+    # Persisting requires a root and labels must stay under it.
+    for pyfunc_model, label, match in [
+        (
+            in_place_pyfunc,
+            "updated_model",
+            "requires the `persist_root` model configuration",
+        ),
+        (loaded_pyfunc, str(tmp_path), "must be a relative path"),
+        (loaded_pyfunc, "../escaped", "must resolve to a directory under"),
+    ]:
+        with pytest.raises(MlflowException, match=match):
+            pyfunc_model.predict(
+                pd.DataFrame(
+                    [
+                        {
+                            "predict_method": "predict",
+                            "fh": FH,
+                            "update_y": [1.0],
+                            "persist_label": label,
+                        }
+                    ]
+                )
+            )
+    assert not tmp_path.joinpath("escaped").exists()
+    assert str(loaded_pyfunc._model_impl.sktime_model.cutoff[0]) == "1961-04"
+
+    with pytest.raises(MlflowException, match="does not match the length"):
+        loaded_pyfunc.predict(
+            pd.DataFrame(
+                [
+                    {
+                        "predict_method": "predict",
+                        "update_y": [1.0, 2.0],
+                        "update_index": ["1961-05"],
+                    }
+                ]
+            )
+        )
+
+
+def test_pyfunc_persists_update_outside_model_lock(auto_arima_model, tmp_path):
+    """Test updates are persisted under the root set at save time, without the lock."""
+    model_path = tmp_path.joinpath("model")
+    persist_root = tmp_path.joinpath("updates")
+    mlflavors.sktime.save_model(
+        sktime_model=auto_arima_model, path=model_path, persist_root=str(persist_root)
+    )
+    loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
+    wrapper = loaded_pyfunc._model_impl
+    save_model = mlflavors.sktime.save_model
+    lock_held = []
+
+    def probe_lock():
+        acquired = wrapper._lock.acquire(blocking=False)
+        lock_held.append(not acquired)
+        if acquired:
+            wrapper._lock.release()
+
+    def save_model_probe(*args, **kwargs):
+        # The lock is reentrant, so it is probed from another thread.
+        probe = threading.Thread(target=probe_lock)
+        probe.start()
+        probe.join()
+        return save_model(*args, **kwargs)
+
+    with mock.patch.object(mlflavors.sktime, "save_model", save_model_probe):
+        loaded_pyfunc.predict(
+            pd.DataFrame(
+                [
+                    {
+                        "predict_method": "predict",
+                        "fh": FH,
+                        "update_y": [450.0],
+                        "persist_label": "a/b",
+                    }
+                ]
+            )
+        )
+
+    assert lock_held == [False]
+    persisted_model = mlflavors.sktime.load_model(
+        model_uri=persist_root / "a" / "b" / "1"
+    )
+    assert persisted_model.cutoff.equals(wrapper.sktime_model.cutoff)
+
+
 def test_sktime_pyfunc_raises_invalid_df_input(auto_arima_model, model_path):
     """Test pyfunc call raises error with invalid dataframe configuration."""
     mlflavors.sktime.save_model(sktime_model=auto_arima_model, path=model_path)
     loaded_pyfunc = mlflavors.sktime.pyfunc.load_model(model_uri=model_path)
 
-    with pytest.raises(MlflowException, match="The provided prediction pd.DataFrame "):
+    with pytest.raises(MlflowException, match="The provided prediction configuration "):
         loaded_pyfunc.predict(pd.DataFrame([{"predict_method": "predict"}, {"fh": FH}]))
 
     with pytest.raises(MlflowException, match="The provided prediction configuration "):
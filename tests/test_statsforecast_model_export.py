@@ -1,3 +1,7 @@
+import base64
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
@@ -14,14 +18,21 @@ from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
 from pandas.testing import assert_frame_equal
 from statsforecast import StatsForecast
-from statsforecast.models import AutoARIMA, AutoETS, Naive
-from statsforecast.utils import AirPassengersDF
+from statsforecast.models import (
+    AutoARIMA,
+    AutoETS,
+    Naive,
+    SimpleExponentialSmoothingOptimized,
+)
+from statsforecast.utils import AirPassengersDF, generate_series
 
 import mlflavors.statsforecast
 from mlflavors.utils.data import load_m5
+from mlflavors.utils.payload import encode_frame
 
 SEASON_LENGTH = 12
 LEVEL = [90, 95]
+HORIZON = 7
 
 
 @pytest.fixture
@@ -93,6 +104,17 @@ def arima_ets_fitted_model(data_air_passengers):
     return sf.fit()
 
 
+@pytest.fixture(scope="module")
+def multi_series_fitted_model():
+    """Create instance of fitted statsforecast model with multiple series."""
+    df = generate_series(n_series=7, freq="D", min_length=50, max_length=80, seed=1)
+    sf = StatsForecast(
+        df=df, models=[AutoETS(season_length=7), Naive()], freq="D", n_jobs=1
+    )
+    sf.forecast(h=HORIZON, fitted=True)
+    return sf.fit()
+
+
 @pytest.fixture(scope="module")
 def arima_with_exogenous_fitted_model(data_m5):
     """Create instance of fitted dlt model."""
@@ -105,7 +127,9 @@ def arima_with_exogenous_fitted_model(data_m5):
     return sf.fit()
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_arima_ets_model_save_and_load(
     arima_ets_model, model_path, serialization_format, data_air_passengers
 ):
@@ -127,7 +151,9 @@ def test_arima_ets_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_arima_ets_fitted_model_save_and_load(
     arima_ets_fitted_model, model_path, serialization_format, data_air_passengers
 ):
@@ -149,7 +175,57 @@ def test_arima_ets_fitted_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "compression, compression_level", [("zstd", 19), ("lz4", 16), ("gzip", 1)]
+)
+def test_arima_ets_fitted_model_compressed_save_and_load(
+    arima_ets_fitted_model, model_path, compression, compression_level
+):
+    """Test saving and loading of compressed statsforecast model."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=arima_ets_fitted_model,
+        path=model_path,
+        compression=compression,
+        compression_level=compression_level,
+    )
+    flavor_conf = Model.load(model_path).flavors["statsforecast"]
+    loaded_model = mlflavors.statsforecast.load_model(model_uri=model_path)
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+
+    assert flavor_conf["compression"] == compression
+    assert_frame_equal(
+        arima_ets_fitted_model.predict(h=HORIZON), loaded_model.predict(h=HORIZON)
+    )
+    assert_frame_equal(
+        arima_ets_fitted_model.predict(h=HORIZON),
+        loaded_pyfunc.predict(pd.DataFrame([{"h": HORIZON}])),
+    )
+
+
+def test_statsforecast_save_model_raises_invalid_compression_level(
+    arima_ets_fitted_model, model_path
+):
+    """Test save_model call raises error with invalid compression level."""
+    with pytest.raises(MlflowException, match="must be an integer between 0 and 9"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=arima_ets_fitted_model,
+            path=model_path,
+            compression="gzip",
+            compression_level=10,
+        )
+
+    with pytest.raises(MlflowException, match="requires `compression`"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=arima_ets_fitted_model,
+            path=model_path,
+            compression_level=3,
+        )
+    assert not model_path.exists()
+
+
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_arima_with_exogenous_fitted_model_save_and_load(
     arima_with_exogenous_fitted_model, model_path, serialization_format, data_m5
 ):
@@ -172,7 +248,9 @@ def test_arima_with_exogenous_fitted_model_save_and_load(
     )
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_arima_ets_fitted_model_pyfunc_output(
     arima_ets_fitted_model, model_path, serialization_format, data_air_passengers
 ):
@@ -202,7 +280,9 @@ def test_arima_ets_fitted_model_pyfunc_output(
     assert_frame_equal(model_predictions, pyfunc_predict)
 
 
-@pytest.mark.parametrize("serialization_format", ["pickle", "cloudpickle"])
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
 def test_arima_with_exogenous_fitted_model_pyfunc_output(
     arima_with_exogenous_fitted_model, model_path, serialization_format, data_m5
 ):
@@ -238,6 +318,506 @@ def test_arima_with_exogenous_fitted_model_pyfunc_output(
     assert_frame_equal(model_predictions, pyfunc_predict)
 
 
+@pytest.mark.parametrize("serialization_format", ["pickle", "pickle5"])
+def test_arima_ets_fitted_model_slim_save_and_load(
+    arima_ets_fitted_model, tmp_path, serialization_format, data_air_passengers
+):
+    """Test slim statsforecast model predicts the same as the full model."""
+    _, test_df = data_air_passengers
+    full_path = tmp_path.joinpath("full")
+    slim_path = tmp_path.joinpath("slim")
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=arima_ets_fitted_model,
+        path=full_path,
+        serialization_format=serialization_format,
+    )
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=arima_ets_fitted_model,
+        path=slim_path,
+        serialization_format=serialization_format,
+        slim=True,
+    )
+    full_model = mlflavors.statsforecast.load_model(model_uri=full_path)
+    slim_model = mlflavors.statsforecast.load_model(model_uri=slim_path)
+    slim_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=slim_path)
+    flavor_conf = Model.load(slim_path).flavors["statsforecast"]
+
+    horizon = len(test_df)
+
+    assert flavor_conf["slim"] is True
+    assert flavor_conf["slim_bytes_saved"] > 0
+    assert slim_model.ds is None
+    assert slim_model.ga.data.shape[0] == 0
+    assert arima_ets_fitted_model.ga.data.shape[0] > 0
+    assert_frame_equal(
+        full_model.predict(h=horizon, level=LEVEL),
+        slim_model.predict(h=horizon, level=LEVEL),
+    )
+    assert_frame_equal(
+        full_model.predict(h=horizon, level=LEVEL),
+        slim_pyfunc.predict(pd.DataFrame([{"h": horizon, "level": LEVEL}])),
+    )
+
+
+@pytest.fixture(scope="module")
+def synthetic_exogenous_data():
+    """Create synthetic series with an exogenous regressor and its future values."""
+    rng = np.random.default_rng(42)
+    n_obs, horizon = 120, 12
+    dfs = []
+    for uid in ["a", "b"]:
+        ds = pd.date_range("2010-01-31", periods=n_obs + horizon, freq="M")
+        promo = rng.integers(0, 2, n_obs + horizon).astype(float)
+        y = 100 + np.arange(n_obs + horizon) + 10 * promo + rng.normal(size=len(ds))
+        dfs.append(pd.DataFrame({"unique_id": uid, "ds": ds, "y": y, "promo": promo}))
+    df = pd.concat(dfs)
+    train_df = df.groupby("unique_id").head(n_obs)
+    X_df = df.groupby("unique_id").tail(horizon).drop(columns="y")
+    return train_df, X_df, horizon
+
+
+@pytest.fixture(scope="module")
+def synthetic_exogenous_model(synthetic_exogenous_data):
+    """Create instance of fitted statsforecast model with exogenous regressor."""
+    train_df, _, _ = synthetic_exogenous_data
+    return StatsForecast(
+        df=train_df, models=[AutoARIMA(season_length=SEASON_LENGTH)], freq="M"
+    ).fit()
+
+
+def test_arima_with_exogenous_slim_save_and_load(
+    tmp_path, synthetic_exogenous_data, synthetic_exogenous_model
+):
+    """Test slim statsforecast model with exogenous regressors."""
+    _, X_df, horizon = synthetic_exogenous_data
+    sf = synthetic_exogenous_model
+    full_path = tmp_path.joinpath("full")
+    slim_path = tmp_path.joinpath("slim")
+    mlflavors.statsforecast.save_model(statsforecast_model=sf, path=full_path)
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=sf, path=slim_path, slim=True
+    )
+    full_model = mlflavors.statsforecast.load_model(model_uri=full_path)
+    slim_model = mlflavors.statsforecast.load_model(model_uri=slim_path)
+
+    assert_frame_equal(
+        full_model.predict(h=horizon, X_df=X_df, level=LEVEL),
+        slim_model.predict(h=horizon, X_df=X_df, level=LEVEL),
+    )
+
+
+@pytest.mark.parametrize("payload_format", ["arrow", "npy"])
+@pytest.mark.parametrize("use_path", [False, True])
+def test_arima_with_exogenous_pyfunc_binary_payload(
+    tmp_path,
+    synthetic_exogenous_data,
+    synthetic_exogenous_model,
+    payload_format,
+    use_path,
+):
+    """Test pyfunc predictions with the regressor passed as binary payload."""
+    _, X_df, horizon = synthetic_exogenous_data
+    model_path = tmp_path.joinpath("model")
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=synthetic_exogenous_model, path=model_path
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    X = encode_frame(X_df, payload_format)
+    if use_path:
+        X_path = tmp_path.joinpath(f"X.{payload_format}")
+        X_path.write_bytes(base64.b64decode(X))
+        conf = {"h": horizon, "X_path": str(X_path), "level": LEVEL}
+    else:
+        conf = {"h": horizon, "X": X, "X_format": payload_format, "level": LEVEL}
+
+    pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame([conf]))
+
+    assert_frame_equal(
+        synthetic_exogenous_model.predict(h=horizon, X_df=X_df, level=LEVEL),
+        pyfunc_predict,
+    )
+
+
+def test_statsforecast_slim_save_raises_for_unfitted_model(arima_ets_model, model_path):
+    """Test slim save_model call raises error for a model without fitted models."""
+    with pytest.raises(MlflowException, match="Slim serialization requires a fitted"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=arima_ets_model, path=model_path, slim=True
+        )
+
+
+@pytest.mark.parametrize(
+    "serialization_format", ["pickle", "cloudpickle", "joblib", "pickle5"]
+)
+def test_sharded_model_save_and_load(
+    multi_series_fitted_model, model_path, serialization_format
+):
+    """Test saving and loading of a sharded statsforecast model."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model,
+        path=model_path,
+        serialization_format=serialization_format,
+        shard_size=3,
+    )
+    loaded_model = mlflavors.statsforecast.load_model(model_uri=model_path)
+    flavor_conf = Model.load(model_path).flavors["statsforecast"]
+    shard_files = [
+        path for path in model_path.joinpath("shards").iterdir() if path.is_file()
+    ]
+
+    assert flavor_conf["shard_size"] == 3
+    assert flavor_conf["n_shards"] == 3
+    assert len(shard_files) == 3
+    assert_frame_equal(
+        multi_series_fitted_model.predict(h=HORIZON, level=LEVEL),
+        loaded_model.predict(h=HORIZON, level=LEVEL),
+    )
+    # The categorical codes of the index are memory-mapped for joblib.
+    assert_frame_equal(
+        multi_series_fitted_model.forecast_fitted_values(),
+        loaded_model.forecast_fitted_values(),
+        check_categorical=False,
+    )
+
+
+def test_sharded_model_pyfunc_loads_requested_shards(
+    multi_series_fitted_model, model_path
+):
+    """Test pyfunc prediction of a sharded model only loads the requested shards."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model,
+        path=model_path,
+        shard_size=3,
+        compression="zstd",
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    sharded_model = loaded_pyfunc._model_impl.statsforecast_model
+
+    assert len(sharded_model._shards) == 0
+
+    unique_ids = [4, 3]
+    predict_conf = pd.DataFrame(
+        [{"h": HORIZON, "level": LEVEL, "unique_ids": unique_ids}]
+    )
+    pyfunc_predict = loaded_pyfunc.predict(predict_conf)
+    model_predictions = multi_series_fitted_model.predict(h=HORIZON, level=LEVEL)
+
+    assert list(sharded_model._shards) == [1]
+    assert_frame_equal(
+        model_predictions.loc[[3, 4]],
+        pyfunc_predict,
+        check_index_type=False,
+    )
+
+    pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame([{"h": HORIZON}]))
+
+    assert sorted(sharded_model._shards) == [0, 1, 2]
+    assert_frame_equal(multi_series_fitted_model.predict(h=HORIZON), pyfunc_predict)
+
+
+@pytest.mark.parametrize("shard_size", [None, 2])
+def test_load_model_with_unique_ids(multi_series_fitted_model, model_path, shard_size):
+    """Test loading a subset of the series of a statsforecast model."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model,
+        path=model_path,
+        shard_size=shard_size,
+    )
+    loaded_model = mlflavors.statsforecast.load_model(
+        model_uri=model_path, unique_ids=[6, 0]
+    )
+
+    assert len(loaded_model.ga) == 2
+    assert_frame_equal(
+        multi_series_fitted_model.predict(h=HORIZON).loc[[0, 6]],
+        loaded_model.predict(h=HORIZON),
+        check_index_type=False,
+    )
+
+    with pytest.raises(MlflowException, match="does not contain the series"):
+        mlflavors.statsforecast.load_model(model_uri=model_path, unique_ids=[42])
+
+
+@pytest.mark.parametrize("shard_size", [None, 2])
+def test_select_single_string_unique_id(model_path, shard_size):
+    """Test a single string identifier selects one series, not its characters."""
+    df = generate_series(n_series=3, freq="D", min_length=30, max_length=40, seed=2)
+    df.index = df.index.map({0: "a", 1: "ab", 2: "b"}).astype(str).rename("unique_id")
+    sf = StatsForecast(df=df, models=[Naive()], freq="D", n_jobs=1).fit()
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=sf, path=model_path, shard_size=shard_size
+    )
+    loaded_model = mlflavors.statsforecast.load_model(
+        model_uri=model_path, unique_ids="ab"
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    pyfunc_predict = loaded_pyfunc.predict(
+        pd.DataFrame([{"h": HORIZON, "unique_ids": "ab"}])
+    )
+
+    assert list(loaded_model.uids) == ["ab"]
+    assert_frame_equal(
+        sf.predict(h=HORIZON).loc[["ab"]], loaded_model.predict(h=HORIZON)
+    )
+    assert_frame_equal(sf.predict(h=HORIZON).loc[["ab"]], pyfunc_predict)
+
+
+def test_statsforecast_save_model_raises_invalid_shard_size(
+    multi_series_fitted_model, arima_ets_model, model_path
+):
+    """Test save_model call raises error with invalid shard settings."""
+    with pytest.raises(MlflowException, match="`shard_size` must be a positive"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=multi_series_fitted_model, path=model_path, shard_size=0
+        )
+
+    with pytest.raises(MlflowException, match="Sharded serialization requires"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=arima_ets_model, path=model_path, shard_size=3
+        )
+
+
+def test_multi_row_pyfunc_output(multi_series_fitted_model, model_path):
+    """Test multi-row configurations are evaluated with a single predict call."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model, path=model_path
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    rows = [
+        {"h": HORIZON},
+        {"h": 3, "level": [80]},
+        {"h": 1, "level": LEVEL, "unique_ids": [2, 5]},
+    ]
+
+    loaded_model = loaded_pyfunc._model_impl.statsforecast_model
+    with mock.patch.object(
+        loaded_model, "predict", wraps=loaded_model.predict
+    ) as predict:
+        pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame(rows))
+
+    predict.assert_called_once_with(h=HORIZON, X_df=None, level=[80, 90, 95])
+    for i, row in enumerate(rows):
+        expected = loaded_pyfunc.predict(pd.DataFrame([row]))
+        row_predict = pyfunc_predict.loc[i].dropna(axis=1, how="all")
+        assert set(row_predict.columns) == set(expected.columns)
+        # The intervals of multiplicative AutoETS models depend on the horizon.
+        columns = [c for c in expected.columns if not c.startswith("AutoETS-")]
+        assert_frame_equal(row_predict[columns], expected[columns])
+
+
+@pytest.mark.parametrize("shard_size", [None, 3])
+def test_forecast_table_pyfunc_output(
+    multi_series_fitted_model, model_path, shard_size
+):
+    """Test rows covered by the forecast table are answered without the model."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model,
+        path=model_path,
+        shard_size=shard_size,
+        forecast_table_horizon=HORIZON,
+        forecast_table_level=LEVEL,
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    model_wrapper = loaded_pyfunc._model_impl
+    covered = [
+        {"h": 3},
+        {"h": HORIZON, "level": [95]},
+        {"h": 2, "level": LEVEL, "unique_ids": [5, 2]},
+    ]
+    not_covered = [{"h": HORIZON + 1}, {"h": 3, "level": [80]}]
+
+    for rows, calls in [(covered, 0), (not_covered, len(not_covered))]:
+        with mock.patch.object(
+            model_wrapper, "_predict_config", wraps=model_wrapper._predict_config
+        ) as predict_config:
+            for row in rows:
+                pyfunc_predict = loaded_pyfunc.predict(pd.DataFrame([row]))
+                model_predictions = multi_series_fitted_model.predict(
+                    h=row["h"], level=row.get("level")
+                )
+                if "unique_ids" in row:
+                    model_predictions = model_predictions.loc[sorted(row["unique_ids"])]
+                # The intervals of multiplicative AutoETS models depend on the horizon.
+                columns = [
+                    c for c in model_predictions.columns if not c.startswith("AutoETS-")
+                ]
+                assert list(pyfunc_predict.columns) == list(model_predictions.columns)
+                assert_frame_equal(
+                    pyfunc_predict[columns],
+                    model_predictions[columns],
+                    check_index_type=False,
+                )
+        assert predict_config.call_count == calls
+
+
+def test_pyfunc_concurrent_predictions(multi_series_fitted_model, model_path):
+    """Test two threads can predict with one pyfunc model at the same time."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model, path=model_path
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    loaded_model = loaded_pyfunc._model_impl.statsforecast_model
+
+    # Each call waits for the other one, which times out if calls are serialized.
+    barrier = threading.Barrier(2, timeout=30)
+    predict = loaded_model.predict
+
+    def wait_for_other_call(**kwargs):
+        barrier.wait()
+        return predict(**kwargs)
+
+    with mock.patch.object(
+        loaded_model, "predict", side_effect=wait_for_other_call
+    ), ThreadPoolExecutor(max_workers=2) as executor:
+        outputs = list(
+            executor.map(
+                lambda _: loaded_pyfunc.predict(pd.DataFrame([{"h": HORIZON}])),
+                range(2),
+            )
+        )
+
+    expected = multi_series_fitted_model.predict(h=HORIZON)
+    for output in outputs:
+        assert_frame_equal(output, expected, check_index_type=False)
+
+
+def test_pyfunc_n_jobs(multi_series_fitted_model, model_path):
+    """Test predict uses the requested n_jobs, by default bounded by the CPUs."""
+    trained_model = copy.copy(multi_series_fitted_model)
+    trained_model.n_jobs = 64
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=trained_model, path=model_path
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    rows = [
+        ({"h": 3}, 2),
+        ({"h": 3, "n_jobs": 1}, 1),
+        ({"h": 3, "n_jobs": -1}, 2),
+        ({"h": 3, "n_jobs": 3, "unique_ids": [2, 5]}, 2),
+    ]
+
+    n_jobs = []
+    predict = StatsForecast.predict
+
+    def record_n_jobs(self, **kwargs):
+        n_jobs.append(self.n_jobs)
+        return predict(self, **kwargs)
+
+    with mock.patch(
+        "mlflavors.utils.cpu.available_cpus", return_value=2
+    ), mock.patch.object(
+        mlflavors.statsforecast, "available_cpus", return_value=2
+    ), mock.patch.object(
+        StatsForecast, "predict", autospec=True, side_effect=record_n_jobs
+    ):
+        pyfunc_predictions = [
+            loaded_pyfunc.predict(pd.DataFrame([row])) for row, _ in rows
+        ]
+
+    model_predictions = multi_series_fitted_model.predict(h=3)
+    for (row, _), pyfunc_predict in zip(rows, pyfunc_predictions):
+        expected = model_predictions.loc[row.get("unique_ids", slice(None))]
+        assert_frame_equal(pyfunc_predict, expected, check_index_type=False)
+
+    assert n_jobs == [expected for _, expected in rows]
+    assert loaded_pyfunc._model_impl.statsforecast_model.n_jobs == 64
+
+    with pytest.raises(MlflowException, match="Invalid `n_jobs` value"):
+        loaded_pyfunc.predict(pd.DataFrame([{"h": 3, "n_jobs": 0}]))
+
+
+@pytest.mark.parametrize("shard_size", [None, 3])
+def test_forward_pyfunc_output(multi_series_fitted_model, model_path, shard_size):
+    """Test rows with new history are forecasted with the fitted parameters."""
+    mlflavors.statsforecast.save_model(
+        statsforecast_model=multi_series_fitted_model,
+        path=model_path,
+        shard_size=shard_size,
+    )
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    history = multi_series_fitted_model.ds.to_frame(index=False)
+    history["y"] = multi_series_fitted_model.ga.data[:, 0]
+    history = history[history["unique_id"].isin([5, 2])]
+    # The new history of series 5 ends ten days before its training history.
+    history = history.drop(history[history["unique_id"] == 5].index[-10:])
+    rows = history.astype({"ds": str}).values.tolist()
+
+    with mock.patch.object(AutoETS, "fit") as fit:
+        pyfunc_predict = loaded_pyfunc.predict(
+            pd.DataFrame([{"h": HORIZON, "y": rows, "level": LEVEL}])
+        )
+    fit.assert_not_called()
+
+    model_predictions = multi_series_fitted_model.predict(h=HORIZON, level=LEVEL)
+    assert list(pyfunc_predict.columns) == list(model_predictions.columns)
+    assert_frame_equal(
+        pyfunc_predict.loc[[2]], model_predictions.loc[[2]], check_index_type=False
+    )
+    last_date = history[history["unique_id"] == 5]["ds"].iloc[-1]
+    np.testing.assert_array_equal(
+        pyfunc_predict.loc[5, "ds"],
+        pd.date_range(last_date, periods=HORIZON + 1, freq="D")[1:],
+    )
+    np.testing.assert_allclose(
+        pyfunc_predict.loc[5, "Naive"], history["y"].iloc[-1], rtol=1e-6
+    )
+    if shard_size is not None:
+        assert sorted(loaded_pyfunc._model_impl.statsforecast_model._shards) == [0, 1]
+
+    with pytest.raises(MlflowException, match="cannot be provided together"):
+        loaded_pyfunc.predict(
+            pd.DataFrame([{"h": HORIZON, "y": rows, "unique_ids": [2]}])
+        )
+
+
+def test_forward_raises_for_refitting_model(model_path):
+    """Test models without ``forward`` that estimate parameters are rejected."""
+    df = generate_series(n_series=2, freq="D", min_length=30, max_length=40, seed=3)
+    sf = StatsForecast(
+        df=df, models=[Naive(), SimpleExponentialSmoothingOptimized()], freq="D"
+    ).fit()
+    mlflavors.statsforecast.save_model(statsforecast_model=sf, path=model_path)
+    loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
+    rows = df.reset_index().astype({"ds": str}).values.tolist()
+
+    with pytest.raises(MlflowException, match="would be refitted on the new history"):
+        loaded_pyfunc.predict(pd.DataFrame([{"h": HORIZON, "y": rows}]))
+
+
+def test_statsforecast_save_model_raises_invalid_forecast_table(
+    multi_series_fitted_model, arima_ets_model, synthetic_exogenous_model, model_path
+):
+    """Test save_model call raises error with invalid forecast table arguments."""
+    with pytest.raises(MlflowException, match="requires `forecast_table_horizon`"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=multi_series_fitted_model,
+            path=model_path,
+            forecast_table_level=LEVEL,
+        )
+
+    with pytest.raises(MlflowException, match="must be a positive integer"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=multi_series_fitted_model,
+            path=model_path,
+            forecast_table_horizon=0,
+        )
+
+    with pytest.raises(MlflowException, match="fitted StatsForecast model"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=arima_ets_model,
+            path=model_path,
+            forecast_table_horizon=HORIZON,
+        )
+
+    with pytest.raises(MlflowException, match="without exogenous regressor"):
+        mlflavors.statsforecast.save_model(
+            statsforecast_model=synthetic_exogenous_model,
+            path=model_path,
+            forecast_table_horizon=3,
+        )
+    assert not model_path.exists()
+
+
 @pytest.mark.parametrize("use_signature", [True, False])
 def test_signature_and_examples_saved_correctly(
     arima_ets_fitted_model,
@@ -385,7 +965,7 @@ def test_statsforecast_pyfunc_raises_invalid_df_input(
     )
     loaded_pyfunc = mlflavors.statsforecast.pyfunc.load_model(model_uri=model_path)
 
-    with pytest.raises(MlflowException, match="The provided prediction pd.DataFrame "):
+    with pytest.raises(MlflowException, match="The provided prediction configuration "):
         loaded_pyfunc.predict(pd.DataFrame([{"h": 1}, {"level": LEVEL}]))
 
     with pytest.raises(MlflowException, match="The provided prediction configuration "):
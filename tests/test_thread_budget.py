@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mlflow.exceptions import MlflowException
+from pyod.models.knn import KNN
+from threadpoolctl import threadpool_info
+
+import mlflavors.pyod
+from mlflavors.utils import thread_budget
+
+
+@pytest.fixture
+def budget():
+    """Remove the thread budget after the test."""
+    yield thread_budget
+    thread_budget.disable()
+
+
+def pool_threads():
+    """Return the number of threads of each BLAS and OpenMP thread pool."""
+    return [pool["num_threads"] for pool in threadpool_info()]
+
+
+def test_thread_budget_is_disabled_by_default(budget):
+    """Test no budget is set and limit_threads leaves the thread pools unchanged."""
+    assert not budget.is_enabled()
+    threads = pool_threads()
+    with budget.limit_threads():
+        assert pool_threads() == threads
+
+
+def test_thread_budget_from_environment(budget, monkeypatch):
+    """Test the budget is read from the environment and set by enable."""
+    monkeypatch.setenv(budget.ENV_THREAD_BUDGET, "3")
+    assert budget.get_thread_budget() == 3
+    budget.enable(2)
+    assert budget.get_thread_budget() == 2
+    budget.disable()
+    assert budget.get_thread_budget() == 3
+
+
+@pytest.mark.parametrize("max_threads", [0, -1, 1.5, None, True])
+def test_enable_raises_invalid_max_threads(budget, max_threads):
+    """Test enable raises error for an invalid budget."""
+    with pytest.raises(MlflowException, match="must be a positive integer"):
+        budget.enable(max_threads)
+
+
+def test_pyfunc_predict_applies_thread_budget(budget, tmp_path):
+    """Test pyfunc predictions limit the thread pools until the budget is removed."""
+    X = np.random.default_rng(0).standard_normal((200, 4))
+    mlflavors.pyod.save_model(KNN().fit(X), tmp_path.joinpath("model"))
+    loaded_pyfunc = mlflavors.pyod.pyfunc.load_model(tmp_path.joinpath("model"))
+    threads = pool_threads()
+    max_threads = max(threads) + 1
+
+    budget.enable(max_threads)
+    loaded_pyfunc.predict(
+        pd.DataFrame([{"predict_method": "decision_function", "X": X[:5]}])
+    )
+    assert set(pool_threads()) == {max_threads}
+
+    budget.disable()
+    assert pool_threads() == threads